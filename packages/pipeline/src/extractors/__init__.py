@@ -29,6 +29,7 @@ from src.extractors.base import (
     # Enums
     ExtractionType,
     ExtractionLevel,
+    ExtractionErrorKind,
     # Base models
     ExtractionBase,
     ExtractionResult,
@@ -57,6 +58,8 @@ from src.extractors.base import (
     extractor_registry,
 )
 from src.extractors.llm_client import LLMClient, LLMClientError
+from src.extractors.fleet import BatchPolicy, FleetDispatcher
+from src.extractors.rate_limiter import RateLimiter
 from src.extractors.utils import generate_extraction_summary
 from src.extractors.extraction_levels import (
     ExtractionLevelConfig,
@@ -90,6 +93,7 @@ __all__ = [
     # Enums
     "ExtractionType",
     "ExtractionLevel",
+    "ExtractionErrorKind",
     # Base models
     "ExtractionBase",
     "ExtractionResult",
@@ -119,6 +123,11 @@ __all__ = [
     # LLM Client
     "LLMClient",
     "LLMClientError",
+    # Fleet Dispatcher
+    "BatchPolicy",
+    "FleetDispatcher",
+    # Rate Limiting
+    "RateLimiter",
     # Utilities
     "generate_extraction_summary",
     # Extraction Levels
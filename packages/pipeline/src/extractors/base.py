@@ -6,7 +6,6 @@ supporting data models, exceptions, and the extractor registry pattern.
 Follows NFR6: Extensibility for Extractors pattern from architecture.
 """
 
-import json
 import re
 from abc import ABC, abstractmethod
 from datetime import UTC, datetime
@@ -17,8 +16,9 @@ from typing import TYPE_CHECKING, Optional, Type
 if TYPE_CHECKING:
     from src.storage.extraction_storage import ExtractionStorage
 
+import orjson
 import structlog
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from src.exceptions import KnowledgeError
 
@@ -63,6 +63,20 @@ class ExtractionLevel(str, Enum):
     CHUNK = "chunk"
 
 
+class ExtractionErrorKind(str, Enum):
+    """Categories of failed extraction attempts.
+
+    Attributes:
+        PARSE_ERROR: LLM response could not be parsed as JSON.
+        VALIDATION_ERROR: Parsed data failed model validation.
+        LLM_ERROR: LLM call (or the request around it) failed.
+    """
+
+    PARSE_ERROR = "parse_error"
+    VALIDATION_ERROR = "validation_error"
+    LLM_ERROR = "llm_error"
+
+
 # ============================================================================
 # Base Models
 # ============================================================================
@@ -97,6 +111,9 @@ class ExtractionBase(BaseModel):
         chunk_ids: All chunk IDs that were combined for this extraction.
     """
 
+    # Instances passed as field values are reused as-is, not re-validated
+    model_config = ConfigDict(revalidate_instances="never")
+
     id: str = ""  # Set by storage layer
     source_id: str
     chunk_id: str  # Kept for backward compatibility with 1.0.0
@@ -128,12 +145,14 @@ class ExtractionResult(BaseModel):
         success: Whether extraction succeeded.
         extraction: The extracted data if successful.
         error: Error message if failed.
+        error_kind: Failure category, or None if unclassified or successful.
         raw_response: Raw LLM response for debugging.
     """
 
     success: bool
     extraction: Optional[ExtractionBase] = None
     error: Optional[str] = None
+    error_kind: Optional[ExtractionErrorKind] = None
     raw_response: Optional[str] = None
 
 
@@ -236,6 +255,8 @@ class MethodologyStep(BaseModel):
         tips: Optional tips.
     """
 
+    model_config = ConfigDict(revalidate_instances="never")
+
     order: int
     title: str
     description: str
@@ -270,6 +291,8 @@ class ChecklistItem(BaseModel):
         required: Whether mandatory.
     """
 
+    model_config = ConfigDict(revalidate_instances="never")
+
     item: str
     required: bool = True
 
@@ -321,6 +344,8 @@ class WorkflowStep(BaseModel):
         outputs: Step outputs.
     """
 
+    model_config = ConfigDict(revalidate_instances="never")
+
     order: int
     action: str
     outputs: list[str] = Field(default_factory=list)
@@ -401,6 +426,46 @@ class UnsupportedExtractionTypeError(ExtractorError):
         )
 
 
+# ============================================================================
+# Topic Keywords
+# ============================================================================
+
+# Common AI/ML topics to look for
+_TOPIC_KEYWORDS: dict[str, list[str]] = {
+    "rag": ["rag", "retrieval", "augmented generation"],
+    "fine-tuning": ["fine-tune", "fine-tuning", "finetune"],
+    "embeddings": ["embedding", "embeddings", "vector"],
+    "llm": ["llm", "large language model", "gpt", "claude"],
+    "prompting": ["prompt", "prompting", "prompt engineering"],
+    "evaluation": ["eval", "evaluation", "metrics", "benchmark"],
+    "deployment": ["deploy", "deployment", "production", "serving"],
+    "training": ["train", "training", "training data"],
+    "inference": ["inference", "latency", "throughput"],
+    "agents": ["agent", "agents", "autonomous"],
+}
+
+_TOPIC_BY_KEYWORD = {
+    keyword: topic for topic, keywords in _TOPIC_KEYWORDS.items() for keyword in keywords
+}
+
+# One alternation over every keyword, scanned in a single pass. The lookahead
+# makes matches zero-width so overlapping keywords (e.g. "eval" inside
+# "retrieval") are still found, keeping plain substring semantics.
+_TOPIC_PATTERN = re.compile(
+    "(?=("
+    + "|".join(map(re.escape, sorted(_TOPIC_BY_KEYWORD, key=len, reverse=True)))
+    + "))"
+)
+
+
+# ============================================================================
+# Response Parsing
+# ============================================================================
+
+# JSON wrapped in a markdown code block, for LLM responses that add prose
+_JSON_CODE_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*([\s\S]*?)```")
+
+
 # ============================================================================
 # Base Extractor ABC
 # ============================================================================
@@ -572,22 +637,22 @@ class BaseExtractor(ABC):
         # Try to extract JSON from response
         try:
             # First try direct JSON parse
-            data = json.loads(response)
+            data = orjson.loads(response)
             if isinstance(data, list):
                 return data
             return [data]
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
         # Try to find JSON in markdown code block
-        json_match = re.search(r"```(?:json)?\s*([\s\S]*?)```", response)
+        json_match = _JSON_CODE_BLOCK_PATTERN.search(response)
         if json_match:
             try:
-                data = json.loads(json_match.group(1))
+                data = orjson.loads(json_match.group(1))
                 if isinstance(data, list):
                     return data
                 return [data]
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
 
         raise ExtractionParseError(
@@ -644,7 +709,30 @@ class BaseExtractor(ABC):
 
             return ExtractionResult(success=True, extraction=extraction)
         except Exception as e:
-            return ExtractionResult(success=False, error=str(e))
+            return ExtractionResult(
+                success=False,
+                error=str(e),
+                error_kind=ExtractionErrorKind.VALIDATION_ERROR,
+            )
+
+    @staticmethod
+    def _classify_error(error: Exception) -> ExtractionErrorKind:
+        """Map an exception raised during extraction to its error kind.
+
+        Parse and validation failures keep their own kinds; anything else
+        raised while calling the LLM (including LLMClientError) is LLM_ERROR.
+
+        Args:
+            error: Exception caught by an extractor.
+
+        Returns:
+            ExtractionErrorKind for the failed result.
+        """
+        if isinstance(error, ExtractionParseError):
+            return ExtractionErrorKind.PARSE_ERROR
+        if isinstance(error, (ExtractionValidationError, ValidationError)):
+            return ExtractionErrorKind.VALIDATION_ERROR
+        return ExtractionErrorKind.LLM_ERROR
 
     def _generate_topics(self, content: str) -> list[str]:
         """Auto-generate topic tags from content.
@@ -657,30 +745,13 @@ class BaseExtractor(ABC):
         Returns:
             List of topic tags.
         """
-        # Common AI/ML topics to look for
-        topic_keywords = {
-            "rag": ["rag", "retrieval", "augmented generation"],
-            "fine-tuning": ["fine-tune", "fine-tuning", "finetune"],
-            "embeddings": ["embedding", "embeddings", "vector"],
-            "llm": ["llm", "large language model", "gpt", "claude"],
-            "prompting": ["prompt", "prompting", "prompt engineering"],
-            "evaluation": ["eval", "evaluation", "metrics", "benchmark"],
-            "deployment": ["deploy", "deployment", "production", "serving"],
-            "training": ["train", "training", "training data"],
-            "inference": ["inference", "latency", "throughput"],
-            "agents": ["agent", "agents", "autonomous"],
+        found = {
+            _TOPIC_BY_KEYWORD[match.group(1)]
+            for match in _TOPIC_PATTERN.finditer(content.lower())
         }
 
-        content_lower = content.lower()
-        topics = []
-
-        for topic, keywords in topic_keywords.items():
-            for keyword in keywords:
-                if keyword in content_lower:
-                    topics.append(topic)
-                    break
-
-        return topics[:5]  # Limit to 5 topics
+        # Report in keyword-table order, as before
+        return [topic for topic in _TOPIC_KEYWORDS if topic in found][:5]  # Limit to 5 topics
 
     # ========================================================================
     # Storage Integration
@@ -12,6 +12,7 @@ from src.extractors.base import (
     BaseExtractor,
     Checklist,
     ExtractionBase,
+    ExtractionErrorKind,
     ExtractionLevel,
     ExtractionParseError,
     ExtractionResult,
@@ -161,6 +162,7 @@ class ChecklistExtractor(BaseExtractor):
                     ExtractionResult(
                         success=False,
                         error=f"Failed to parse LLM response: {e.message}",
+                        error_kind=ExtractionErrorKind.PARSE_ERROR,
                         raw_response=response,
                     )
                 ]
@@ -230,6 +232,7 @@ class ChecklistExtractor(BaseExtractor):
                 ExtractionResult(
                     success=False,
                     error=f"Extraction failed: {e!s}",
+                    error_kind=self._classify_error(e),
                 )
             ]
 
@@ -15,6 +15,7 @@ from src.extractors.base import (
     BaseExtractor,
     Decision,
     ExtractionBase,
+    ExtractionErrorKind,
     ExtractionLevel,
     ExtractionParseError,
     ExtractionResult,
@@ -162,6 +163,7 @@ class DecisionExtractor(BaseExtractor):
                     ExtractionResult(
                         success=False,
                         error=f"Failed to parse LLM response: {e.message}",
+                        error_kind=ExtractionErrorKind.PARSE_ERROR,
                         raw_response=response,
                     )
                 ]
@@ -233,6 +235,7 @@ class DecisionExtractor(BaseExtractor):
                 ExtractionResult(
                     success=False,
                     error=f"Extraction failed: {e!s}",
+                    error_kind=self._classify_error(e),
                 )
             ]
 
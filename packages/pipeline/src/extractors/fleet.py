@@ -0,0 +1,192 @@
+"""Fleet dispatcher that pools concurrent LLM requests into message batches.
+
+Extractors call LLMClient.extract() once per context. When many of those
+calls are in flight at once, the FleetDispatcher collects them and submits
+them together through the Message Batches API, resolving each caller's
+future from the batch results.
+
+A pending pool is flushed when either:
+- it reaches BatchPolicy.batch_min_size requests, or
+- the oldest request's latency budget (default BatchPolicy.batch_window_ms)
+  runs out.
+"""
+
+import asyncio
+import itertools
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+import anthropic
+import structlog
+
+from src.extractors.llm_client import BATCH_POLL_INTERVAL, LLMClientError, run_message_batch
+
+logger = structlog.get_logger()
+
+
+@dataclass(frozen=True)
+class BatchPolicy:
+    """When and how the dispatcher flushes pooled requests.
+
+    Attributes:
+        batch_min_size: Flush as soon as this many requests are pending.
+        batch_window_ms: Default time a request may wait for others to join.
+        max_batch_size: Upper bound on requests submitted in one batch.
+        poll_interval: Seconds between batch status checks.
+    """
+
+    batch_min_size: int = 50
+    batch_window_ms: int = 2000
+    max_batch_size: int = 10_000
+    poll_interval: float = BATCH_POLL_INTERVAL
+
+
+@dataclass
+class _PendingRequest:
+    """A submitted request waiting to be flushed."""
+
+    custom_id: str
+    params: dict[str, Any]
+    future: "asyncio.Future[str]"
+    deadline: float
+
+
+class FleetDispatcher:
+    """Pools concurrent message requests into Message Batches API submissions.
+
+    Example:
+        dispatcher = FleetDispatcher(anthropic.AsyncAnthropic(), BatchPolicy(batch_min_size=20))
+        client = LLMClient(dispatcher=dispatcher)
+        responses = await asyncio.gather(*(client.extract(prompt, c) for c in contents))
+        await dispatcher.close()
+    """
+
+    def __init__(
+        self,
+        client: anthropic.AsyncAnthropic,
+        policy: BatchPolicy | None = None,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            client: Anthropic async client used to submit batches.
+            policy: Flush policy. Uses BatchPolicy defaults if not provided.
+        """
+        self._client = client
+        self.policy = policy or BatchPolicy()
+        self._pending: deque[_PendingRequest] = deque()
+        self._ids = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._runner: asyncio.Task[None] | None = None
+        self._flushes: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of requests waiting to be flushed."""
+        return len(self._pending)
+
+    def submit(
+        self,
+        latency_budget_ms: int | None = None,
+        **params: Any,
+    ) -> "asyncio.Future[str]":
+        """Queue a message request for the next batch.
+
+        Args:
+            latency_budget_ms: Longest this request may wait for others to
+                join its batch. Defaults to policy.batch_window_ms.
+            **params: messages.create parameters (model, max_tokens, messages).
+
+        Returns:
+            Future resolving to the response text, or failing with
+            LLMClientError if the request does not succeed.
+        """
+        loop = asyncio.get_running_loop()
+        budget_ms = self.policy.batch_window_ms if latency_budget_ms is None else latency_budget_ms
+
+        future: asyncio.Future[str] = loop.create_future()
+        self._pending.append(
+            _PendingRequest(
+                custom_id=f"request-{next(self._ids)}",
+                params=params,
+                future=future,
+                deadline=loop.time() + budget_ms / 1000,
+            )
+        )
+
+        if self._runner is None or self._runner.done():
+            self._runner = loop.create_task(self._run())
+        self._wakeup.set()
+
+        return future
+
+    async def close(self) -> None:
+        """Flush any pending requests and wait for in-flight batches."""
+        if self._runner is not None:
+            self._runner.cancel()
+            await asyncio.gather(self._runner, return_exceptions=True)
+            self._runner = None
+        while self._pending:
+            self._start_flush()
+        await asyncio.gather(*self._flushes, return_exceptions=True)
+        logger.debug("fleet_dispatcher_closed")
+
+    async def _run(self) -> None:
+        """Flush the pending pool whenever the policy says it is due."""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            if not self._pending:
+                await self._wakeup.wait()
+                continue
+
+            timeout = min(p.deadline for p in self._pending) - loop.time()
+            if len(self._pending) < self.policy.batch_min_size and timeout > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except TimeoutError:
+                    pass
+                continue
+
+            self._start_flush()
+
+    def _start_flush(self) -> None:
+        """Take up to max_batch_size pending requests and submit them."""
+        count = min(len(self._pending), self.policy.max_batch_size)
+        requests = [self._pending.popleft() for _ in range(count)]
+        task = asyncio.get_running_loop().create_task(self._flush(requests))
+        # Keep a reference until done so the task is not garbage collected
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, requests: list[_PendingRequest]) -> None:
+        """Submit one batch and resolve its callers' futures."""
+        logger.debug("fleet_dispatcher_flush", request_count=len(requests))
+        try:
+            batch_id, texts, result_types = await run_message_batch(
+                self._client,
+                [{"custom_id": r.custom_id, "params": r.params} for r in requests],
+                self.policy.poll_interval,
+            )
+        except Exception as e:
+            for r in requests:
+                if not r.future.done():
+                    r.future.set_exception(e)
+            return
+
+        for r in requests:
+            if r.future.done():
+                # Caller gave up (e.g. cancelled) while the batch ran
+                continue
+            if r.custom_id in texts:
+                r.future.set_result(texts[r.custom_id])
+            else:
+                result_type = result_types.get(r.custom_id, "missing")
+                r.future.set_exception(
+                    LLMClientError(
+                        code="BATCH_ERROR",
+                        message=f"Batch request {r.custom_id} did not succeed: {result_type}",
+                        details={"batch_id": batch_id, "result_type": result_type},
+                    )
+                )
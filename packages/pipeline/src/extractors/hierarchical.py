@@ -15,8 +15,10 @@ Architecture:
 - CHUNK level (512 tokens): warning extractor
 """
 
+import asyncio
+from collections.abc import Coroutine, Iterable
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional, TypeVar
 
 import structlog
 
@@ -44,6 +46,67 @@ from src.models.chunk import Chunk
 
 logger = structlog.get_logger()
 
+# Default cap on contexts (chapters/sections/chunks) extracted at once
+DEFAULT_EXTRACTION_CONCURRENCY = 5
+
+T = TypeVar("T")
+
+
+async def _run_all(coros: Iterable[Coroutine[Any, Any, T]]) -> list[T]:
+    """Run coroutines concurrently in a TaskGroup and return their results.
+
+    If any coroutine raises, the TaskGroup cancels and awaits the others, so
+    no sibling keeps calling the LLM after the caller has failed. The first
+    underlying exception is re-raised unwrapped (not as an ExceptionGroup),
+    which also keeps nested calls from stacking groups.
+
+    Args:
+        coros: Coroutines to run.
+
+    Returns:
+        Coroutine results, in the order the coroutines were given.
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(coro) for coro in coros]
+    except ExceptionGroup as eg:
+        error: BaseException = eg
+        while isinstance(error, BaseExceptionGroup):
+            error = error.exceptions[0]
+        raise error from None
+    return [task.result() for task in tasks]
+
+
+async def _gather_bounded(
+    semaphore: asyncio.Semaphore,
+    coros: Iterable[Coroutine[Any, Any, list[ExtractionResult]]],
+) -> list[ExtractionResult]:
+    """Await per-context extractions concurrently under a shared semaphore.
+
+    A failing context cancels the contexts still running or waiting for
+    the semaphore.
+
+    Args:
+        semaphore: Semaphore bounding how many contexts run at once.
+        coros: Per-context extraction coroutines.
+
+    Returns:
+        Flattened extraction results, in the order the coroutines were given.
+    """
+
+    async def _run(
+        coro: Coroutine[Any, Any, list[ExtractionResult]],
+    ) -> list[ExtractionResult]:
+        try:
+            async with semaphore:
+                return await coro
+        finally:
+            # No-op once awaited; closes contexts cancelled while queued
+            coro.close()
+
+    batches = await _run_all(_run(coro) for coro in coros)
+    return [r for batch in batches for r in batch]
+
 
 @dataclass
 class LevelExtractionStats:
@@ -125,11 +188,13 @@ class HierarchicalExtractor:
     Attributes:
         extraction_types: Optional list of extraction types to run.
             If None, runs all extraction types across all levels.
+        concurrency: Maximum number of contexts extracted at once.
     """
 
     def __init__(
         self,
         extraction_types: Optional[list[ExtractionType]] = None,
+        concurrency: int = DEFAULT_EXTRACTION_CONCURRENCY,
     ):
         """Initialize the hierarchical extractor.
 
@@ -137,7 +202,16 @@ class HierarchicalExtractor:
             extraction_types: Optional list of extraction types to run.
                 If None, all registered extraction types are used.
                 If empty list, no extractions will run.
+            concurrency: Maximum number of contexts (chapters, sections or
+                chunks) extracted at once, shared across all levels.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
         """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+        self.concurrency = concurrency
+
         if extraction_types is not None:
             self.extraction_types = extraction_types
         else:
@@ -147,6 +221,7 @@ class HierarchicalExtractor:
         logger.debug(
             "hierarchical_extractor_initialized",
             extraction_types=[et.value for et in self.extraction_types],
+            concurrency=concurrency,
         )
 
     async def extract_document(
@@ -162,6 +237,10 @@ class HierarchicalExtractor:
         3. Extracts at section level (decision, pattern, checklist, persona)
         4. Extracts at chunk level (warning)
 
+        Steps 2-4 run concurrently, and contexts within each level are
+        extracted concurrently, with at most ``concurrency`` contexts in
+        flight at once. Results are still ordered chapter, section, chunk.
+
         Args:
             chunks: List of document chunks with position metadata.
             source_id: ID of the source document.
@@ -195,10 +274,17 @@ class HierarchicalExtractor:
         result.hierarchy_chapters = hierarchy.chapter_count
         result.hierarchy_sections = hierarchy.section_count
 
-        # Extract at each level
-        chapter_results = await self._extract_chapter_level(hierarchy, source_id)
-        section_results = await self._extract_section_level(hierarchy, source_id)
-        chunk_results = await self._extract_chunk_level(hierarchy, source_id)
+        # Extract at each level; levels are independent so run them concurrently,
+        # sharing one semaphore so the total number of in-flight contexts is bounded.
+        # A failing level cancels the other two.
+        semaphore = asyncio.Semaphore(self.concurrency)
+        chapter_results, section_results, chunk_results = await _run_all(
+            [
+                self._extract_chapter_level(hierarchy, source_id, semaphore),
+                self._extract_section_level(hierarchy, source_id, semaphore),
+                self._extract_chunk_level(hierarchy, source_id, semaphore),
+            ]
+        )
 
         # Combine results
         result.results.extend(chapter_results)
@@ -226,12 +312,14 @@ class HierarchicalExtractor:
         self,
         hierarchy: DocumentHierarchy,
         source_id: str,
+        semaphore: asyncio.Semaphore,
     ) -> list[ExtractionResult]:
         """Extract at chapter level (methodology, workflow).
 
         Args:
             hierarchy: Document hierarchy with chapters.
             source_id: Source document ID.
+            semaphore: Semaphore bounding concurrent context extractions.
 
         Returns:
             List of extraction results from chapter-level extraction.
@@ -254,40 +342,44 @@ class HierarchicalExtractor:
             return results
 
         # Process each chapter
-        for chapter in hierarchy.get_chapter_nodes():
-            chapter_results = await self._extract_from_chapter(
+        contexts = [
+            self._extract_from_chapter(
                 chapter=chapter,
                 source_id=source_id,
                 extraction_types=chapter_types,
                 max_tokens=config.max_tokens,
                 strategy=config.combination_strategy,
             )
-            results.extend(chapter_results)
+            for chapter in hierarchy.get_chapter_nodes()
+        ]
 
         # Also process uncategorized chunks as a pseudo-chapter if any
         if hierarchy.uncategorized_chunks:
-            uncategorized_results = await self._extract_from_uncategorized(
-                chunks=hierarchy.uncategorized_chunks,
-                source_id=source_id,
-                extraction_types=chapter_types,
-                level=ExtractionLevel.CHAPTER,
-                max_tokens=config.max_tokens,
-                strategy=config.combination_strategy,
+            contexts.append(
+                self._extract_from_uncategorized(
+                    chunks=hierarchy.uncategorized_chunks,
+                    source_id=source_id,
+                    extraction_types=chapter_types,
+                    level=ExtractionLevel.CHAPTER,
+                    max_tokens=config.max_tokens,
+                    strategy=config.combination_strategy,
+                )
             )
-            results.extend(uncategorized_results)
 
-        return results
+        return await _gather_bounded(semaphore, contexts)
 
     async def _extract_section_level(
         self,
         hierarchy: DocumentHierarchy,
         source_id: str,
+        semaphore: asyncio.Semaphore,
     ) -> list[ExtractionResult]:
         """Extract at section level (decision, pattern, checklist, persona).
 
         Args:
             hierarchy: Document hierarchy with sections.
             source_id: Source document ID.
+            semaphore: Semaphore bounding concurrent context extractions.
 
         Returns:
             List of extraction results from section-level extraction.
@@ -310,41 +402,45 @@ class HierarchicalExtractor:
             return results
 
         # Process each section
-        for section in hierarchy.get_section_nodes():
-            section_results = await self._extract_from_section(
+        contexts = [
+            self._extract_from_section(
                 section=section,
                 source_id=source_id,
                 extraction_types=section_types,
                 max_tokens=config.max_tokens,
                 strategy=config.combination_strategy,
             )
-            results.extend(section_results)
+            for section in hierarchy.get_section_nodes()
+        ]
 
         # Process uncategorized chunks in each chapter (have chapter but no section)
-        for chapter in hierarchy.get_chapter_nodes():
-            if chapter.uncategorized_chunks:
-                uncategorized_results = await self._extract_from_uncategorized(
-                    chunks=chapter.uncategorized_chunks,
-                    source_id=source_id,
-                    extraction_types=section_types,
-                    level=ExtractionLevel.SECTION,
-                    max_tokens=config.max_tokens,
-                    strategy=config.combination_strategy,
-                )
-                results.extend(uncategorized_results)
+        contexts.extend(
+            self._extract_from_uncategorized(
+                chunks=chapter.uncategorized_chunks,
+                source_id=source_id,
+                extraction_types=section_types,
+                level=ExtractionLevel.SECTION,
+                max_tokens=config.max_tokens,
+                strategy=config.combination_strategy,
+            )
+            for chapter in hierarchy.get_chapter_nodes()
+            if chapter.uncategorized_chunks
+        )
 
-        return results
+        return await _gather_bounded(semaphore, contexts)
 
     async def _extract_chunk_level(
         self,
         hierarchy: DocumentHierarchy,
         source_id: str,
+        semaphore: asyncio.Semaphore,
     ) -> list[ExtractionResult]:
         """Extract at chunk level (warning).
 
         Args:
             hierarchy: Document hierarchy with chunks.
             source_id: Source document ID.
+            semaphore: Semaphore bounding concurrent context extractions.
 
         Returns:
             List of extraction results from chunk-level extraction.
@@ -367,16 +463,17 @@ class HierarchicalExtractor:
             return results
 
         # Process each individual chunk
-        all_chunks = hierarchy.all_chunks
-        for chunk in all_chunks:
-            chunk_results = await self._extract_from_single_chunk(
-                chunk=chunk,
-                source_id=source_id,
-                extraction_types=chunk_types,
-            )
-            results.extend(chunk_results)
-
-        return results
+        return await _gather_bounded(
+            semaphore,
+            (
+                self._extract_from_single_chunk(
+                    chunk=chunk,
+                    source_id=source_id,
+                    extraction_types=chunk_types,
+                )
+                for chunk in hierarchy.all_chunks
+            ),
+        )
 
     async def _extract_from_chapter(
         self,
@@ -405,8 +502,8 @@ class HierarchicalExtractor:
         if not chapter.all_chunks:
             return results
 
-        # Combine chapter chunks
-        combined = combine_chunks(chapter.all_chunks, max_tokens, strategy)
+        # Combine chapter chunks (all_chunks is already index-sorted)
+        combined = combine_chunks(chapter.all_chunks, max_tokens, strategy, pre_sorted=True)
 
         if not combined.content:
             return results
@@ -462,8 +559,8 @@ class HierarchicalExtractor:
         if not section.chunks:
             return results
 
-        # Combine section chunks
-        combined = combine_chunks(section.chunks, max_tokens, strategy)
+        # Combine section chunks (sorted by build_hierarchy)
+        combined = combine_chunks(section.chunks, max_tokens, strategy, pre_sorted=True)
 
         if not combined.content:
             return results
@@ -565,8 +662,8 @@ class HierarchicalExtractor:
         if not chunks:
             return results
 
-        # Combine uncategorized chunks
-        combined = combine_chunks(chunks, max_tokens, strategy)
+        # Combine uncategorized chunks (sorted by build_hierarchy)
+        combined = combine_chunks(chunks, max_tokens, strategy, pre_sorted=True)
 
         if not combined.content:
             return results
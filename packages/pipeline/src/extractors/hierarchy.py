@@ -9,9 +9,16 @@ The hierarchy enables:
 - CHUNK level: Individual chunks (warning)
 """
 
+import bisect
+import functools
 import hashlib
+import itertools
+import operator
+import sys
+from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional
 
 import structlog
 
@@ -20,7 +27,12 @@ from src.models.chunk import Chunk
 logger = structlog.get_logger()
 
 
-@dataclass
+def _cache_field() -> Any:
+    """Private, lazily-populated cache slot excluded from init/repr/eq."""
+    return field(default=None, init=False, repr=False, compare=False)
+
+
+@dataclass(slots=True)
 class SectionNode:
     """A section within a chapter containing one or more chunks.
 
@@ -29,12 +41,17 @@ class SectionNode:
         section_name: Human-readable section name (from chunk.position.section).
         chapter_name: Parent chapter name for context.
         chunks: List of chunks belonging to this section, sorted by chunk_index.
+
+    Aggregates are computed on first access and cached, so chunks must not
+    be modified after the node has been queried.
     """
 
     section_id: str
     section_name: str
     chapter_name: str
     chunks: list[Chunk] = field(default_factory=list)
+    _total_tokens: Optional[int] = _cache_field()
+    _first_chunk_index: Optional[int] = _cache_field()
 
     @property
     def chunk_ids(self) -> list[str]:
@@ -44,10 +61,19 @@ class SectionNode:
     @property
     def total_tokens(self) -> int:
         """Sum of token counts for all chunks in this section."""
-        return sum(chunk.token_count for chunk in self.chunks)
+        if self._total_tokens is None:
+            self._total_tokens = sum(chunk.token_count for chunk in self.chunks)
+        return self._total_tokens
 
+    @property
+    def first_chunk_index(self) -> int:
+        """Smallest chunk index in this section (0 if empty), used for ordering."""
+        if self._first_chunk_index is None:
+            self._first_chunk_index = min(map(_get_chunk_index, self.chunks), default=0)
+        return self._first_chunk_index
 
-@dataclass
+
+@dataclass(slots=True)
 class ChapterNode:
     """A chapter containing one or more sections.
 
@@ -56,33 +82,72 @@ class ChapterNode:
         chapter_name: Human-readable chapter name (from chunk.position.chapter).
         sections: Dict mapping section_name to SectionNode.
         uncategorized_chunks: Chunks without section metadata (directly under chapter).
+
+    Aggregates are computed on first access and cached, so chunks must not
+    be modified after the node has been queried.
     """
 
     chapter_id: str
     chapter_name: str
     sections: dict[str, SectionNode] = field(default_factory=dict)
     uncategorized_chunks: list[Chunk] = field(default_factory=list)
+    _all_chunks: Optional[list[Chunk]] = _cache_field()
+    _chunk_count: Optional[int] = _cache_field()
+    _total_tokens: Optional[int] = _cache_field()
+    _first_chunk_index: Optional[int] = _cache_field()
+
+    def _iter_chunks(self) -> Iterator[Chunk]:
+        """Iterate over all chunks in this chapter, unordered."""
+        return itertools.chain(
+            self.uncategorized_chunks,
+            itertools.chain.from_iterable(s.chunks for s in self.sections.values()),
+        )
 
     @property
     def all_chunks(self) -> list[Chunk]:
         """Get all chunks in this chapter, including uncategorized."""
-        chunks = list(self.uncategorized_chunks)
-        for section in self.sections.values():
-            chunks.extend(section.chunks)
-        return sorted(chunks, key=lambda c: _get_chunk_index(c))
+        if self._all_chunks is None:
+            # Pre-size from chunk_count instead of growing a list from the
+            # chained iterator (which has no length hint), then sort in place
+            chunks: list[Chunk] = [None] * self.chunk_count  # type: ignore[list-item]
+            for i, chunk in enumerate(self._iter_chunks()):
+                chunks[i] = chunk
+            chunks.sort(key=_get_chunk_index)
+            self._all_chunks = chunks
+        return self._all_chunks
 
     @property
     def chunk_ids(self) -> list[str]:
         """Get all chunk IDs in this chapter."""
         return [chunk.id for chunk in self.all_chunks]
 
+    @property
+    def chunk_count(self) -> int:
+        """Number of chunks in this chapter."""
+        if self._chunk_count is None:
+            self._chunk_count = len(self.uncategorized_chunks) + sum(
+                len(s.chunks) for s in self.sections.values()
+            )
+        return self._chunk_count
+
     @property
     def total_tokens(self) -> int:
         """Sum of token counts for all chunks in this chapter."""
-        return sum(chunk.token_count for chunk in self.all_chunks)
+        if self._total_tokens is None:
+            self._total_tokens = sum(chunk.token_count for chunk in self._iter_chunks())
+        return self._total_tokens
 
+    @property
+    def first_chunk_index(self) -> int:
+        """Smallest chunk index in this chapter (0 if empty), used for ordering."""
+        if self._first_chunk_index is None:
+            self._first_chunk_index = min(
+                map(_get_chunk_index, self._iter_chunks()), default=0
+            )
+        return self._first_chunk_index
 
-@dataclass
+
+@dataclass(slots=True)
 class DocumentHierarchy:
     """Complete document hierarchy for a source.
 
@@ -90,19 +155,37 @@ class DocumentHierarchy:
         source_id: ID of the source document.
         chapters: Dict mapping chapter_name to ChapterNode.
         uncategorized_chunks: Chunks without chapter metadata.
+
+    chunk_count and the flat, ordered section list are cached on first
+    access (build_hierarchy fills the section list up front); the hierarchy
+    is treated as immutable once built.
     """
 
     source_id: str
     chapters: dict[str, ChapterNode] = field(default_factory=dict)
     uncategorized_chunks: list[Chunk] = field(default_factory=list)
+    _chunk_count: Optional[int] = _cache_field()
+    _all_sections: Optional[tuple[SectionNode, ...]] = _cache_field()
+
+    def _sections(self) -> tuple[SectionNode, ...]:
+        """Flat list of all sections, sorted by first chunk index."""
+        if self._all_sections is None:
+            sections = itertools.chain.from_iterable(
+                ch.sections.values() for ch in self.chapters.values()
+            )
+            self._all_sections = tuple(
+                sorted(sections, key=operator.attrgetter("first_chunk_index"))
+            )
+        return self._all_sections
 
     @property
     def all_chunks(self) -> list[Chunk]:
         """Get all chunks in the document."""
-        chunks = list(self.uncategorized_chunks)
-        for chapter in self.chapters.values():
-            chunks.extend(chapter.all_chunks)
-        return sorted(chunks, key=lambda c: _get_chunk_index(c))
+        chunks = itertools.chain(
+            self.uncategorized_chunks,
+            itertools.chain.from_iterable(ch._iter_chunks() for ch in self.chapters.values()),
+        )
+        return sorted(chunks, key=_get_chunk_index)
 
     @property
     def chapter_count(self) -> int:
@@ -112,30 +195,31 @@ class DocumentHierarchy:
     @property
     def section_count(self) -> int:
         """Total number of sections across all chapters."""
-        return sum(len(ch.sections) for ch in self.chapters.values())
+        return len(self._sections())
 
     @property
     def chunk_count(self) -> int:
         """Total number of chunks in the document."""
-        return len(self.all_chunks)
+        if self._chunk_count is None:
+            self._chunk_count = len(self.uncategorized_chunks) + sum(
+                ch.chunk_count for ch in self.chapters.values()
+            )
+        return self._chunk_count
 
     def get_chapter_nodes(self) -> list[ChapterNode]:
         """Get all chapter nodes, sorted by first chunk index."""
-        chapters = list(self.chapters.values())
         return sorted(
-            chapters,
-            key=lambda ch: _get_chunk_index(ch.all_chunks[0]) if ch.all_chunks else 0,
+            self.chapters.values(),
+            key=operator.attrgetter("first_chunk_index"),
         )
 
-    def get_section_nodes(self) -> list[SectionNode]:
-        """Get all section nodes across all chapters, sorted by first chunk index."""
-        sections = []
-        for chapter in self.chapters.values():
-            sections.extend(chapter.sections.values())
-        return sorted(
-            sections,
-            key=lambda s: _get_chunk_index(s.chunks[0]) if s.chunks else 0,
-        )
+    def get_section_nodes(self) -> tuple[SectionNode, ...]:
+        """Get all section nodes across all chapters, sorted by first chunk index.
+
+        Returns the cached sequence itself, so it is a tuple to keep callers
+        from mutating the cache.
+        """
+        return self._sections()
 
 
 def _get_chunk_index(chunk: Chunk) -> int:
@@ -149,10 +233,19 @@ def _get_chunk_index(chunk: Chunk) -> int:
     return int(chunk.id, 16) if chunk.id else 0
 
 
+# Pre-initialized BLAKE2b state; _generate_id copies it rather than
+# re-running digest setup for every ID
+_ID_HASHER = hashlib.blake2b(digest_size=12)
+
+
+@functools.lru_cache(maxsize=4096)
 def _generate_id(source_id: str, context_type: str, name: str) -> str:
     """Generate a stable unique ID for a chapter or section.
 
-    Uses SHA-256 hash of source_id + type + name for deterministic IDs.
+    Uses a 12-byte BLAKE2b digest of source_id + type + name for
+    deterministic IDs.
+    Results are memoized since the same chapter/section is looked up
+    repeatedly while building a hierarchy.
 
     Args:
         source_id: The source document ID.
@@ -162,10 +255,15 @@ def _generate_id(source_id: str, context_type: str, name: str) -> str:
     Returns:
         A 24-character hex string (compatible with MongoDB ObjectId format).
     """
-    content = f"{source_id}:{context_type}:{name}"
-    hash_digest = hashlib.sha256(content.encode()).hexdigest()
-    # Take first 24 chars to match MongoDB ObjectId format
-    return hash_digest[:24]
+    # Feeds "source_id:context_type:name" incrementally; the 12-byte digest
+    # is exactly 24 hex chars, matching MongoDB ObjectId format
+    hasher = _ID_HASHER.copy()
+    hasher.update(source_id.encode())
+    hasher.update(b":")
+    hasher.update(context_type.encode())
+    hasher.update(b":")
+    hasher.update(name.encode())
+    return hasher.hexdigest()
 
 
 def build_hierarchy(chunks: list[Chunk], source_id: str) -> DocumentHierarchy:
@@ -183,40 +281,44 @@ def build_hierarchy(chunks: list[Chunk], source_id: str) -> DocumentHierarchy:
     """
     hierarchy = DocumentHierarchy(source_id=source_id)
 
-    for chunk in chunks:
-        chapter_name = _get_chapter_name(chunk)
-        section_name = _get_section_name(chunk)
+    groups, group_tokens = _group_chunks(chunks)
+    all_sections: list[SectionNode] = []
+
+    # Second pass over the (few) distinct groups to materialize nodes.
+    # Dict order follows first appearance, so chapter/section order is kept.
+    for key, group in groups.items():
+        chapter_name, section_name = key
+        tokens = group_tokens[key]
 
         if not chapter_name:
             # No chapter metadata - add to uncategorized
-            hierarchy.uncategorized_chunks.append(chunk)
+            hierarchy.uncategorized_chunks.extend(group)
             continue
 
-        # Ensure chapter exists
-        if chapter_name not in hierarchy.chapters:
-            chapter_id = _generate_id(source_id, "chapter", chapter_name)
-            hierarchy.chapters[chapter_name] = ChapterNode(
-                chapter_id=chapter_id,
+        # Ensure chapter exists; the ID is only hashed on first sight
+        chapter = hierarchy.chapters.get(chapter_name)
+        if chapter is None:
+            chapter = ChapterNode(
+                chapter_id=_generate_id(source_id, "chapter", chapter_name),
                 chapter_name=chapter_name,
             )
-
-        chapter = hierarchy.chapters[chapter_name]
+            hierarchy.chapters[chapter_name] = chapter
+        chapter._total_tokens = (chapter._total_tokens or 0) + tokens
 
         if not section_name:
-            # Has chapter but no section - add to chapter's uncategorized
-            chapter.uncategorized_chunks.append(chunk)
+            # Has chapter but no section - chapter's uncategorized
+            chapter.uncategorized_chunks = group
             continue
 
-        # Ensure section exists within chapter
-        if section_name not in chapter.sections:
-            section_id = _generate_id(source_id, "section", f"{chapter_name}:{section_name}")
-            chapter.sections[section_name] = SectionNode(
-                section_id=section_id,
-                section_name=section_name,
-                chapter_name=chapter_name,
-            )
-
-        chapter.sections[section_name].chunks.append(chunk)
+        section = SectionNode(
+            section_id=_generate_id(source_id, "section", f"{chapter_name}:{section_name}"),
+            section_name=section_name,
+            chapter_name=chapter_name,
+            chunks=group,
+        )
+        section._total_tokens = tokens
+        chapter.sections[section_name] = section
+        all_sections.append(section)
 
     # Sort chunks within each container by chunk index
     hierarchy.uncategorized_chunks.sort(key=_get_chunk_index)
@@ -224,6 +326,8 @@ def build_hierarchy(chunks: list[Chunk], source_id: str) -> DocumentHierarchy:
         chapter.uncategorized_chunks.sort(key=_get_chunk_index)
         for section in chapter.sections.values():
             section.chunks.sort(key=_get_chunk_index)
+    all_sections.sort(key=operator.attrgetter("first_chunk_index"))
+    hierarchy._all_sections = tuple(all_sections)
 
     logger.info(
         "hierarchy_built",
@@ -237,6 +341,50 @@ def build_hierarchy(chunks: list[Chunk], source_id: str) -> DocumentHierarchy:
     return hierarchy
 
 
+_GroupKey = tuple[Optional[str], Optional[str]]
+
+
+def _group_chunks(
+    chunks: list[Chunk],
+) -> tuple[dict[_GroupKey, list[Chunk]], dict[_GroupKey, int]]:
+    """Bucket chunks by (chapter, section), totalling tokens per bucket.
+
+    Single-chapter documents, the common case, take a fast path that buckets
+    by section name only and skips the per-chunk chapter key.
+
+    Args:
+        chunks: List of Chunk objects from the document.
+
+    Returns:
+        Tuple of (chunks by key, token total by key), in first-appearance order.
+    """
+    if not chunks:
+        return {}, {}
+
+    chapter_name = _get_chapter_name(chunks[0])
+    if chapter_name and all(_get_chapter_name(c) == chapter_name for c in chunks):
+        by_section: defaultdict[Optional[str], list[Chunk]] = defaultdict(list)
+        section_tokens: defaultdict[Optional[str], int] = defaultdict(int)
+        for chunk in chunks:
+            section_name = _get_section_name(chunk)
+            by_section[section_name].append(chunk)
+            section_tokens[section_name] += chunk.token_count
+        return (
+            {(chapter_name, name): group for name, group in by_section.items()},
+            {(chapter_name, name): tokens for name, tokens in section_tokens.items()},
+        )
+
+    # General case: single pass without branching, accumulating each
+    # bucket's token total along the way
+    groups: defaultdict[_GroupKey, list[Chunk]] = defaultdict(list)
+    group_tokens: defaultdict[_GroupKey, int] = defaultdict(int)
+    for chunk in chunks:
+        key = (_get_chapter_name(chunk), _get_section_name(chunk))
+        groups[key].append(chunk)
+        group_tokens[key] += chunk.token_count
+    return groups, group_tokens
+
+
 def _get_chapter_name(chunk: Chunk) -> Optional[str]:
     """Extract chapter name from chunk position metadata.
 
@@ -244,10 +392,11 @@ def _get_chapter_name(chunk: Chunk) -> Optional[str]:
         chunk: The chunk to extract chapter from.
 
     Returns:
-        Chapter name string or None if not available.
+        Chapter name string (interned, so repeated dict lookups in
+        build_hierarchy compare by identity) or None if not available.
     """
     if chunk.position and chunk.position.chapter:
-        return chunk.position.chapter
+        return sys.intern(chunk.position.chapter)
     return None
 
 
@@ -258,10 +407,11 @@ def _get_section_name(chunk: Chunk) -> Optional[str]:
         chunk: The chunk to extract section from.
 
     Returns:
-        Section name string or None if not available.
+        Section name string (interned, so repeated dict lookups in
+        build_hierarchy compare by identity) or None if not available.
     """
     if chunk.position and chunk.position.section:
-        return chunk.position.section
+        return sys.intern(chunk.position.section)
     return None
 
 
@@ -270,7 +420,7 @@ def _get_section_name(chunk: Chunk) -> Optional[str]:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class CombinedContent:
     """Result of combining chunks for extraction.
 
@@ -291,6 +441,7 @@ def combine_chunks(
     chunks: list[Chunk],
     max_tokens: int,
     strategy: str = "truncate",
+    pre_sorted: bool = False,
 ) -> CombinedContent:
     """Combine multiple chunks into a single content string for extraction.
 
@@ -304,6 +455,8 @@ def combine_chunks(
             - "truncate": Cut off at token limit (default)
             - "summary_if_exceeded": Placeholder for future summarization
             - "none": Return as-is without limit (for single chunk level)
+        pre_sorted: If True, chunks are trusted to already be in index order
+            (as produced by build_hierarchy) and are not re-sorted.
 
     Returns:
         CombinedContent with combined text and metadata.
@@ -319,18 +472,15 @@ def combine_chunks(
         raise ValueError(f"Unknown combination strategy: '{strategy}'. Valid: {valid_strategies}")
 
     # Sort chunks by index for proper ordering
-    sorted_chunks = sorted(chunks, key=_get_chunk_index)
+    sorted_chunks = chunks if pre_sorted else sorted(chunks, key=_get_chunk_index)
 
-    # Combine all content with paragraph breaks
-    combined_text = "\n\n".join(chunk.content for chunk in sorted_chunks)
-    chunk_ids = [chunk.id for chunk in sorted_chunks]
     total_tokens = sum(chunk.token_count for chunk in sorted_chunks)
 
-    # Apply strategy if exceeding limit
+    # Apply strategy if exceeding limit; only join content that is kept
     if strategy == "none" or total_tokens <= max_tokens:
         return CombinedContent(
-            content=combined_text,
-            chunk_ids=chunk_ids,
+            content="\n\n".join(chunk.content for chunk in sorted_chunks),
+            chunk_ids=[chunk.id for chunk in sorted_chunks],
             total_tokens=total_tokens,
             truncated=False,
         )
@@ -351,8 +501,8 @@ def combine_chunks(
 
     # Should not reach here due to validation above
     return CombinedContent(
-        content=combined_text,
-        chunk_ids=chunk_ids,
+        content="\n\n".join(chunk.content for chunk in sorted_chunks),
+        chunk_ids=[chunk.id for chunk in sorted_chunks],
         total_tokens=total_tokens,
     )
 
@@ -369,18 +519,13 @@ def _truncate_to_limit(chunks: list[Chunk], max_tokens: int) -> CombinedContent:
     Returns:
         CombinedContent with truncated content.
     """
-    included_chunks: list[Chunk] = []
-    current_tokens = 0
-
-    for chunk in chunks:
-        if current_tokens + chunk.token_count > max_tokens:
-            # Adding this chunk would exceed limit
-            break
-        included_chunks.append(chunk)
-        current_tokens += chunk.token_count
+    # Token counts are non-negative, so running totals are sorted and the
+    # cutoff is the number of prefixes that fit within the budget
+    cumulative = list(itertools.accumulate(chunk.token_count for chunk in chunks))
+    cutoff = bisect.bisect_right(cumulative, max_tokens)
 
     # Edge case: if first chunk already exceeds limit, include it partially
-    if not included_chunks and chunks:
+    if cutoff == 0 and chunks:
         first_chunk = chunks[0]
         # Estimate character ratio for truncation
         # Rough estimate: 1 token ≈ 4 characters
@@ -393,12 +538,11 @@ def _truncate_to_limit(chunks: list[Chunk], max_tokens: int) -> CombinedContent:
             truncated=True,
         )
 
-    combined_text = "\n\n".join(chunk.content for chunk in included_chunks)
-    chunk_ids = [chunk.id for chunk in included_chunks]
+    included_chunks = chunks[:cutoff]
 
     return CombinedContent(
-        content=combined_text,
-        chunk_ids=chunk_ids,
-        total_tokens=current_tokens,
-        truncated=len(included_chunks) < len(chunks),
+        content="\n\n".join(chunk.content for chunk in included_chunks),
+        chunk_ids=[chunk.id for chunk in included_chunks],
+        total_tokens=cumulative[cutoff - 1] if cutoff else 0,
+        truncated=cutoff < len(chunks),
     )
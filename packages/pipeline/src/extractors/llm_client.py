@@ -4,19 +4,57 @@ Provides a client wrapper around the Anthropic API for batch
 extraction of structured knowledge from document chunks.
 """
 
+import asyncio
+import inspect
+import random
+from collections.abc import AsyncIterator, Callable
+from typing import TYPE_CHECKING, Any
+
 import anthropic
 import structlog
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
-)
 
 from src.config import settings
+from src.extractors.rate_limiter import RateLimiter
+
+if TYPE_CHECKING:
+    import httpx
+
+    from src.extractors.fleet import FleetDispatcher
 
 logger = structlog.get_logger()
 
+# Seconds between status checks while waiting for a message batch to end
+BATCH_POLL_INTERVAL = 10.0
+
+# Attempts per extract() call (initial call plus retries)
+DEFAULT_MAX_RETRIES = 8
+
+# Upper bound on a single retry backoff, in seconds
+MAX_RETRY_DELAY = 60.0
+
+# The SDK's own httpx Limits type, so pool settings match its transport
+_Limits = type(anthropic.DEFAULT_CONNECTION_LIMITS)
+
+# Divider between the extraction prompt and the chunk content
+_PROMPT_SEPARATOR = "\n\n---\n\nCONTENT TO EXTRACT FROM:\n"
+
+
+def _build_message(prompt: str, content: str) -> str:
+    """Combine an extraction prompt and chunk content into one user message."""
+    return "".join((prompt, _PROMPT_SEPARATOR, content))
+
+
+def _is_retryable(error: anthropic.APIError) -> bool:
+    """Whether an API error is transient: rate limit, connection or 5xx."""
+    if isinstance(error, (anthropic.APIConnectionError, anthropic.RateLimitError)):
+        return True
+    return isinstance(error, anthropic.APIStatusError) and error.status_code >= 500
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough input token estimate (~4 characters per token)."""
+    return len(text) // 4 + 1
+
 
 class LLMClientError(Exception):
     """Base exception for LLM client errors."""
@@ -28,11 +66,111 @@ class LLMClientError(Exception):
         super().__init__(message)
 
 
+async def run_message_batch(
+    client: anthropic.AsyncAnthropic,
+    requests: list[dict[str, Any]],
+    poll_interval: float = BATCH_POLL_INTERVAL,
+) -> tuple[str, dict[str, str], dict[str, str]]:
+    """Submit a message batch, wait for it to end, and collect its results.
+
+    Args:
+        client: Anthropic async client.
+        requests: Batch requests, each with a custom_id and message params.
+        poll_interval: Seconds to wait between batch status checks.
+
+    Returns:
+        Tuple of (batch ID, response text by custom_id for succeeded
+        requests, result type by custom_id for all other requests).
+
+    Raises:
+        LLMClientError: If the Batches API returns an error status.
+    """
+    try:
+        batch = await client.messages.batches.create(requests=requests)  # type: ignore[arg-type]
+
+        logger.info(
+            "llm_batch_submitted",
+            batch_id=batch.id,
+            request_count=len(requests),
+        )
+
+        while batch.processing_status != "ended":
+            await asyncio.sleep(poll_interval)
+            batch = await client.messages.batches.retrieve(batch.id)
+
+        texts: dict[str, str] = {}
+        result_types: dict[str, str] = {}
+        async for entry in await client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                texts[entry.custom_id] = entry.result.message.content[0].text  # type: ignore[union-attr]
+            else:
+                result_types[entry.custom_id] = entry.result.type
+
+    except anthropic.APIStatusError as e:
+        logger.error(
+            "llm_batch_api_error",
+            status_code=e.status_code,
+            error=str(e),
+        )
+        raise LLMClientError(
+            code="API_ERROR",
+            message=f"Anthropic API error: {e.status_code}",
+            details={"status_code": e.status_code, "error": str(e)},
+        ) from e
+
+    logger.info(
+        "llm_batch_complete",
+        batch_id=batch.id,
+        succeeded=len(texts),
+        failed=len(result_types),
+    )
+
+    return batch.id, texts, result_types
+
+
+def _build_http_client(
+    use_aiohttp: bool, pool_size: int | None
+) -> tuple["httpx.AsyncClient | None", str]:
+    """Build the HTTP client for AsyncAnthropic.
+
+    Args:
+        use_aiohttp: Prefer the aiohttp transport when its extra is installed.
+        pool_size: Maximum concurrent connections, or None for SDK defaults.
+
+    Returns:
+        Tuple of (HTTP client, or None for the SDK default, backend name).
+    """
+    pool_kwargs: dict[str, Any] = {}
+    if pool_size is not None:
+        pool_kwargs["limits"] = _Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=max(1, pool_size // 2),
+        )
+
+    http_client: httpx.AsyncClient | None = None
+    http_backend = "httpx"
+    if use_aiohttp:
+        try:
+            http_client = anthropic.DefaultAioHttpClient(**pool_kwargs)
+            http_backend = "aiohttp"
+        except RuntimeError as e:
+            # anthropic[aiohttp] extra not installed - fall back to httpx
+            logger.warning(
+                "llm_client_aiohttp_unavailable",
+                fallback="httpx",
+                hint="install anthropic[aiohttp] or pass use_aiohttp=False",
+                error=str(e),
+            )
+    if http_client is None and pool_kwargs:
+        http_client = anthropic.DefaultAsyncHttpxClient(**pool_kwargs)
+    return http_client, http_backend
+
+
 class LLMClient:
     """Client for LLM-based knowledge extraction.
 
     Uses Claude Haiku for cost-effective batch extraction.
-    Includes retry logic with exponential backoff for resilience.
+    Includes retry logic with jittered exponential backoff for resilience.
 
     Example:
         client = LLMClient()
@@ -47,6 +185,12 @@ class LLMClient:
         model: str | None = None,
         max_tokens: int | None = None,
         api_key: str | None = None,
+        dispatcher: "FleetDispatcher | None" = None,
+        rate_limiter: RateLimiter | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        use_aiohttp: bool = True,
+        pool_size: int | None = None,
+        client_factory: Callable[..., anthropic.AsyncAnthropic] | None = None,
     ):
         """Initialize the LLM client.
 
@@ -54,33 +198,71 @@ class LLMClient:
             model: LLM model to use. Defaults to settings.llm_model.
             max_tokens: Maximum tokens in response. Defaults to settings.llm_max_tokens.
             api_key: Anthropic API key. Defaults to settings.anthropic_api_key.
+            dispatcher: Optional FleetDispatcher. If set, extract() requests are
+                pooled with other concurrent calls into message batches.
+            rate_limiter: Optional RateLimiter. If set, each extract() attempt
+                waits on it before calling the API instead of relying on
+                429 retries.
+            max_retries: Maximum attempts per extract() call, including the
+                first, for rate limit, connection and 5xx errors.
+            use_aiohttp: Use the aiohttp transport, which has lower per-request
+                overhead for many small concurrent calls. Requires the
+                ``anthropic[aiohttp]`` extra (a project dependency); falls
+                back to httpx with a warning without it. Set False to always
+                use httpx.
+            pool_size: Maximum concurrent connections (half of them kept
+                alive) for the HTTP connection pool. Defaults to the SDK's
+                connection limits.
+            client_factory: Callable building the Anthropic client from
+                ``api_key`` and ``http_client`` keyword arguments. Defaults to
+                anthropic.AsyncAnthropic; tests can pass a stub factory to
+                skip building a real client. An injected factory gets
+                ``http_client=None``, and use_aiohttp and pool_size are unused.
+
+        Raises:
+            ValueError: If max_retries or pool_size is less than 1.
         """
+        if max_retries < 1:
+            raise ValueError(f"max_retries must be >= 1, got {max_retries}")
+        if pool_size is not None and pool_size < 1:
+            raise ValueError(f"pool_size must be >= 1, got {pool_size}")
+
         self._api_key = api_key or settings.anthropic_api_key
         self.model = model or settings.llm_model
         self.max_tokens = max_tokens or settings.llm_max_tokens
+        self._dispatcher = dispatcher
+        self._rate_limiter = rate_limiter
+        self.max_retries = max_retries
+
+        # Request parameters shared by every messages call
+        self._base_kwargs: dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+        }
 
-        # Create async client
-        self._client = anthropic.AsyncAnthropic(api_key=self._api_key)
+        if client_factory is None:
+            http_client, http_backend = _build_http_client(use_aiohttp, pool_size)
+            self._client = anthropic.AsyncAnthropic(api_key=self._api_key, http_client=http_client)
+        else:
+            # No HTTP client is built for an injected factory; it would open a
+            # connection pool that nothing uses or closes
+            http_backend = "factory"
+            self._client = client_factory(api_key=self._api_key, http_client=None)
 
         logger.debug(
             "llm_client_initialized",
             model=self.model,
             max_tokens=self.max_tokens,
+            http_backend=http_backend,
+            pool_size=pool_size,
         )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        retry=retry_if_exception_type(
-            (anthropic.APIConnectionError, anthropic.RateLimitError)
-        ),
-        reraise=True,
-    )
     async def extract(self, prompt: str, content: str) -> str:
         """Extract structured knowledge using LLM.
 
         Sends a prompt and content to the LLM and returns the raw response.
-        Includes retry logic for transient API errors.
+        Includes retry logic for transient API errors. With a dispatcher
+        configured, the request is pooled into a message batch instead.
 
         Args:
             prompt: Extraction prompt with instructions.
@@ -99,18 +281,18 @@ class LLMClient:
             content_length=len(content),
         )
 
-        try:
-            response = await self._client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": f"{prompt}\n\n---\n\nCONTENT TO EXTRACT FROM:\n{content}",
-                    }
-                ],
+        message = _build_message(prompt, content)
+
+        if self._dispatcher is not None:
+            # Pooled into a message batch; batch errors surface as LLMClientError
+            return await self._dispatcher.submit(
+                messages=[{"role": "user", "content": message}],
+                **self._base_kwargs,
             )
 
+        try:
+            response = await self._create_with_retry(message)
+
             result = response.content[0].text
 
             logger.info(
@@ -121,46 +303,230 @@ class LLMClient:
                 response_length=len(result),
             )
 
+            if self._rate_limiter is not None:
+                self._rate_limiter.record_success()
+
             return result
 
         except (anthropic.APIConnectionError, anthropic.RateLimitError):
-            # Let tenacity handle retryable errors - re-raise for retry
+            # Retries exhausted - surface the transient error as-is
             raise
 
-        except anthropic.AuthenticationError as e:
+        except anthropic.APIStatusError as e:
+            raise self._to_client_error(e) from e
+
+    async def extract_stream(self, prompt: str, content: str) -> AsyncIterator[str]:
+        """Stream the LLM response as text deltas.
+
+        Yields text as the model generates it, so callers can start
+        consuming the response before the full message arrives. Streamed
+        calls bypass the dispatcher and are not retried, since a partial
+        response may already have been consumed.
+
+        Args:
+            prompt: Extraction prompt with instructions.
+            content: Chunk content to extract from.
+
+        Yields:
+            Text deltas of the LLM response, in order.
+
+        Raises:
+            LLMClientError: If the API rejects the request.
+        """
+        logger.debug(
+            "llm_stream_start",
+            model=self.model,
+            prompt_length=len(prompt),
+            content_length=len(content),
+        )
+
+        message = _build_message(prompt, content)
+
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(_estimate_tokens(message))
+
+        try:
+            async with self._client.messages.stream(
+                messages=[{"role": "user", "content": message}],
+                **self._base_kwargs,
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+
+        except (anthropic.APIConnectionError, anthropic.RateLimitError):
+            raise
+
+        except anthropic.APIStatusError as e:
+            raise self._to_client_error(e) from e
+
+        logger.info("llm_stream_complete", model=self.model)
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.record_success()
+
+    def _to_client_error(self, e: anthropic.APIStatusError) -> LLMClientError:
+        """Log a non-transient API error and wrap it in an LLMClientError."""
+        if isinstance(e, anthropic.AuthenticationError):
             logger.error(
                 "llm_authentication_failed",
                 error=str(e),
             )
-            raise LLMClientError(
+            return LLMClientError(
                 code="AUTH_ERROR",
                 message="Anthropic API authentication failed",
                 details={"error": str(e)},
-            ) from e
+            )
 
-        except anthropic.BadRequestError as e:
+        if isinstance(e, anthropic.BadRequestError):
             logger.error(
                 "llm_bad_request",
                 error=str(e),
                 model=self.model,
             )
-            raise LLMClientError(
+            return LLMClientError(
                 code="BAD_REQUEST",
                 message="Invalid request to Anthropic API",
                 details={"error": str(e), "model": self.model},
-            ) from e
+            )
 
-        except anthropic.APIStatusError as e:
+        logger.error(
+            "llm_api_error",
+            status_code=e.status_code,
+            error=str(e),
+        )
+        return LLMClientError(
+            code="API_ERROR",
+            message=f"Anthropic API error: {e.status_code}",
+            details={"status_code": e.status_code, "error": str(e)},
+        )
+
+    async def _create(self, message: str) -> Any:
+        """Make one messages.create call.
+
+        With a rate limiter, the raw response is requested so the remaining
+        quota headers of every successful call reach the limiter, letting it
+        hold the next call before the API would answer with a 429.
+
+        Args:
+            message: Combined prompt and content for the user message.
+
+        Returns:
+            The parsed Anthropic API response.
+        """
+        messages = [{"role": "user", "content": message}]
+        if self._rate_limiter is None:
+            return await self._client.messages.create(messages=messages, **self._base_kwargs)
+
+        raw = await self._client.messages.with_raw_response.create(
+            messages=messages, **self._base_kwargs
+        )
+        self._rate_limiter.update_from_headers(raw.headers)
+        parsed = raw.parse()
+        # Legacy raw responses parse synchronously; newer SDKs return an awaitable
+        return await parsed if inspect.isawaitable(parsed) else parsed
+
+    async def _create_with_retry(self, message: str) -> Any:
+        """Call messages.create, retrying transient errors with jittered backoff.
+
+        Waits min(2**attempt + U(0, 1), MAX_RETRY_DELAY) seconds between
+        attempts; the jitter keeps concurrent callers from retrying in step.
+
+        Args:
+            message: Combined prompt and content for the user message.
+
+        Returns:
+            The parsed Anthropic API response.
+
+        Raises:
+            anthropic.APIError: The last transient error once max_retries
+                attempts are used, or any other API error immediately.
+        """
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire(_estimate_tokens(message))
+
+            try:
+                return await self._create(message)
+            except anthropic.APIError as e:
+                if isinstance(e, anthropic.RateLimitError) and self._rate_limiter is not None:
+                    # Hold the gate until the advertised reset
+                    self._rate_limiter.update_from_headers(e.response.headers)
+
+                if not _is_retryable(e) or attempt + 1 >= self.max_retries:
+                    raise
+
+                delay = min(2**attempt + random.random(), MAX_RETRY_DELAY)
+                attempt += 1
+                logger.warning(
+                    "llm_extraction_retry",
+                    model=self.model,
+                    attempt=attempt,
+                    max_retries=self.max_retries,
+                    delay=round(delay, 2),
+                    error_type=type(e).__name__,
+                )
+                await asyncio.sleep(delay)
+
+    async def extract_batch(
+        self,
+        requests: list[tuple[str, str]],
+        poll_interval: float = BATCH_POLL_INTERVAL,
+    ) -> list[str]:
+        """Extract from many prompt/content pairs via the Message Batches API.
+
+        Submits all requests as a single message batch (billed at the batch
+        discount), polls until processing ends, then collects the results.
+
+        Args:
+            requests: List of (prompt, content) pairs.
+            poll_interval: Seconds to wait between batch status checks.
+
+        Returns:
+            Raw LLM response text for each request, in input order.
+
+        Raises:
+            LLMClientError: If the batch cannot be submitted or any request
+                in it does not succeed.
+        """
+        if not requests:
+            return []
+
+        custom_ids = [f"request-{i}" for i in range(len(requests))]
+        batch_requests = [
+            {
+                "custom_id": custom_id,
+                "params": {
+                    "messages": [{"role": "user", "content": _build_message(prompt, content)}],
+                    **self._base_kwargs,
+                },
+            }
+            for custom_id, (prompt, content) in zip(custom_ids, requests)
+        ]
+
+        batch_id, texts, result_types = await run_message_batch(
+            self._client, batch_requests, poll_interval
+        )
+
+        # Anything not succeeded is errored/canceled/expired, or missing entirely
+        failed = {
+            custom_id: result_types.get(custom_id, "missing")
+            for custom_id in custom_ids
+            if custom_id not in texts
+        }
+        if failed:
             logger.error(
-                "llm_api_error",
-                status_code=e.status_code,
-                error=str(e),
+                "llm_batch_requests_failed",
+                batch_id=batch_id,
+                failed_count=len(failed),
             )
             raise LLMClientError(
-                code="API_ERROR",
-                message=f"Anthropic API error: {e.status_code}",
-                details={"status_code": e.status_code, "error": str(e)},
-            ) from e
+                code="BATCH_ERROR",
+                message=f"{len(failed)} of {len(requests)} batch requests did not succeed",
+                details={"batch_id": batch_id, "failed": failed},
+            )
+
+        return [texts[custom_id] for custom_id in custom_ids]
 
     async def close(self) -> None:
         """Close the async client connection."""
@@ -4,6 +4,7 @@ Extracts structured methodologies from document chunks for BMAD workflow creatio
 Used by builder to transform book content into executable workflows.
 """
 
+from functools import cached_property
 from typing import Optional, Type
 
 import structlog
@@ -11,6 +12,7 @@ import structlog
 from src.extractors.base import (
     BaseExtractor,
     ExtractionBase,
+    ExtractionErrorKind,
     ExtractionLevel,
     ExtractionParseError,
     ExtractionResult,
@@ -57,14 +59,20 @@ class MethodologyExtractor(BaseExtractor):
                 logger.debug("methodology_steps", step_count=len(methodology.steps))
     """
 
-    def __init__(self, config: ExtractorConfig | None = None):
+    def __init__(
+        self,
+        config: ExtractorConfig | None = None,
+        llm_client: LLMClient | None = None,
+    ):
         """Initialize the MethodologyExtractor.
 
         Args:
             config: Optional extractor configuration.
+            llm_client: Optional LLM client to use instead of a default
+                LLMClient (e.g. a shared client or a test double).
         """
         super().__init__(config)
-        self._llm_client = LLMClient()
+        self._llm_client = llm_client if llm_client is not None else LLMClient()
         logger.debug(
             "methodology_extractor_initialized",
             auto_tag_topics=self.config.auto_tag_topics,
@@ -80,16 +88,25 @@ class MethodologyExtractor(BaseExtractor):
         """Return the Methodology model class."""
         return Methodology
 
-    def get_prompt(self) -> str:
-        """Load and return the methodology extraction prompt.
+    @cached_property
+    def prompt(self) -> str:
+        """Combined methodology extraction prompt, loaded once per extractor.
 
         Combines base extraction instructions with methodology-specific
         instructions from prompts/methodology.md.
+        """
+        return self._load_full_prompt("methodology")
+
+    def get_prompt(self) -> str:
+        """Return the methodology extraction prompt.
+
+        The prompt files are read on first use and cached, so repeated
+        extract() calls skip the disk reads and string assembly.
 
         Returns:
             Combined prompt string for LLM extraction.
         """
-        return self._load_full_prompt("methodology")
+        return self.prompt
 
     def auto_tag_topics(self, methodology: Methodology) -> list[str]:
         """Auto-tag topics from methodology content.
@@ -164,6 +181,7 @@ class MethodologyExtractor(BaseExtractor):
                     ExtractionResult(
                         success=False,
                         error=f"Failed to parse LLM response: {e.message}",
+                        error_kind=ExtractionErrorKind.PARSE_ERROR,
                         raw_response=response,
                     )
                 ]
@@ -233,6 +251,7 @@ class MethodologyExtractor(BaseExtractor):
                 ExtractionResult(
                     success=False,
                     error=f"Extraction failed: {e!s}",
+                    error_kind=self._classify_error(e),
                 )
             ]
 
@@ -4,6 +4,7 @@ This module extracts implementation patterns from document chunks,
 capturing problem-solution pairs with code examples and trade-offs.
 """
 
+from functools import cached_property
 from typing import Optional, Type
 
 import structlog
@@ -11,6 +12,7 @@ import structlog
 from src.extractors.base import (
     BaseExtractor,
     ExtractionBase,
+    ExtractionErrorKind,
     ExtractionLevel,
     ExtractionResult,
     ExtractionType,
@@ -131,6 +133,7 @@ class PatternExtractor(BaseExtractor):
                 ExtractionResult(
                     success=False,
                     error=f"Extraction failed: {e!s}",
+                    error_kind=self._classify_error(e),
                     raw_response=None,
                 )
             ]
@@ -149,6 +152,7 @@ class PatternExtractor(BaseExtractor):
                 ExtractionResult(
                     success=False,
                     error=f"Failed to parse LLM response: {e}",
+                    error_kind=ExtractionErrorKind.PARSE_ERROR,
                     raw_response=raw_response,
                 )
             ]
@@ -213,8 +217,20 @@ class PatternExtractor(BaseExtractor):
 
         return results
 
+    @cached_property
+    def prompt(self) -> str:
+        """Combined pattern extraction prompt, loaded once per extractor.
+
+        Raises:
+            PromptLoadError: If prompt file cannot be loaded.
+        """
+        return self._load_full_prompt("pattern")
+
     def get_prompt(self) -> str:
-        """Load pattern extraction prompt from file.
+        """Return the pattern extraction prompt.
+
+        The prompt files are read on first use and cached, so repeated
+        extract() calls skip the disk reads and string assembly.
 
         Returns:
             Combined base + pattern-specific prompt for LLM extraction.
@@ -222,7 +238,7 @@ class PatternExtractor(BaseExtractor):
         Raises:
             PromptLoadError: If prompt file cannot be loaded.
         """
-        return self._load_full_prompt("pattern")
+        return self.prompt
 
     def auto_tag_topics(self, pattern: Pattern) -> list[str]:
         """Auto-tag topics from pattern content.
@@ -11,6 +11,7 @@ import structlog
 from src.extractors.base import (
     BaseExtractor,
     ExtractionBase,
+    ExtractionErrorKind,
     ExtractionLevel,
     ExtractionParseError,
     ExtractionResult,
@@ -162,6 +163,7 @@ class PersonaExtractor(BaseExtractor):
                     ExtractionResult(
                         success=False,
                         error=f"Failed to parse LLM response: {e.message}",
+                        error_kind=ExtractionErrorKind.PARSE_ERROR,
                         raw_response=response,
                     )
                 ]
@@ -231,6 +233,7 @@ class PersonaExtractor(BaseExtractor):
                 ExtractionResult(
                     success=False,
                     error=f"Extraction failed: {e!s}",
+                    error_kind=self._classify_error(e),
                 )
             ]
 
@@ -0,0 +1,159 @@
+"""Client-side rate-limit gate for Anthropic API calls.
+
+Rather than discovering a rate limit by receiving a 429 and retrying, the
+RateLimiter makes callers wait *before* dispatch when the sliding one-minute
+request or token budget is spent, or when the API has told us to back off.
+
+Limits follow AIMD (additive increase, multiplicative decrease): every
+throttle signal halves the effective requests-per-minute budget, and every
+successful call grows it back by one, up to the configured ceiling.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from time import monotonic
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Anthropic tier-1 defaults
+DEFAULT_REQUESTS_PER_MINUTE = 50
+DEFAULT_TOKENS_PER_MINUTE = 80_000
+
+# Length of the sliding window, in seconds
+RATE_WINDOW_SECONDS = 60.0
+
+# Response headers describing the remaining quota
+_REQUESTS_REMAINING = "anthropic-ratelimit-requests-remaining"
+_REQUESTS_RESET = "anthropic-ratelimit-requests-reset"
+_TOKENS_REMAINING = "anthropic-ratelimit-tokens-remaining"
+_TOKENS_RESET = "anthropic-ratelimit-tokens-reset"
+_RETRY_AFTER = "retry-after"
+
+
+def _parse_float(value: object) -> float | None:
+    """Parse a numeric header value, or None if absent or malformed."""
+    if not isinstance(value, (str, int, float)):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _seconds_until(value: object) -> float | None:
+    """Seconds from now until an RFC 3339 reset timestamp, or None."""
+    if not isinstance(value, str):
+        return None
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return (reset_at - datetime.now(UTC)).total_seconds()
+
+
+class RateLimiter:
+    """Sliding-window request/token gate with AIMD request budget.
+
+    Example:
+        limiter = RateLimiter(requests_per_minute=50, tokens_per_minute=80_000)
+        client = LLMClient(rate_limiter=limiter)
+
+    Attributes:
+        requests_per_minute: Configured request ceiling.
+        tokens_per_minute: Configured token ceiling.
+        current_requests_per_minute: Effective request budget after AIMD.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE,
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            requests_per_minute: Maximum requests per sliding minute.
+            tokens_per_minute: Maximum estimated tokens per sliding minute.
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.current_requests_per_minute = requests_per_minute
+        self._window: deque[tuple[float, int]] = deque()
+        self._window_tokens = 0
+        self._cooldown_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, est_tokens: int) -> None:
+        """Wait until a request of est_tokens fits within the current limits.
+
+        Args:
+            est_tokens: Estimated tokens the request will consume.
+        """
+        async with self._lock:
+            while True:
+                now = monotonic()
+                wait = self._cooldown_until - now
+                if wait <= 0:
+                    self._prune(now)
+                    fits_requests = len(self._window) < self.current_requests_per_minute
+                    # An oversized request is let through on an empty window
+                    fits_tokens = (
+                        not self._window
+                        or self._window_tokens + est_tokens <= self.tokens_per_minute
+                    )
+                    if fits_requests and fits_tokens:
+                        self._window.append((now, est_tokens))
+                        self._window_tokens += est_tokens
+                        return
+                    wait = self._window[0][0] + RATE_WINDOW_SECONDS - now
+
+                logger.debug("rate_limit_wait", seconds=round(wait, 3))
+                await asyncio.sleep(wait)
+
+    def record_success(self) -> None:
+        """Additively grow the request budget after a successful call."""
+        if self.current_requests_per_minute < self.requests_per_minute:
+            self.current_requests_per_minute += 1
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Apply rate-limit headers from an API response.
+
+        When the response reports no remaining requests or tokens (or asks
+        for a retry-after delay), further acquires are held until the reset
+        time and the request budget is halved.
+
+        Args:
+            headers: Response headers from the Anthropic API.
+        """
+        requests_left = _parse_float(headers.get(_REQUESTS_REMAINING))
+        tokens_left = _parse_float(headers.get(_TOKENS_REMAINING))
+        retry_after = _parse_float(headers.get(_RETRY_AFTER))
+
+        delays = [retry_after] if retry_after is not None else []
+        if requests_left == 0:
+            delays.append(_seconds_until(headers.get(_REQUESTS_RESET)) or 0.0)
+        if tokens_left == 0:
+            delays.append(_seconds_until(headers.get(_TOKENS_RESET)) or 0.0)
+
+        if not delays:
+            return
+
+        delay = max(max(delays), 0.0)
+        self._cooldown_until = max(self._cooldown_until, monotonic() + delay)
+        self.current_requests_per_minute = max(1, self.current_requests_per_minute // 2)
+
+        logger.warning(
+            "rate_limit_cooldown",
+            seconds=delay,
+            requests_per_minute=self.current_requests_per_minute,
+        )
+
+    def _prune(self, now: float) -> None:
+        """Drop window entries older than the sliding window."""
+        while self._window and now - self._window[0][0] >= RATE_WINDOW_SECONDS:
+            _, tokens = self._window.popleft()
+            self._window_tokens -= tokens
@@ -115,6 +115,7 @@ class WarningExtractor(BaseExtractor):
                     ExtractionResult(
                         success=False,
                         error=str(e),
+                        error_kind=self._classify_error(e),
                     )
                 )
 
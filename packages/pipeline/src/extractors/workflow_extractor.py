@@ -11,6 +11,7 @@ import structlog
 from src.extractors.base import (
     BaseExtractor,
     ExtractionBase,
+    ExtractionErrorKind,
     ExtractionLevel,
     ExtractionParseError,
     ExtractionResult,
@@ -164,6 +165,7 @@ class WorkflowExtractor(BaseExtractor):
                     ExtractionResult(
                         success=False,
                         error=f"Failed to parse LLM response: {e.message}",
+                        error_kind=ExtractionErrorKind.PARSE_ERROR,
                         raw_response=response,
                     )
                 ]
@@ -233,6 +235,7 @@ class WorkflowExtractor(BaseExtractor):
                 ExtractionResult(
                     success=False,
                     error=f"Extraction failed: {e!s}",
+                    error_kind=self._classify_error(e),
                 )
             ]
 
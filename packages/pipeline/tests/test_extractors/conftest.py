@@ -1,8 +1,13 @@
 """Test fixtures for extractor tests."""
 
+import asyncio
+from collections.abc import Iterable
 from typing import Optional, Type
+from unittest.mock import AsyncMock, MagicMock
 
+import orjson
 import pytest
+import pytest_asyncio
 
 from src.extractors import (
     BaseExtractor,
@@ -12,10 +17,91 @@ from src.extractors import (
     ExtractionType,
     ExtractorConfig,
     ExtractorRegistry,
+    LLMClient,
 )
 from src.extractors.base import ExtractionLevel
 
 
+# Canned PatternExtractor LLM responses, serialized once at import.
+_PATTERN_SEMANTIC_CACHING = {
+    "name": "Semantic Caching",
+    "problem": "High API costs from repeated similar queries to LLM endpoints",
+    "solution": (
+        "Cache responses using embedding similarity instead of exact match. "
+        "Compare query embeddings to find cached responses."
+    ),
+    "code_example": None,
+    "context": "High-traffic LLM applications",
+    "trade_offs": [
+        "Pro: 40-60% cost reduction",
+        "Con: Added latency for cache lookups",
+    ],
+    "confidence": 0.9,
+}
+
+_PATTERN_RETRY_WITH_BACKOFF = {
+    "name": "Retry with Backoff",
+    "problem": "API calls fail intermittently due to rate limits or network issues",
+    "solution": (
+        "Implement exponential backoff retry logic to handle transient failures gracefully"
+    ),
+    "code_example": (
+        "from tenacity import retry, stop_after_attempt, wait_exponential\n\n"
+        "@retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))\n"
+        "def call_api():\n"
+        "    return requests.get(url)"
+    ),
+    "context": "External API integrations with unreliable networks",
+    "trade_offs": [
+        "Pro: Handles transient failures automatically",
+        "Con: Increases overall request latency",
+    ],
+    "confidence": 0.95,
+}
+
+_PATTERN_RAG_CACHING = {
+    "name": "Semantic Caching",
+    "problem": "High LLM API costs in production applications",
+    "solution": (
+        "Cache responses using embedding similarity. Compare query embeddings "
+        "against cached entries to find semantically similar previous queries."
+    ),
+    "code_example": None,
+    "context": "RAG applications with high query volume",
+    "trade_offs": [
+        "Pro: 40-60% cost reduction",
+        "Con: Added latency for embedding computation",
+    ],
+    "confidence": 0.9,
+}
+
+_PATTERN_PAIR = [
+    {
+        "name": "Pattern One",
+        "problem": "Problem one",
+        "solution": "Solution one",
+        "code_example": None,
+        "context": "Context one",
+        "trade_offs": [],
+        "confidence": 0.8,
+    },
+    {
+        "name": "Pattern Two",
+        "problem": "Problem two",
+        "solution": "Solution two",
+        "code_example": "print('hello')",
+        "context": "Context two",
+        "trade_offs": ["Pro: Fast"],
+        "confidence": 0.85,
+    },
+]
+
+PATTERN_RESPONSE = orjson.dumps([_PATTERN_SEMANTIC_CACHING]).decode()
+PATTERN_RESPONSE_WITH_CODE = orjson.dumps([_PATTERN_RETRY_WITH_BACKOFF]).decode()
+PATTERN_RAG_RESPONSE = orjson.dumps([_PATTERN_RAG_CACHING]).decode()
+PATTERN_PAIR_RESPONSE = orjson.dumps(_PATTERN_PAIR).decode()
+
+
 class DummyExtractor(BaseExtractor):
     """Concrete extractor for testing purposes."""
 
@@ -41,6 +127,34 @@ class DummyExtractor(BaseExtractor):
         return "Test prompt"
 
 
+class StubLLMClient:
+    """Minimal LLMClient double that replays canned responses.
+
+    Avoids constructing a real Anthropic client for extractor tests.
+    Exception instances in ``responses`` are raised instead of returned.
+    """
+
+    def __init__(self, responses: Iterable[str | BaseException]):
+        self._responses = iter(responses)
+        self.calls: list[tuple[str, str]] = []
+
+    async def extract(self, prompt: str, content: str) -> str:
+        self.calls.append((prompt, content))
+        response = next(self._responses)
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "StubLLMClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+
 @pytest.fixture
 def dummy_extractor_class() -> Type[BaseExtractor]:
     """Provide the DummyExtractor class for testing."""
@@ -90,3 +204,65 @@ def sample_decision() -> Decision:
     )
 
 
+@pytest.fixture(scope="session")
+def pattern_response_with_code() -> str:
+    """Provide an LLM response holding one pattern with a code example."""
+    return PATTERN_RESPONSE_WITH_CODE
+
+
+@pytest.fixture(scope="session")
+def pattern_rag_response() -> str:
+    """Provide an LLM response holding one RAG caching pattern."""
+    return PATTERN_RAG_RESPONSE
+
+
+@pytest.fixture(scope="session")
+def pattern_pair_response() -> str:
+    """Provide an LLM response holding two patterns."""
+    return PATTERN_PAIR_RESPONSE
+
+
+@pytest.fixture(scope="session")
+def anthropic_response_factory():
+    """Provide a factory for mock Anthropic API responses."""
+
+    def _make(text: str = '{"decisions": []}') -> MagicMock:
+        response = MagicMock()
+        response.content = [MagicMock(text=text)]
+        response.usage = MagicMock(input_tokens=100, output_tokens=50)
+        return response
+
+    return _make
+
+
+@pytest.fixture
+def llm_client_injected() -> LLMClient:
+    """Provide an LLMClient whose Anthropic client is a bare mock.
+
+    The client factory seam skips constructing the real SDK client;
+    messages.create is an AsyncMock ready for a return value.
+    """
+    return LLMClient(
+        client_factory=lambda **_: MagicMock(messages=MagicMock(create=AsyncMock())),
+    )
+
+
+@pytest_asyncio.fixture
+async def aio_benchmark(benchmark):
+    """Provide a pytest-benchmark wrapper that also accepts coroutine functions.
+
+    Each round runs the coroutine to completion on the test's event loop,
+    so the benchmarking test itself must be a plain (non-async) function.
+    """
+    loop = asyncio.get_running_loop()
+
+    def _run(func, *args, **kwargs):
+        if asyncio.iscoroutinefunction(func):
+            return benchmark(
+                lambda: loop.run_until_complete(
+                    asyncio.ensure_future(func(*args, **kwargs), loop=loop)
+                )
+            )
+        return benchmark(func, *args, **kwargs)
+
+    return _run
@@ -1,18 +1,29 @@
 """Tests for BaseExtractor ABC and related functionality."""
 
 from typing import Optional
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from src.extractors import (
     BaseExtractor,
+    ChecklistExtractor,
     Decision,
+    DecisionExtractor,
+    ExtractionErrorKind,
     ExtractionParseError,
     ExtractionResult,
     ExtractionType,
+    ExtractionValidationError,
     ExtractorConfig,
+    LLMClientError,
+    MethodologyExtractor,
+    PatternExtractor,
+    PersonaExtractor,
     PromptLoadError,
     UnsupportedExtractionTypeError,
+    WarningExtractor,
+    WorkflowExtractor,
 )
 from src.extractors.base import ExtractionLevel
 
@@ -171,6 +182,24 @@ class TestExtractorUtilityMethods:
         )
         assert result.success is False
         assert result.error is not None
+        assert result.error_kind is ExtractionErrorKind.VALIDATION_ERROR
+
+    @pytest.mark.parametrize(
+        ("error", "kind"),
+        [
+            (ExtractionParseError("decision", "bad json"), ExtractionErrorKind.PARSE_ERROR),
+            (
+                ExtractionValidationError("decision", []),
+                ExtractionErrorKind.VALIDATION_ERROR,
+            ),
+            (LLMClientError("API_ERROR", "API error"), ExtractionErrorKind.LLM_ERROR),
+            (RuntimeError("network down"), ExtractionErrorKind.LLM_ERROR),
+        ],
+        ids=["parse", "validation", "llm_client", "other"],
+    )
+    def test_classify_error(self, dummy_extractor, error, kind):
+        """_classify_error maps caught exceptions to an error kind."""
+        assert dummy_extractor._classify_error(error) is kind
 
     def test_generate_topics_finds_rag(self, dummy_extractor):
         """_generate_topics identifies RAG topic."""
@@ -194,6 +223,12 @@ class TestExtractorUtilityMethods:
         topics = dummy_extractor._generate_topics(content)
         assert len(topics) <= 5
 
+    def test_generate_topics_matches_overlapping_substrings(self, dummy_extractor):
+        """_generate_topics keeps substring matching, including overlaps."""
+        # "eval" sits inside "retrieval"; topics come back in table order
+        topics = dummy_extractor._generate_topics("Agents rely on RETRIEVAL")
+        assert topics == ["rag", "evaluation", "agents"]
+
     def test_load_prompt_success(self, dummy_extractor):
         """_load_prompt loads existing prompt file."""
         prompt = dummy_extractor._load_prompt("decision")
@@ -316,6 +351,7 @@ class TestExtractionResult:
         assert result.success is True
         assert result.extraction is not None
         assert result.error is None
+        assert result.error_kind is None
 
     def test_failed_result(self):
         """ExtractionResult can hold failed extraction."""
@@ -332,3 +368,40 @@ class TestExtractionResult:
             raw_response='{"question": "test?"}',
         )
         assert result.raw_response is not None
+
+
+class TestExtractorErrorKind:
+    """Test error_kind on failed results from the concrete extractors."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "extractor_class",
+        [
+            ChecklistExtractor,
+            DecisionExtractor,
+            MethodologyExtractor,
+            PatternExtractor,
+            PersonaExtractor,
+            WarningExtractor,
+            WorkflowExtractor,
+        ],
+    )
+    async def test_llm_error_sets_error_kind(self, extractor_class):
+        """An LLM client failure is reported as LLM_ERROR."""
+        client = AsyncMock()
+        client.__aenter__.return_value = client
+        client.extract.side_effect = LLMClientError("API_ERROR", "API error")
+
+        with patch(f"{extractor_class.__module__}.LLMClient", return_value=client):
+            extractor = extractor_class()
+            results = await extractor.extract(
+                content="Some content",
+                source_id="source-456",
+                context_level=ExtractionLevel.CHUNK,
+                context_id="chunk-123",
+                chunk_ids=["chunk-123"],
+            )
+
+        assert len(results) == 1
+        assert results[0].success is False
+        assert results[0].error_kind is ExtractionErrorKind.LLM_ERROR
@@ -12,6 +12,22 @@ from src.extractors.extraction_levels import (
     get_max_tokens_for_level,
 )
 
+# Bind enum members once so tests use plain global lookups
+CHAPTER = ExtractionLevel.CHAPTER
+SECTION = ExtractionLevel.SECTION
+CHUNK = ExtractionLevel.CHUNK
+
+# Read-only extraction_types inputs (pydantic coerces them to list[str])
+_METHODOLOGY_WORKFLOW = ("methodology", "workflow")
+_METHODOLOGY = ("methodology",)
+_DECISION = ("decision",)
+_WARNING = ("warning",)
+
+_EXPECTED_SECTION_TYPES = frozenset({"decision", "pattern", "checklist", "persona"})
+_EXPECTED_ALL_TYPES = frozenset(
+    {"methodology", "workflow", "decision", "pattern", "checklist", "persona", "warning"}
+)
+
 
 class TestExtractionLevel:
     """Tests for ExtractionLevel enum."""
@@ -39,12 +55,12 @@ class TestExtractionLevelConfig:
     def test_valid_config_creation(self):
         """Should create valid config with all fields."""
         config = ExtractionLevelConfig(
-            level=ExtractionLevel.CHAPTER,
-            extraction_types=["methodology", "workflow"],
+            level=CHAPTER,
+            extraction_types=_METHODOLOGY_WORKFLOW,
             max_tokens=8000,
             combination_strategy="truncate",
         )
-        assert config.level == ExtractionLevel.CHAPTER
+        assert config.level == CHAPTER
         assert config.extraction_types == ["methodology", "workflow"]
         assert config.max_tokens == 8000
         assert config.combination_strategy == "truncate"
@@ -52,8 +68,8 @@ class TestExtractionLevelConfig:
     def test_default_combination_strategy(self):
         """Should default to 'truncate' strategy."""
         config = ExtractionLevelConfig(
-            level=ExtractionLevel.SECTION,
-            extraction_types=["decision"],
+            level=SECTION,
+            extraction_types=_DECISION,
             max_tokens=4000,
         )
         assert config.combination_strategy == "truncate"
@@ -62,8 +78,8 @@ class TestExtractionLevelConfig:
         """Should reject max_tokens of 0."""
         with pytest.raises(ValidationError):
             ExtractionLevelConfig(
-                level=ExtractionLevel.CHUNK,
-                extraction_types=["warning"],
+                level=CHUNK,
+                extraction_types=_WARNING,
                 max_tokens=0,
             )
 
@@ -71,8 +87,8 @@ class TestExtractionLevelConfig:
         """Should reject negative max_tokens."""
         with pytest.raises(ValidationError):
             ExtractionLevelConfig(
-                level=ExtractionLevel.CHUNK,
-                extraction_types=["warning"],
+                level=CHUNK,
+                extraction_types=_WARNING,
                 max_tokens=-100,
             )
 
@@ -80,8 +96,8 @@ class TestExtractionLevelConfig:
         """Should reject invalid combination strategy."""
         with pytest.raises(ValidationError):
             ExtractionLevelConfig(
-                level=ExtractionLevel.CHUNK,
-                extraction_types=["warning"],
+                level=CHUNK,
+                extraction_types=_WARNING,
                 max_tokens=512,
                 combination_strategy="invalid_strategy",  # type: ignore
             )
@@ -89,8 +105,8 @@ class TestExtractionLevelConfig:
     def test_repr(self):
         """Should have human-readable repr."""
         config = ExtractionLevelConfig(
-            level=ExtractionLevel.CHAPTER,
-            extraction_types=["methodology"],
+            level=CHAPTER,
+            extraction_types=_METHODOLOGY,
             max_tokens=8000,
         )
         repr_str = repr(config)
@@ -101,8 +117,8 @@ class TestExtractionLevelConfig:
     def test_empty_extraction_types_allowed(self):
         """Empty extraction_types list should be allowed."""
         config = ExtractionLevelConfig(
-            level=ExtractionLevel.CHUNK,
-            extraction_types=[],
+            level=CHUNK,
+            extraction_types=(),
             max_tokens=512,
         )
         assert config.extraction_types == []
@@ -117,33 +133,21 @@ class TestExtractionLevelConfigMapping:
             assert level in EXTRACTION_LEVEL_CONFIG
             assert isinstance(EXTRACTION_LEVEL_CONFIG[level], ExtractionLevelConfig)
 
-    def test_chapter_level_config(self):
-        """Chapter level should have methodology and workflow."""
-        config = EXTRACTION_LEVEL_CONFIG[ExtractionLevel.CHAPTER]
-        assert config.level == ExtractionLevel.CHAPTER
-        assert "methodology" in config.extraction_types
-        assert "workflow" in config.extraction_types
-        assert config.max_tokens == 8000
-        assert config.combination_strategy == "summary_if_exceeded"
-
-    def test_section_level_config(self):
-        """Section level should have decision, pattern, checklist, persona."""
-        config = EXTRACTION_LEVEL_CONFIG[ExtractionLevel.SECTION]
-        assert config.level == ExtractionLevel.SECTION
-        assert "decision" in config.extraction_types
-        assert "pattern" in config.extraction_types
-        assert "checklist" in config.extraction_types
-        assert "persona" in config.extraction_types
-        assert config.max_tokens == 4000
-        assert config.combination_strategy == "truncate"
-
-    def test_chunk_level_config(self):
-        """Chunk level should have warning only."""
-        config = EXTRACTION_LEVEL_CONFIG[ExtractionLevel.CHUNK]
-        assert config.level == ExtractionLevel.CHUNK
-        assert config.extraction_types == ["warning"]
-        assert config.max_tokens == 512
-        assert config.combination_strategy == "none"
+    @pytest.mark.parametrize(
+        "level,expected_types,max_tokens,strategy",
+        [
+            (CHAPTER, frozenset(_METHODOLOGY_WORKFLOW), 8000, "summary_if_exceeded"),
+            (SECTION, _EXPECTED_SECTION_TYPES, 4000, "truncate"),
+            (CHUNK, frozenset(_WARNING), 512, "none"),
+        ],
+    )
+    def test_level_config(self, level, expected_types, max_tokens, strategy):
+        """Each level should map to its extraction types, budget and strategy."""
+        config = EXTRACTION_LEVEL_CONFIG[level]
+        assert config.level is level
+        assert frozenset(config.extraction_types) == expected_types
+        assert config.max_tokens == max_tokens
+        assert config.combination_strategy == strategy
 
     def test_no_extraction_type_overlap(self):
         """No extraction type should appear in multiple levels."""
@@ -157,16 +161,7 @@ class TestExtractionLevelConfigMapping:
         all_types = []
         for config in EXTRACTION_LEVEL_CONFIG.values():
             all_types.extend(config.extraction_types)
-        expected_types = {
-            "methodology",
-            "workflow",
-            "decision",
-            "pattern",
-            "checklist",
-            "persona",
-            "warning",
-        }
-        assert set(all_types) == expected_types
+        assert frozenset(all_types) == _EXPECTED_ALL_TYPES
 
 
 class TestGetLevelForExtractionType:
@@ -174,31 +169,31 @@ class TestGetLevelForExtractionType:
 
     def test_methodology_returns_chapter(self):
         """Methodology should be at chapter level."""
-        assert get_level_for_extraction_type("methodology") == ExtractionLevel.CHAPTER
+        assert get_level_for_extraction_type("methodology") == CHAPTER
 
     def test_workflow_returns_chapter(self):
         """Workflow should be at chapter level."""
-        assert get_level_for_extraction_type("workflow") == ExtractionLevel.CHAPTER
+        assert get_level_for_extraction_type("workflow") == CHAPTER
 
     def test_decision_returns_section(self):
         """Decision should be at section level."""
-        assert get_level_for_extraction_type("decision") == ExtractionLevel.SECTION
+        assert get_level_for_extraction_type("decision") == SECTION
 
     def test_pattern_returns_section(self):
         """Pattern should be at section level."""
-        assert get_level_for_extraction_type("pattern") == ExtractionLevel.SECTION
+        assert get_level_for_extraction_type("pattern") == SECTION
 
     def test_checklist_returns_section(self):
         """Checklist should be at section level."""
-        assert get_level_for_extraction_type("checklist") == ExtractionLevel.SECTION
+        assert get_level_for_extraction_type("checklist") == SECTION
 
     def test_persona_returns_section(self):
         """Persona should be at section level."""
-        assert get_level_for_extraction_type("persona") == ExtractionLevel.SECTION
+        assert get_level_for_extraction_type("persona") == SECTION
 
     def test_warning_returns_chunk(self):
         """Warning should be at chunk level."""
-        assert get_level_for_extraction_type("warning") == ExtractionLevel.CHUNK
+        assert get_level_for_extraction_type("warning") == CHUNK
 
     def test_unknown_type_raises_value_error(self):
         """Unknown extraction type should raise ValueError."""
@@ -213,19 +208,20 @@ class TestGetExtractionTypesForLevel:
 
     def test_chapter_level_types(self):
         """Chapter level should return methodology and workflow."""
-        types = get_extraction_types_for_level(ExtractionLevel.CHAPTER)
+        types = get_extraction_types_for_level(CHAPTER)
         assert "methodology" in types
         assert "workflow" in types
         assert len(types) == 2
 
     def test_section_level_types(self):
         """Section level should return decision, pattern, checklist, persona."""
-        types = get_extraction_types_for_level(ExtractionLevel.SECTION)
-        assert set(types) == {"decision", "pattern", "checklist", "persona"}
+        types = get_extraction_types_for_level(SECTION)
+        assert len(types) == 4
+        assert frozenset(types) == _EXPECTED_SECTION_TYPES
 
     def test_chunk_level_types(self):
         """Chunk level should return warning only."""
-        types = get_extraction_types_for_level(ExtractionLevel.CHUNK)
+        types = get_extraction_types_for_level(CHUNK)
         assert types == ["warning"]
 
 
@@ -234,19 +230,19 @@ class TestGetMaxTokensForLevel:
 
     def test_chapter_level_tokens(self):
         """Chapter level should have 8000 tokens."""
-        assert get_max_tokens_for_level(ExtractionLevel.CHAPTER) == 8000
+        assert get_max_tokens_for_level(CHAPTER) == 8000
 
     def test_section_level_tokens(self):
         """Section level should have 4000 tokens."""
-        assert get_max_tokens_for_level(ExtractionLevel.SECTION) == 4000
+        assert get_max_tokens_for_level(SECTION) == 4000
 
     def test_chunk_level_tokens(self):
         """Chunk level should have 512 tokens."""
-        assert get_max_tokens_for_level(ExtractionLevel.CHUNK) == 512
+        assert get_max_tokens_for_level(CHUNK) == 512
 
     def test_token_hierarchy(self):
         """Token budgets should follow chapter > section > chunk."""
-        chapter_tokens = get_max_tokens_for_level(ExtractionLevel.CHAPTER)
-        section_tokens = get_max_tokens_for_level(ExtractionLevel.SECTION)
-        chunk_tokens = get_max_tokens_for_level(ExtractionLevel.CHUNK)
+        chapter_tokens = get_max_tokens_for_level(CHAPTER)
+        section_tokens = get_max_tokens_for_level(SECTION)
+        chunk_tokens = get_max_tokens_for_level(CHUNK)
         assert chapter_tokens > section_tokens > chunk_tokens
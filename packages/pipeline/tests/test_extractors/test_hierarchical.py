@@ -7,9 +7,12 @@ Tests cover:
 - Edge cases (empty docs, missing extractors, etc.)
 """
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
+import pytest_asyncio
 
 from src.extractors.base import (
     Decision,
@@ -26,11 +29,19 @@ from src.extractors.hierarchical import (
 )
 from src.models.chunk import Chunk, ChunkPosition
 
+# Bind enum members once so tests use plain global lookups
+CHAPTER = ExtractionLevel.CHAPTER
+SECTION = ExtractionLevel.SECTION
+CHUNK = ExtractionLevel.CHUNK
+
 
 # =============================================================================
 # Helpers
 # =============================================================================
 
+# Shared filler sliced by make_chunk instead of building "x" * n per call
+_FILLER = "x" * 8192
+
 
 def make_chunk(
     chunk_id: str,
@@ -40,16 +51,34 @@ def make_chunk(
     section: str | None = None,
     page: int | None = None,
     token_count: int = 100,
+    validate: bool = False,
 ) -> Chunk:
     """Factory for creating test chunks with valid IDs.
 
-    Content is auto-generated to be longer than token_count to pass validation.
+    By default chunks are built with ``model_construct`` since all call
+    sites pass trusted literals; content is left as given (or a single
+    character) because the content-vs-token_count check never runs.
+    Pass ``validate=True`` to pad content longer than token_count and run
+    full Pydantic validation.
     """
+    if not validate:
+        return Chunk.model_construct(
+            id=chunk_id,
+            source_id=source_id,
+            content=content or "x",
+            position=ChunkPosition.model_construct(
+                chapter=chapter, section=section, page=page
+            ),
+            token_count=token_count,
+        )
+
     # Generate content longer than token_count if not provided
     if content is None:
-        content = "x" * (token_count + 50)
-    elif len(content) < token_count:
-        content = content + "x" * (token_count - len(content) + 50)
+        content = _FILLER[: token_count + 50]
+    else:
+        need = token_count - len(content)
+        if need > 0:
+            content = content + _FILLER[: need + 50]
 
     return Chunk(
         id=chunk_id,
@@ -60,14 +89,29 @@ def make_chunk(
     )
 
 
+def _setup_mock_registry(
+    mock_registry: tuple[SimpleNamespace, AsyncMock],
+    extraction_type: ExtractionType,
+    results: list[ExtractionResult],
+) -> AsyncMock:
+    """Wire the fake registry to serve ``extraction_type`` returning ``results``."""
+    registry, mock_extractor = mock_registry
+    registry.list_extraction_types = lambda: [extraction_type]
+    mock_extractor.extract.return_value = results
+    return mock_extractor
+
+
 # =============================================================================
 # Fixtures
 # =============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_chunks_with_hierarchy() -> list[Chunk]:
-    """Create sample chunks with chapter/section hierarchy."""
+    """Create sample chunks with chapter/section hierarchy.
+
+    Module-scoped: tests must treat the returned list as read-only.
+    """
     source_id = "507f1f77bcf86cd799439011"
     return [
         make_chunk(
@@ -109,9 +153,12 @@ def sample_chunks_with_hierarchy() -> list[Chunk]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_chunks_no_hierarchy() -> list[Chunk]:
-    """Create sample chunks without chapter/section metadata."""
+    """Create sample chunks without chapter/section metadata.
+
+    Module-scoped: tests must treat the returned list as read-only.
+    """
     source_id = "507f1f77bcf86cd799439022"
     return [
         make_chunk(
@@ -131,50 +178,131 @@ def sample_chunks_no_hierarchy() -> list[Chunk]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def sample_chunks_mixed_hierarchy() -> list[Chunk]:
+    """Create one structured and one unstructured chunk (fully validated).
+
+    Module-scoped: tests must treat the returned list as read-only.
+    """
+    source_id = "507f1f77bcf86cd799439033"
+    return [
+        make_chunk(
+            chunk_id="507f1f77bcf86cd799439021",
+            source_id=source_id,
+            content="Structured content",
+            chapter="Chapter 1",
+            section="Section 1",
+            page=1,
+            token_count=20,
+            validate=True,
+        ),
+        make_chunk(
+            chunk_id="507f1f77bcf86cd799439022",
+            source_id=source_id,
+            content="Unstructured content",
+            page=2,
+            token_count=20,
+            validate=True,
+        ),
+    ]
+
+
+@pytest.fixture(scope="module")
 def mock_decision_result() -> ExtractionResult:
     """Mock successful decision extraction result."""
-    decision = Decision(
+    decision = Decision.model_construct(
         source_id="507f1f77bcf86cd799439011",
         chunk_id="507f1f77bcf86cd799439003",
         question="Choose between vector and keyword search?",
         options=["Vector search", "Keyword search"],
         considerations=["Speed", "Accuracy"],
-        context_level=ExtractionLevel.SECTION,
+        context_level=SECTION,
         context_id="section-123",
         chunk_ids=["507f1f77bcf86cd799439003"],
     )
-    return ExtractionResult(success=True, extraction=decision)
+    return ExtractionResult.model_construct(success=True, extraction=decision)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_methodology_result() -> ExtractionResult:
     """Mock successful methodology extraction result."""
-    methodology = Methodology(
+    methodology = Methodology.model_construct(
         source_id="507f1f77bcf86cd799439011",
         chunk_id="507f1f77bcf86cd799439001",
         name="RAG Implementation",
         steps=[],
-        context_level=ExtractionLevel.CHAPTER,
+        context_level=CHAPTER,
         context_id="chapter-123",
         chunk_ids=["507f1f77bcf86cd799439001", "507f1f77bcf86cd799439002"],
     )
-    return ExtractionResult(success=True, extraction=methodology)
+    return ExtractionResult.model_construct(success=True, extraction=methodology)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_warning_result() -> ExtractionResult:
     """Mock successful warning extraction result."""
-    warning = Warning(
+    warning = Warning.model_construct(
         source_id="507f1f77bcf86cd799439011",
         chunk_id="507f1f77bcf86cd799439004",
         title="Embedding Mistake",
         description="Common embedding pitfall",
-        context_level=ExtractionLevel.CHUNK,
+        context_level=CHUNK,
         context_id="507f1f77bcf86cd799439004",
         chunk_ids=["507f1f77bcf86cd799439004"],
     )
-    return ExtractionResult(success=True, extraction=warning)
+    return ExtractionResult.model_construct(success=True, extraction=warning)
+
+
+@pytest.fixture(scope="module")
+def empty_extractor() -> HierarchicalExtractor:
+    """Shared extractor with no extraction types (stateless, safe to reuse)."""
+    return HierarchicalExtractor(extraction_types=[])
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def hierarchy_result(
+    empty_extractor, sample_chunks_with_hierarchy
+) -> HierarchicalExtractionResult:
+    """Result of running the empty-types extractor over the sample chunks.
+
+    Computed once per module; tests must treat it as read-only.
+    """
+    return await empty_extractor.extract_document(
+        sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
+    )
+
+
+@pytest.fixture(scope="module")
+def shared_mock_extractor() -> AsyncMock:
+    """Module-wide mock extractor; reset per test by ``mock_extractor``."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_extractor(shared_mock_extractor) -> AsyncMock:
+    """Shared mock extractor with calls, return values and side effects cleared."""
+    shared_mock_extractor.reset_mock()
+    shared_mock_extractor.extract.reset_mock(return_value=True, side_effect=True)
+    return shared_mock_extractor
+
+
+@pytest.fixture
+def mock_registry(
+    monkeypatch, mock_extractor
+) -> tuple[SimpleNamespace, AsyncMock]:
+    """Replace the extractor registry with a fake returning a mock extractor.
+
+    The registry is a plain namespace rather than a MagicMock so attribute
+    access doesn't materialize child mocks. Tests set
+    ``mock_extractor.extract.return_value`` (or ``side_effect``) for the
+    specific extraction result they need.
+    """
+    registry = SimpleNamespace(
+        list_extraction_types=lambda: [],
+        get_extractor=lambda *_: mock_extractor,
+    )
+    monkeypatch.setattr("src.extractors.hierarchical.extractor_registry", registry)
+    return registry, mock_extractor
 
 
 # =============================================================================
@@ -189,9 +317,8 @@ class TestHierarchicalExtractorInit:
         """Test initialization uses all registered extraction types."""
         extractor = HierarchicalExtractor()
         # Should have at least the core types
-        type_values = [et.value for et in extractor.extraction_types]
-        assert "decision" in type_values
-        assert "warning" in type_values
+        type_values = {et.value for et in extractor.extraction_types}
+        assert {"decision", "warning"} <= type_values
 
     def test_init_with_specific_extraction_types(self):
         """Test initialization with specific extraction types."""
@@ -207,6 +334,11 @@ class TestHierarchicalExtractorInit:
         extractor = HierarchicalExtractor(extraction_types=[])
         assert extractor.extraction_types == []
 
+    def test_init_rejects_non_positive_concurrency(self):
+        """Test initialization fails fast on a concurrency below 1."""
+        with pytest.raises(ValueError, match="concurrency"):
+            HierarchicalExtractor(extraction_types=[], concurrency=0)
+
 
 # =============================================================================
 # Test: LevelExtractionStats
@@ -216,28 +348,39 @@ class TestHierarchicalExtractorInit:
 class TestLevelExtractionStats:
     """Tests for LevelExtractionStats dataclass."""
 
-    def test_stats_defaults(self):
-        """Test default values."""
-        stats = LevelExtractionStats(level=ExtractionLevel.CHAPTER)
-        assert stats.level == ExtractionLevel.CHAPTER
-        assert stats.contexts_processed == 0
-        assert stats.extractions_attempted == 0
-        assert stats.extractions_successful == 0
-        assert stats.extractions_failed == 0
-        assert stats.total_tokens_processed == 0
-
-    def test_stats_with_values(self):
-        """Test stats with custom values."""
-        stats = LevelExtractionStats(
-            level=ExtractionLevel.SECTION,
-            contexts_processed=5,
-            extractions_attempted=10,
-            extractions_successful=8,
-            extractions_failed=2,
-            total_tokens_processed=1000,
-        )
-        assert stats.contexts_processed == 5
-        assert stats.extractions_successful == 8
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            (
+                {"level": CHAPTER},
+                {
+                    "level": CHAPTER,
+                    "contexts_processed": 0,
+                    "extractions_attempted": 0,
+                    "extractions_successful": 0,
+                    "extractions_failed": 0,
+                    "total_tokens_processed": 0,
+                },
+            ),
+            (
+                {
+                    "level": SECTION,
+                    "contexts_processed": 5,
+                    "extractions_attempted": 10,
+                    "extractions_successful": 8,
+                    "extractions_failed": 2,
+                    "total_tokens_processed": 1000,
+                },
+                {"contexts_processed": 5, "extractions_successful": 8},
+            ),
+        ],
+        ids=["defaults", "custom_values"],
+    )
+    def test_stats_fields(self, kwargs, expected):
+        """Test default and custom field values."""
+        stats = LevelExtractionStats(**kwargs)
+        for attr, value in expected.items():
+            assert getattr(stats, attr) == value
 
 
 # =============================================================================
@@ -258,40 +401,38 @@ class TestHierarchicalExtractionResult:
         assert result.hierarchy_chapters == 0
         assert result.hierarchy_sections == 0
 
-    def test_total_extractions_property(self):
-        """Test total_extractions property calculation."""
-        result = HierarchicalExtractionResult(source_id="source-1")
-        result.stats_by_level[ExtractionLevel.CHAPTER] = LevelExtractionStats(
-            level=ExtractionLevel.CHAPTER,
-            extractions_attempted=5,
-        )
-        result.stats_by_level[ExtractionLevel.SECTION] = LevelExtractionStats(
-            level=ExtractionLevel.SECTION,
-            extractions_attempted=10,
-        )
-        assert result.total_extractions == 15
-
-    def test_successful_extractions_property(self):
-        """Test successful_extractions property calculation."""
-        result = HierarchicalExtractionResult(source_id="source-1")
-        result.stats_by_level[ExtractionLevel.CHAPTER] = LevelExtractionStats(
-            level=ExtractionLevel.CHAPTER,
-            extractions_successful=3,
-        )
-        result.stats_by_level[ExtractionLevel.CHUNK] = LevelExtractionStats(
-            level=ExtractionLevel.CHUNK,
-            extractions_successful=7,
-        )
-        assert result.successful_extractions == 10
-
-    def test_failed_extractions_property(self):
-        """Test failed_extractions property calculation."""
+    @pytest.mark.parametrize(
+        "stats,prop,expected",
+        [
+            (
+                {
+                    CHAPTER: {"extractions_attempted": 5},
+                    SECTION: {"extractions_attempted": 10},
+                },
+                "total_extractions",
+                15,
+            ),
+            (
+                {
+                    CHAPTER: {"extractions_successful": 3},
+                    CHUNK: {"extractions_successful": 7},
+                },
+                "successful_extractions",
+                10,
+            ),
+            (
+                {SECTION: {"extractions_failed": 2}},
+                "failed_extractions",
+                2,
+            ),
+        ],
+    )
+    def test_aggregate_property(self, stats, prop, expected):
+        """Test aggregate properties sum across all levels."""
         result = HierarchicalExtractionResult(source_id="source-1")
-        result.stats_by_level[ExtractionLevel.SECTION] = LevelExtractionStats(
-            level=ExtractionLevel.SECTION,
-            extractions_failed=2,
-        )
-        assert result.failed_extractions == 2
+        for level, kwargs in stats.items():
+            result.stats_by_level[level] = LevelExtractionStats(level=level, **kwargs)
+        assert getattr(result, prop) == expected
 
     def test_get_successful_results(self, mock_decision_result):
         """Test get_successful_results filters correctly."""
@@ -312,7 +453,7 @@ class TestHierarchicalExtractionResult:
 class TestHierarchicalExtractorExtractDocument:
     """Tests for HierarchicalExtractor.extract_document method."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_extract_document_empty_chunks(self):
         """Test extraction with empty chunk list."""
         extractor = HierarchicalExtractor()
@@ -322,174 +463,95 @@ class TestHierarchicalExtractorExtractDocument:
         assert result.total_chunks == 0
         assert result.results == []
 
-    @pytest.mark.asyncio
-    async def test_extract_document_builds_hierarchy(
-        self, sample_chunks_with_hierarchy
-    ):
+    def test_extract_document_builds_hierarchy(self, hierarchy_result):
         """Test that extraction builds document hierarchy."""
-        extractor = HierarchicalExtractor(extraction_types=[])
-        result = await extractor.extract_document(
-            sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
-        )
-
-        assert result.total_chunks == 4
-        assert result.hierarchy_chapters == 2  # Chapter 1 and Chapter 2
-        assert result.hierarchy_sections >= 2  # Multiple sections
+        assert hierarchy_result.total_chunks == 4
+        assert hierarchy_result.hierarchy_chapters == 2  # Chapter 1 and Chapter 2
+        assert hierarchy_result.hierarchy_sections >= 2  # Multiple sections
 
-    @pytest.mark.asyncio
-    async def test_extract_document_initializes_all_level_stats(
-        self, sample_chunks_with_hierarchy
-    ):
+    def test_extract_document_initializes_all_level_stats(self, hierarchy_result):
         """Test that all extraction levels have initialized stats."""
-        extractor = HierarchicalExtractor(extraction_types=[])
-        result = await extractor.extract_document(
-            sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
-        )
-
-        assert ExtractionLevel.CHAPTER in result.stats_by_level
-        assert ExtractionLevel.SECTION in result.stats_by_level
-        assert ExtractionLevel.CHUNK in result.stats_by_level
-
-    @pytest.mark.asyncio
-    async def test_extract_document_routes_to_chapter_level(
-        self, sample_chunks_with_hierarchy, mock_methodology_result
-    ):
-        """Test methodology extraction routes to chapter level."""
-        with patch(
-            "src.extractors.hierarchical.extractor_registry"
-        ) as mock_registry:
-            # Create mock extractor
-            mock_extractor = AsyncMock()
-            mock_extractor.extract = AsyncMock(return_value=[mock_methodology_result])
-            mock_registry.list_extraction_types.return_value = [
-                ExtractionType.METHODOLOGY
-            ]
-            mock_registry.get_extractor.return_value = mock_extractor
-
-            extractor = HierarchicalExtractor(
-                extraction_types=[ExtractionType.METHODOLOGY]
-            )
-            result = await extractor.extract_document(
-                sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
-            )
-
-            # Should have called extract with CHAPTER context level
-            calls = mock_extractor.extract.call_args_list
-            assert len(calls) > 0
-            for call in calls:
-                assert call.kwargs.get("context_level") == ExtractionLevel.CHAPTER
-
-    @pytest.mark.asyncio
-    async def test_extract_document_routes_to_section_level(
-        self, sample_chunks_with_hierarchy, mock_decision_result
+        assert CHAPTER in hierarchy_result.stats_by_level
+        assert SECTION in hierarchy_result.stats_by_level
+        assert CHUNK in hierarchy_result.stats_by_level
+
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize(
+        "extraction_type,result_fixture,expected_level,expected_calls",
+        [
+            # 2 chapters, 3 sections, 4 chunks in sample_chunks_with_hierarchy
+            (ExtractionType.METHODOLOGY, "mock_methodology_result", CHAPTER, 2),
+            (ExtractionType.DECISION, "mock_decision_result", SECTION, 3),
+            (ExtractionType.WARNING, "mock_warning_result", CHUNK, 4),
+        ],
+    )
+    async def test_extract_document_routes_to_level(
+        self,
+        request,
+        mock_registry,
+        sample_chunks_with_hierarchy,
+        extraction_type,
+        result_fixture,
+        expected_level,
+        expected_calls,
     ):
-        """Test decision extraction routes to section level."""
-        with patch(
-            "src.extractors.hierarchical.extractor_registry"
-        ) as mock_registry:
-            mock_extractor = AsyncMock()
-            mock_extractor.extract = AsyncMock(return_value=[mock_decision_result])
-            mock_registry.list_extraction_types.return_value = [
-                ExtractionType.DECISION
-            ]
-            mock_registry.get_extractor.return_value = mock_extractor
-
-            extractor = HierarchicalExtractor(
-                extraction_types=[ExtractionType.DECISION]
-            )
-            result = await extractor.extract_document(
-                sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
-            )
-
-            # Should have called extract with SECTION context level
-            calls = mock_extractor.extract.call_args_list
-            assert len(calls) > 0
-            for call in calls:
-                assert call.kwargs.get("context_level") == ExtractionLevel.SECTION
+        """Test each extraction type routes to its configured context level."""
+        mock_extractor = _setup_mock_registry(
+            mock_registry, extraction_type, [request.getfixturevalue(result_fixture)]
+        )
 
-    @pytest.mark.asyncio
-    async def test_extract_document_routes_to_chunk_level(
-        self, sample_chunks_with_hierarchy, mock_warning_result
-    ):
-        """Test warning extraction routes to chunk level."""
-        with patch(
-            "src.extractors.hierarchical.extractor_registry"
-        ) as mock_registry:
-            mock_extractor = AsyncMock()
-            mock_extractor.extract = AsyncMock(return_value=[mock_warning_result])
-            mock_registry.list_extraction_types.return_value = [
-                ExtractionType.WARNING
-            ]
-            mock_registry.get_extractor.return_value = mock_extractor
-
-            extractor = HierarchicalExtractor(
-                extraction_types=[ExtractionType.WARNING]
-            )
-            result = await extractor.extract_document(
-                sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
-            )
+        extractor = HierarchicalExtractor(extraction_types=[extraction_type])
+        await extractor.extract_document(
+            sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
+        )
 
-            # Should have called extract for each chunk with CHUNK context level
-            calls = mock_extractor.extract.call_args_list
-            assert len(calls) == 4  # One per chunk
-            for call in calls:
-                assert call.kwargs.get("context_level") == ExtractionLevel.CHUNK
+        # One extract call per context at the expected level
+        calls = mock_extractor.extract.call_args_list
+        assert len(calls) == expected_calls
+        for call in calls:
+            assert call.kwargs.get("context_level") == expected_level
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_extract_document_updates_stats(
-        self, sample_chunks_with_hierarchy, mock_warning_result
+        self, mock_registry, sample_chunks_with_hierarchy, mock_warning_result
     ):
         """Test that extraction updates statistics correctly."""
-        with patch(
-            "src.extractors.hierarchical.extractor_registry"
-        ) as mock_registry:
-            mock_extractor = AsyncMock()
-            mock_extractor.extract = AsyncMock(return_value=[mock_warning_result])
-            mock_registry.list_extraction_types.return_value = [
-                ExtractionType.WARNING
-            ]
-            mock_registry.get_extractor.return_value = mock_extractor
-
-            extractor = HierarchicalExtractor(
-                extraction_types=[ExtractionType.WARNING]
-            )
-            result = await extractor.extract_document(
-                sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
-            )
+        _setup_mock_registry(mock_registry, ExtractionType.WARNING, [mock_warning_result])
 
-            # Stats should be updated
-            chunk_stats = result.stats_by_level[ExtractionLevel.CHUNK]
-            assert chunk_stats.extractions_attempted == 4
-            assert chunk_stats.extractions_successful == 4
+        extractor = HierarchicalExtractor(
+            extraction_types=[ExtractionType.WARNING]
+        )
+        result = await extractor.extract_document(
+            sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
+        )
+
+        # Stats should be updated
+        chunk_stats = result.stats_by_level[CHUNK]
+        assert chunk_stats.extractions_attempted == 4
+        assert chunk_stats.extractions_successful == 4
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_extract_document_handles_failed_extractions(
-        self, sample_chunks_with_hierarchy
+        self, mock_registry, sample_chunks_with_hierarchy
     ):
         """Test handling of failed extractions."""
-        failed_result = ExtractionResult(success=False, error="LLM error")
-
-        with patch(
-            "src.extractors.hierarchical.extractor_registry"
-        ) as mock_registry:
-            mock_extractor = AsyncMock()
-            mock_extractor.extract = AsyncMock(return_value=[failed_result])
-            mock_registry.list_extraction_types.return_value = [
-                ExtractionType.WARNING
-            ]
-            mock_registry.get_extractor.return_value = mock_extractor
-
-            extractor = HierarchicalExtractor(
-                extraction_types=[ExtractionType.WARNING]
-            )
-            result = await extractor.extract_document(
-                sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
-            )
+        _setup_mock_registry(
+            mock_registry,
+            ExtractionType.WARNING,
+            [ExtractionResult(success=False, error="LLM error")],
+        )
 
-            # Should track failed extractions
-            chunk_stats = result.stats_by_level[ExtractionLevel.CHUNK]
-            assert chunk_stats.extractions_failed == 4
-            assert chunk_stats.extractions_successful == 0
+        extractor = HierarchicalExtractor(
+            extraction_types=[ExtractionType.WARNING]
+        )
+        result = await extractor.extract_document(
+            sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
+        )
+
+        # Should track failed extractions
+        chunk_stats = result.stats_by_level[CHUNK]
+        assert chunk_stats.extractions_failed == 4
+        assert chunk_stats.extractions_successful == 0
 
 
 # =============================================================================
@@ -506,16 +568,19 @@ class TestHierarchicalExtractorGetExtractor:
         decision_extractor = extractor._get_extractor(ExtractionType.DECISION)
         assert decision_extractor is not None
 
-    def test_get_extractor_returns_none_for_unregistered(self):
+    def test_get_extractor_returns_none_for_unregistered(
+        self, mock_registry, empty_extractor
+    ):
         """Test getting an unregistered extractor returns None."""
-        with patch(
-            "src.extractors.hierarchical.extractor_registry"
-        ) as mock_registry:
-            mock_registry.get_extractor.side_effect = Exception("Not found")
+        registry, _ = mock_registry
+
+        def _not_found(*_):
+            raise Exception("Not found")
 
-            extractor = HierarchicalExtractor(extraction_types=[])
-            result = extractor._get_extractor(ExtractionType.DECISION)
-            assert result is None
+        registry.get_extractor = _not_found
+
+        result = empty_extractor._get_extractor(ExtractionType.DECISION)
+        assert result is None
 
 
 # =============================================================================
@@ -526,99 +591,177 @@ class TestHierarchicalExtractorGetExtractor:
 class TestHierarchicalExtractorEdgeCases:
     """Tests for edge cases and error handling."""
 
-    @pytest.mark.asyncio
-    async def test_extract_with_chunks_missing_hierarchy(
-        self, sample_chunks_no_hierarchy
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize(
+        "chunks_fixture,expected_chapters,expected_sections",
+        [
+            # No metadata: processed as uncategorized
+            ("sample_chunks_no_hierarchy", 0, 0),
+            ("sample_chunks_mixed_hierarchy", 1, 1),
+        ],
+        ids=["missing_hierarchy", "mixed_hierarchy"],
+    )
+    async def test_extract_with_partial_hierarchy(
+        self,
+        request,
+        empty_extractor,
+        chunks_fixture,
+        expected_chapters,
+        expected_sections,
     ):
-        """Test extraction handles chunks without chapter/section metadata."""
-        extractor = HierarchicalExtractor(extraction_types=[])
-        result = await extractor.extract_document(
-            sample_chunks_no_hierarchy, "507f1f77bcf86cd799439022"
-        )
+        """Test extraction handles chunks lacking chapter/section metadata."""
+        chunks = request.getfixturevalue(chunks_fixture)
+        result = await empty_extractor.extract_document(chunks, chunks[0].source_id)
 
-        # Should still process (as uncategorized)
         assert result.total_chunks == 2
-        assert result.hierarchy_chapters == 0
-        assert result.hierarchy_sections == 0
+        assert result.hierarchy_chapters == expected_chapters
+        assert result.hierarchy_sections == expected_sections
 
-    @pytest.mark.asyncio
-    async def test_extract_with_mixed_hierarchy(self):
-        """Test extraction with mix of structured and unstructured chunks."""
-        source_id = "507f1f77bcf86cd799439033"
-        chunks = [
-            make_chunk(
-                chunk_id="507f1f77bcf86cd799439021",
-                source_id=source_id,
-                content="Structured content",
-                chapter="Chapter 1",
-                section="Section 1",
-                page=1,
-                token_count=20,
-            ),
-            make_chunk(
-                chunk_id="507f1f77bcf86cd799439022",
-                source_id=source_id,
-                content="Unstructured content",
-                page=2,
-                token_count=20,
-            ),
-        ]
-
-        extractor = HierarchicalExtractor(extraction_types=[])
-        result = await extractor.extract_document(chunks, source_id)
-
-        assert result.total_chunks == 2
-        assert result.hierarchy_chapters == 1
-        assert result.hierarchy_sections == 1
-
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_extract_skips_levels_without_matching_types(
-        self, sample_chunks_with_hierarchy
+        self, mock_registry, sample_chunks_with_hierarchy
     ):
         """Test extraction skips levels when no matching extraction types."""
         # Only use WARNING which runs at CHUNK level
-        with patch(
-            "src.extractors.hierarchical.extractor_registry"
-        ) as mock_registry:
-            mock_extractor = AsyncMock()
-            mock_extractor.extract = AsyncMock(return_value=[])
-            mock_registry.list_extraction_types.return_value = [
-                ExtractionType.WARNING
-            ]
-            mock_registry.get_extractor.return_value = mock_extractor
-
-            extractor = HierarchicalExtractor(
-                extraction_types=[ExtractionType.WARNING]
+        registry, _ = mock_registry
+
+        async def _empty(*_args, **_kwargs):
+            return []
+
+        registry.get_extractor = lambda *_: SimpleNamespace(extract=_empty)
+
+        extractor = HierarchicalExtractor(
+            extraction_types=[ExtractionType.WARNING]
+        )
+        result = await extractor.extract_document(
+            sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
+        )
+
+        # Chapter and Section levels should have 0 extractions
+        assert result.stats_by_level[CHAPTER].extractions_attempted == 0
+        assert result.stats_by_level[SECTION].extractions_attempted == 0
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_handles_extractor_exception(
+        self, mock_registry, sample_chunks_with_hierarchy
+    ):
+        """Test graceful handling when extractor raises exception."""
+        registry, _ = mock_registry
+
+        async def _boom(*_args, **_kwargs):
+            raise Exception("LLM failed")
+
+        registry.get_extractor = lambda *_: SimpleNamespace(extract=_boom)
+
+        extractor = HierarchicalExtractor(
+            extraction_types=[ExtractionType.WARNING]
+        )
+
+        # Should raise since we don't handle exceptions in extract calls
+        with pytest.raises(Exception, match="LLM failed"):
+            await extractor.extract_document(
+                sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
             )
-            result = await extractor.extract_document(
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_cancels_sibling_contexts_on_error(
+        self, mock_registry, sample_chunks_with_hierarchy
+    ):
+        """Test a failing context cancels the contexts still in flight."""
+        registry, _ = mock_registry
+        started = 0
+        cancelled = 0
+
+        async def _extract(*_args, **_kwargs):
+            nonlocal started, cancelled
+            started += 1
+            if started == 1:
+                # Let the siblings start before failing
+                await asyncio.sleep(0)
+                raise Exception("LLM failed")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+
+        registry.get_extractor = lambda *_: SimpleNamespace(extract=_extract)
+
+        extractor = HierarchicalExtractor(
+            extraction_types=[ExtractionType.WARNING], concurrency=3
+        )
+
+        with pytest.raises(Exception, match="LLM failed"):
+            await extractor.extract_document(
                 sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
             )
 
-            # Chapter and Section levels should have 0 extractions
-            assert result.stats_by_level[ExtractionLevel.CHAPTER].extractions_attempted == 0
-            assert result.stats_by_level[ExtractionLevel.SECTION].extractions_attempted == 0
+        # Every sibling that got going was cancelled rather than left running
+        assert started > 1
+        assert cancelled == started - 1
 
-    @pytest.mark.asyncio
-    async def test_extract_handles_extractor_exception(
-        self, sample_chunks_with_hierarchy
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_cancels_other_levels_on_error(
+        self, mock_registry, sample_chunks_with_hierarchy
     ):
-        """Test graceful handling when extractor raises exception."""
-        with patch(
-            "src.extractors.hierarchical.extractor_registry"
-        ) as mock_registry:
-            mock_extractor = AsyncMock()
-            mock_extractor.extract = AsyncMock(side_effect=Exception("LLM failed"))
-            mock_registry.list_extraction_types.return_value = [
-                ExtractionType.WARNING
-            ]
-            mock_registry.get_extractor.return_value = mock_extractor
-
-            extractor = HierarchicalExtractor(
-                extraction_types=[ExtractionType.WARNING]
+        """Test a failing level cancels extraction at the other levels."""
+        registry, _ = mock_registry
+        chapter_cancelled = 0
+
+        async def _chapter_extract(*_args, **_kwargs):
+            nonlocal chapter_cancelled
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                chapter_cancelled += 1
+                raise
+
+        async def _chunk_extract(*_args, **_kwargs):
+            # Let the chapter level start before failing
+            await asyncio.sleep(0)
+            raise Exception("LLM failed")
+
+        extractors = {
+            ExtractionType.METHODOLOGY: SimpleNamespace(extract=_chapter_extract),
+            ExtractionType.WARNING: SimpleNamespace(extract=_chunk_extract),
+        }
+        registry.get_extractor = extractors.__getitem__
+
+        extractor = HierarchicalExtractor(
+            extraction_types=[ExtractionType.METHODOLOGY, ExtractionType.WARNING]
+        )
+
+        with pytest.raises(Exception, match="LLM failed"):
+            await extractor.extract_document(
+                sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
             )
 
-            # Should raise since we don't handle exceptions in extract calls
-            with pytest.raises(Exception, match="LLM failed"):
-                await extractor.extract_document(
-                    sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
-                )
+        assert chapter_cancelled > 0
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_extract_bounds_concurrent_contexts(
+        self, mock_registry, sample_chunks_with_hierarchy
+    ):
+        """Test chunk contexts run concurrently but never exceed the limit."""
+        registry, _ = mock_registry
+        in_flight = 0
+        peak = 0
+
+        async def _track(*_args, **_kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return []
+
+        registry.get_extractor = lambda *_: SimpleNamespace(extract=_track)
+
+        extractor = HierarchicalExtractor(
+            extraction_types=[ExtractionType.WARNING], concurrency=2
+        )
+        await extractor.extract_document(
+            sample_chunks_with_hierarchy, "507f1f77bcf86cd799439011"
+        )
+
+        assert peak == 2
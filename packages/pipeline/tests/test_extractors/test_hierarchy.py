@@ -13,6 +13,9 @@ from src.extractors.hierarchy import (
 )
 from src.models.chunk import Chunk, ChunkPosition
 
+# Shared filler sliced by make_chunk instead of building "x" * n per call
+_FILLER = "x" * 8192
+
 
 def make_chunk(
     chunk_id: str,
@@ -25,20 +28,21 @@ def make_chunk(
 ) -> Chunk:
     """Factory for creating test chunks.
 
-    Content is auto-generated to be longer than token_count to pass validation.
+    Content is auto-generated to be longer than token_count, so the chunk is
+    built with ``model_construct`` and skips Pydantic validation.
     """
     # Generate content longer than token_count if not provided
-    # Chunk model validates token_count <= len(content)
+    # (the invariant Chunk would otherwise validate: token_count <= len(content))
     if content is None:
-        content = "x" * (token_count + 50)
+        content = _FILLER[: token_count + 50]
     elif len(content) < token_count:
-        content = content + "x" * (token_count - len(content) + 50)
+        content = content + _FILLER[: token_count - len(content) + 50]
 
-    return Chunk(
+    return Chunk.model_construct(
         id=chunk_id,
         source_id=source_id,
         content=content,
-        position=ChunkPosition(chapter=chapter, section=section, page=page),
+        position=ChunkPosition.model_construct(chapter=chapter, section=section, page=page),
         token_count=token_count,
     )
 
@@ -186,6 +190,23 @@ class TestChapterNode:
 
         assert chapter.total_tokens == 300
 
+    def test_chunk_count_property(self):
+        """chunk_count should count section and uncategorized chunks."""
+        section = SectionNode(
+            section_id="section1",
+            section_name="Intro",
+            chapter_name="Chapter 1",
+            chunks=[make_chunk("507f1f77bcf86cd799439001")],
+        )
+        chapter = ChapterNode(
+            chapter_id="chapter1",
+            chapter_name="Chapter 1",
+            sections={"Intro": section},
+            uncategorized_chunks=[make_chunk("507f1f77bcf86cd799439002")],
+        )
+
+        assert chapter.chunk_count == 2
+
 
 class TestDocumentHierarchy:
     """Tests for DocumentHierarchy dataclass."""
@@ -323,6 +344,58 @@ class TestDocumentHierarchy:
         sections = hierarchy.get_section_nodes()
         assert len(sections) == 2
 
+    def test_get_section_nodes_sorted_by_first_chunk(self):
+        """get_section_nodes should order sections by their smallest chunk index."""
+        late = SectionNode(
+            section_id="s1",
+            section_name="Late",
+            chapter_name="Chapter 1",
+            chunks=[make_chunk("507f1f77bcf86cd799439099")],
+        )
+        early = SectionNode(
+            section_id="s2",
+            section_name="Early",
+            chapter_name="Chapter 1",
+            chunks=[
+                make_chunk("507f1f77bcf86cd799439050"),
+                make_chunk("507f1f77bcf86cd799439002"),
+            ],
+        )
+        chapter = ChapterNode(
+            chapter_id="ch1",
+            chapter_name="Chapter 1",
+            sections={"Late": late, "Early": early},
+        )
+        hierarchy = DocumentHierarchy(
+            source_id="source1",
+            chapters={"Chapter 1": chapter},
+        )
+
+        sections = hierarchy.get_section_nodes()
+        assert [s.section_name for s in sections] == ["Early", "Late"]
+
+    def test_get_section_nodes_cannot_mutate_cache(self):
+        """The cached section list should not be mutable through the return value."""
+        section = SectionNode(
+            section_id="s1",
+            section_name="Intro",
+            chapter_name="Chapter 1",
+            chunks=[make_chunk("507f1f77bcf86cd799439001")],
+        )
+        chapter = ChapterNode(
+            chapter_id="ch1",
+            chapter_name="Chapter 1",
+            sections={"Intro": section},
+        )
+        hierarchy = DocumentHierarchy(source_id="source1", chapters={"Chapter 1": chapter})
+
+        sections = hierarchy.get_section_nodes()
+        with pytest.raises(AttributeError):
+            sections.append(section)
+
+        assert hierarchy.get_section_nodes() == (section,)
+        assert hierarchy.section_count == 1
+
 
 class TestBuildHierarchy:
     """Tests for build_hierarchy function."""
@@ -408,6 +481,23 @@ class TestBuildHierarchy:
         assert len(chapter.sections) == 0
         assert len(chapter.uncategorized_chunks) == 1
 
+    def test_single_chapter_splits_sections_and_uncategorized(self):
+        """A single-chapter document still separates sections from loose chunks."""
+        source_id = "507f1f77bcf86cd799439011"
+        chunks = [
+            make_chunk("507f1f77bcf86cd799439001", chapter="Ch 1", section="A", token_count=10),
+            make_chunk("507f1f77bcf86cd799439002", chapter="Ch 1", token_count=20),
+            make_chunk("507f1f77bcf86cd799439003", chapter="Ch 1", section="A", token_count=30),
+        ]
+
+        hierarchy = build_hierarchy(chunks, source_id)
+
+        chapter = hierarchy.chapters["Ch 1"]
+        assert hierarchy.chapter_count == 1
+        assert chapter.sections["A"].total_tokens == 40
+        assert [c.id for c in chapter.uncategorized_chunks] == ["507f1f77bcf86cd799439002"]
+        assert chapter.total_tokens == 60
+
     def test_empty_chunks_list(self):
         """Empty chunks list should return empty hierarchy."""
         source_id = "507f1f77bcf86cd799439011"
@@ -482,6 +572,41 @@ class TestBuildHierarchy:
         assert len(chapter.uncategorized_chunks) == 1
         assert len(hierarchy.uncategorized_chunks) == 1
 
+    def test_precomputes_token_totals(self):
+        """Section and chapter token totals should match their chunks."""
+        source_id = "507f1f77bcf86cd799439011"
+        chunks = [
+            make_chunk(
+                "507f1f77bcf86cd799439001", chapter="Chapter 1", section="Intro", token_count=10
+            ),
+            make_chunk(
+                "507f1f77bcf86cd799439002", chapter="Chapter 1", section="Intro", token_count=20
+            ),
+            make_chunk("507f1f77bcf86cd799439003", chapter="Chapter 1", token_count=30),
+        ]
+
+        hierarchy = build_hierarchy(chunks, source_id)
+
+        chapter = hierarchy.chapters["Chapter 1"]
+        assert chapter.sections["Intro"].total_tokens == 30
+        assert chapter.total_tokens == 60
+
+    def test_precomputes_ordered_section_list(self):
+        """Sections across chapters should be flattened in chunk order."""
+        source_id = "507f1f77bcf86cd799439011"
+        chunks = [
+            make_chunk("507f1f77bcf86cd799439003", chapter="Chapter 2", section="Results"),
+            make_chunk("507f1f77bcf86cd799439001", chapter="Chapter 1", section="Intro"),
+            make_chunk("507f1f77bcf86cd799439002", chapter="Chapter 1", section="Methods"),
+        ]
+
+        hierarchy = build_hierarchy(chunks, source_id)
+
+        sections = hierarchy.get_section_nodes()
+        assert [s.section_name for s in sections] == ["Intro", "Methods", "Results"]
+        assert hierarchy.section_count == 3
+        assert hierarchy.get_section_nodes() is sections
+
     def test_preserves_chunk_data(self):
         """Chunks in hierarchy should have all original data."""
         source_id = "507f1f77bcf86cd799439011"
@@ -643,6 +768,15 @@ class TestCombineChunks:
         assert result.chunk_ids[0] == "507f1f77bcf86cd799439001"
         assert result.chunk_ids[1] == "507f1f77bcf86cd799439099"
 
+    def test_pre_sorted_keeps_input_order(self):
+        """pre_sorted=True should trust the caller's chunk order."""
+        chunk1 = make_chunk("507f1f77bcf86cd799439099", token_count=50)
+        chunk2 = make_chunk("507f1f77bcf86cd799439001", token_count=50)
+
+        result = combine_chunks([chunk1, chunk2], max_tokens=500, pre_sorted=True)
+
+        assert result.chunk_ids == ["507f1f77bcf86cd799439099", "507f1f77bcf86cd799439001"]
+
     def test_exact_limit_fit(self):
         """Chunks that exactly fit should all be included."""
         chunk1 = make_chunk("507f1f77bcf86cd799439001", token_count=50)
@@ -1,6 +1,7 @@
 """Tests for MethodologyExtractor class."""
 
-from unittest.mock import AsyncMock, patch
+import itertools
+from unittest.mock import patch
 
 import pytest
 
@@ -13,29 +14,32 @@ from src.extractors import (
 )
 from src.extractors.base import ExtractionLevel
 from src.extractors.methodology_extractor import MethodologyExtractor
+from tests.test_extractors.conftest import StubLLMClient
+
+
+@pytest.fixture(scope="class")
+def extractor() -> MethodologyExtractor:
+    """One MethodologyExtractor shared by every test in a class."""
+    return MethodologyExtractor()
 
 
 class TestMethodologyExtractorProperties:
     """Test MethodologyExtractor properties and configuration."""
 
-    def test_instantiation(self):
+    def test_instantiation(self, extractor):
         """MethodologyExtractor can be instantiated."""
-        extractor = MethodologyExtractor()
         assert extractor is not None
 
-    def test_extraction_type_is_methodology(self):
+    def test_extraction_type_is_methodology(self, extractor):
         """MethodologyExtractor has METHODOLOGY extraction type."""
-        extractor = MethodologyExtractor()
         assert extractor.extraction_type == ExtractionType.METHODOLOGY
 
-    def test_model_class_is_methodology(self):
+    def test_model_class_is_methodology(self, extractor):
         """MethodologyExtractor uses Methodology model class."""
-        extractor = MethodologyExtractor()
         assert extractor.model_class == Methodology
 
-    def test_uses_default_config(self):
+    def test_uses_default_config(self, extractor):
         """MethodologyExtractor uses default config when none provided."""
-        extractor = MethodologyExtractor()
         assert extractor.config.max_extractions_per_chunk == 5
         assert extractor.config.min_confidence == 0.5
         assert extractor.config.auto_tag_topics is True
@@ -72,13 +76,24 @@ class TestMethodologyExtractorGetPrompt:
         assert "methodology" in prompt.lower()
         assert "step" in prompt.lower()
 
+    def test_get_prompt_is_cached(self):
+        """get_prompt loads the prompt files once and reuses the result."""
+        extractor = MethodologyExtractor()
+        with patch.object(
+            extractor, "_load_full_prompt", wraps=extractor._load_full_prompt
+        ) as load:
+            first = extractor.get_prompt()
+            second = extractor.get_prompt()
+
+        assert first is second
+        load.assert_called_once_with("methodology")
+
 
 class TestMethodologyExtractorAutoTagTopics:
     """Test MethodologyExtractor topic auto-tagging."""
 
-    def test_auto_tag_topics_from_name(self):
+    def test_auto_tag_topics_from_name(self, extractor):
         """auto_tag_topics extracts topics from methodology name."""
-        extractor = MethodologyExtractor()
         methodology = Methodology(
             source_id="src-1",
             chunk_id="chunk-1",
@@ -90,9 +105,8 @@ class TestMethodologyExtractorAutoTagTopics:
         topics = extractor.auto_tag_topics(methodology)
         assert "rag" in topics
 
-    def test_auto_tag_topics_from_steps(self):
+    def test_auto_tag_topics_from_steps(self, extractor):
         """auto_tag_topics extracts topics from steps."""
-        extractor = MethodologyExtractor()
         methodology = Methodology(
             source_id="src-1",
             chunk_id="chunk-1",
@@ -109,9 +123,8 @@ class TestMethodologyExtractorAutoTagTopics:
         topics = extractor.auto_tag_topics(methodology)
         assert "embeddings" in topics or "fine-tuning" in topics
 
-    def test_auto_tag_topics_limits_to_five(self):
+    def test_auto_tag_topics_limits_to_five(self, extractor):
         """auto_tag_topics returns at most 5 topics."""
-        extractor = MethodologyExtractor()
         methodology = Methodology(
             source_id="src-1",
             chunk_id="chunk-1",
@@ -128,9 +141,8 @@ class TestMethodologyExtractorAutoTagTopics:
         topics = extractor.auto_tag_topics(methodology)
         assert len(topics) <= 5
 
-    def test_auto_tag_topics_returns_empty_when_no_matches(self):
+    def test_auto_tag_topics_returns_empty_when_no_matches(self, extractor):
         """auto_tag_topics returns empty list when no topics match."""
-        extractor = MethodologyExtractor()
         methodology = Methodology(
             source_id="src-1",
             chunk_id="chunk-1",
@@ -202,102 +214,133 @@ class TestMethodologyExtractorExtract:
     @pytest.mark.asyncio
     async def test_extract_with_valid_chunk(self, sample_chunk_content, mock_llm_response):
         """extract returns ExtractionResult list for valid chunk."""
-        extractor = MethodologyExtractor()
-
-        with patch.object(extractor, "_llm_client", new_callable=AsyncMock) as mock_client:
-            mock_client.extract.return_value = mock_llm_response
-
-            results = await extractor.extract(
-                content=sample_chunk_content,
-                source_id="source-456",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-123",
-                chunk_ids=["chunk-123"],
-            )
+        extractor = MethodologyExtractor(llm_client=StubLLMClient([mock_llm_response]))
+
+        results = await extractor.extract(
+            content=sample_chunk_content,
+            source_id="source-456",
+            context_level=ExtractionLevel.CHUNK,
+            context_id="chunk-123",
+            chunk_ids=["chunk-123"],
+        )
 
-            assert isinstance(results, list)
-            assert len(results) > 0
-            assert all(isinstance(r, ExtractionResult) for r in results)
+        assert isinstance(results, list)
+        assert len(results) > 0
+        assert all(isinstance(r, ExtractionResult) for r in results)
 
     @pytest.mark.asyncio
     async def test_extract_preserves_source_attribution(
         self, sample_chunk_content, mock_llm_response
     ):
         """extract preserves source_id and chunk_id."""
-        extractor = MethodologyExtractor()
-
-        with patch.object(extractor, "_llm_client", new_callable=AsyncMock) as mock_client:
-            mock_client.extract.return_value = mock_llm_response
-
-            results = await extractor.extract(
-                content=sample_chunk_content,
-                source_id="source-456",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-123",
-                chunk_ids=["chunk-123"],
-            )
+        extractor = MethodologyExtractor(llm_client=StubLLMClient([mock_llm_response]))
+
+        results = await extractor.extract(
+            content=sample_chunk_content,
+            source_id="source-456",
+            context_level=ExtractionLevel.CHUNK,
+            context_id="chunk-123",
+            chunk_ids=["chunk-123"],
+        )
 
-            assert results[0].success is True
-            methodology = results[0].extraction
-            assert methodology.source_id == "source-456"
-            assert methodology.chunk_id == "chunk-123"
+        assert results[0].success is True
+        methodology = results[0].extraction
+        assert methodology.source_id == "source-456"
+        assert methodology.chunk_id == "chunk-123"
 
     @pytest.mark.asyncio
     async def test_extract_sets_schema_version(self, sample_chunk_content, mock_llm_response):
         """extract sets schema_version on extraction."""
-        extractor = MethodologyExtractor()
-
-        with patch.object(extractor, "_llm_client", new_callable=AsyncMock) as mock_client:
-            mock_client.extract.return_value = mock_llm_response
-
-            results = await extractor.extract(
-                content=sample_chunk_content,
-                source_id="source-456",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-123",
-                chunk_ids=["chunk-123"],
-            )
+        extractor = MethodologyExtractor(llm_client=StubLLMClient([mock_llm_response]))
+
+        results = await extractor.extract(
+            content=sample_chunk_content,
+            source_id="source-456",
+            context_level=ExtractionLevel.CHUNK,
+            context_id="chunk-123",
+            chunk_ids=["chunk-123"],
+        )
 
-            assert results[0].extraction.schema_version == "1.1.0"
+        assert results[0].extraction.schema_version == "1.1.0"
 
     @pytest.mark.asyncio
     async def test_extract_returns_empty_list_for_no_methodologies(self):
         """extract returns empty list when no methodologies found."""
-        extractor = MethodologyExtractor()
         no_methodology_response = "[]"
+        extractor = MethodologyExtractor(llm_client=StubLLMClient([no_methodology_response]))
+
+        results = await extractor.extract(
+            content="The sky is blue.",
+            source_id="source-456",
+            context_level=ExtractionLevel.CHUNK,
+            context_id="chunk-123",
+            chunk_ids=["chunk-123"],
+        )
 
-        with patch.object(extractor, "_llm_client", new_callable=AsyncMock) as mock_client:
-            mock_client.extract.return_value = no_methodology_response
-
-            results = await extractor.extract(
-                content="The sky is blue.",
-                source_id="source-456",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-123",
-                chunk_ids=["chunk-123"],
-            )
-
-            assert results == []
+        assert results == []
 
     @pytest.mark.asyncio
     async def test_extract_handles_parse_error(self):
         """extract returns error result for unparseable response."""
-        extractor = MethodologyExtractor()
+        extractor = MethodologyExtractor(llm_client=StubLLMClient(["This is not valid JSON"]))
+
+        results = await extractor.extract(
+            content="Some content",
+            source_id="source-456",
+            context_level=ExtractionLevel.CHUNK,
+            context_id="chunk-123",
+            chunk_ids=["chunk-123"],
+        )
+
+        assert len(results) == 1
+        assert results[0].success is False
+        assert "parse" in results[0].error.lower()
 
-        with patch.object(extractor, "_llm_client", new_callable=AsyncMock) as mock_client:
-            mock_client.extract.return_value = "This is not valid JSON"
 
-            results = await extractor.extract(
-                content="Some content",
-                source_id="source-456",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-123",
-                chunk_ids=["chunk-123"],
-            )
+@pytest.mark.benchmark
+class TestMethodologyExtractorBenchmarks:
+    """Performance regression guards (deselected by default)."""
+
+    def test_auto_tag_topics_bench(self, benchmark):
+        """Benchmark auto_tag_topics on a multi-step methodology."""
+        extractor = MethodologyExtractor(llm_client=StubLLMClient([]))
+        methodology = Methodology(
+            source_id="src-1",
+            chunk_id="chunk-1",
+            name="RAG Pipeline with Embeddings and Vector Search",
+            steps=[
+                MethodologyStep(
+                    order=i,
+                    title=f"Step {i}: chunking and retrieval",
+                    description="Tune the prompt, evaluate with metrics, fine-tune the LLM",
+                )
+                for i in range(1, 21)
+            ],
+            prerequisites=["Qdrant vector database", "Embedding model"],
+            outputs=["Evaluated RAG agent"],
+        )
+
+        topics = benchmark(extractor.auto_tag_topics, methodology)
+
+        assert 0 < len(topics) <= 5
+
+    def test_extract_dispatch_bench(self, aio_benchmark):
+        """Benchmark extract() parse and validation with a canned LLM response."""
+        response = (
+            '[{"name": "RAG System Implementation", "steps": '
+            '[{"order": 1, "title": "Chunk", "description": "Split documents"}], '
+            '"confidence": 0.9}]'
+        )
+        extractor = MethodologyExtractor(llm_client=StubLLMClient(itertools.repeat(response)))
+
+        results = aio_benchmark(
+            extractor.extract,
+            content="Building a RAG system requires several key steps.",
+            source_id="source-456",
+            context_id="chunk-123",
+        )
 
-            assert len(results) == 1
-            assert results[0].success is False
-            assert "parse" in results[0].error.lower()
+        assert results[0].success is True
 
 
 class TestMethodologyModel:
@@ -1,9 +1,7 @@
 """Tests for extraction Pydantic models."""
 
-from datetime import datetime
-
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from src.extractors import (
     Checklist,
@@ -18,7 +16,63 @@ from src.extractors import (
     Workflow,
     WorkflowStep,
 )
-from src.extractors.base import ExtractionBase, ExtractionLevel
+from src.extractors.base import ExtractionLevel
+
+# Enum members, snapshotted once for the enum tests
+_TYPE_SET = frozenset(ExtractionType)
+_LEVEL_SET = frozenset(ExtractionLevel)
+_TYPE_VALUES = tuple(t.value for t in ExtractionType)
+_LEVEL_VALUES = tuple(level.value for level in ExtractionLevel)
+
+# Built once: constructing a TypeAdapter compiles a new validator
+_DECISION_LIST_ADAPTER = TypeAdapter(list[Decision])
+
+
+@pytest.fixture(scope="module")
+def decision_min() -> Decision:
+    """Provide a minimal Decision shared by read-only tests."""
+    return Decision(source_id="src-123", chunk_id="chunk-456", question="Test?")
+
+
+@pytest.fixture(scope="module")
+def pattern_min() -> Pattern:
+    """Provide a minimal Pattern shared by read-only tests."""
+    return Pattern(
+        source_id="src-123",
+        chunk_id="chunk-456",
+        name="Test",
+        problem="Problem",
+        solution="Solution",
+    )
+
+
+@pytest.fixture(scope="module")
+def warning_min() -> Warning:
+    """Provide a minimal Warning shared by read-only tests."""
+    return Warning(
+        source_id="src-123",
+        chunk_id="chunk-456",
+        title="Test",
+        description="Test description",
+    )
+
+
+@pytest.fixture(scope="module")
+def methodology_min() -> Methodology:
+    """Provide a minimal Methodology shared by read-only tests."""
+    return Methodology(source_id="src-123", chunk_id="chunk-456", name="Test")
+
+
+@pytest.fixture(scope="module")
+def persona_min() -> Persona:
+    """Provide a minimal Persona shared by read-only tests."""
+    return Persona(source_id="src-123", chunk_id="chunk-456", role="Test")
+
+
+@pytest.fixture(scope="module")
+def workflow_min() -> Workflow:
+    """Provide a minimal Workflow shared by read-only tests."""
+    return Workflow(source_id="src-123", chunk_id="chunk-456", name="Test")
 
 
 class TestExtractionType:
@@ -26,20 +80,18 @@ class TestExtractionType:
 
     def test_all_types_defined(self):
         """All 7 extraction types are defined."""
-        types = list(ExtractionType)
-        assert len(types) == 7
-        assert ExtractionType.DECISION in types
-        assert ExtractionType.PATTERN in types
-        assert ExtractionType.WARNING in types
-        assert ExtractionType.METHODOLOGY in types
-        assert ExtractionType.CHECKLIST in types
-        assert ExtractionType.PERSONA in types
-        assert ExtractionType.WORKFLOW in types
+        assert len(_TYPE_SET) == 7
+        assert ExtractionType.DECISION in _TYPE_SET
+        assert ExtractionType.PATTERN in _TYPE_SET
+        assert ExtractionType.WARNING in _TYPE_SET
+        assert ExtractionType.METHODOLOGY in _TYPE_SET
+        assert ExtractionType.CHECKLIST in _TYPE_SET
+        assert ExtractionType.PERSONA in _TYPE_SET
+        assert ExtractionType.WORKFLOW in _TYPE_SET
 
     def test_type_values_are_lowercase(self):
         """Extraction type values are lowercase strings."""
-        for t in ExtractionType:
-            assert t.value == t.value.lower()
+        assert all(v == v.lower() for v in _TYPE_VALUES)
 
 
 class TestDecisionModel:
@@ -56,25 +108,20 @@ class TestDecisionModel:
         assert decision.chunk_id == "chunk-456"
         assert decision.question == "Should I use RAG or fine-tuning?"
 
-    def test_decision_default_values(self):
+    def test_decision_default_values(self, decision_min):
         """Decision model has correct default values."""
-        decision = Decision(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            question="Test?",
-        )
-        assert decision.type == ExtractionType.DECISION
-        assert decision.schema_version == "1.1.0"  # Updated for hierarchical extraction
-        assert decision.options == []
-        assert decision.considerations == []
-        assert decision.recommended_approach is None
-        assert decision.context == ""
-        assert decision.topics == []
-        assert decision.confidence == 0.8
+        assert decision_min.type == ExtractionType.DECISION
+        assert decision_min.schema_version == "1.1.0"  # Updated for hierarchical extraction
+        assert decision_min.options == []
+        assert decision_min.considerations == []
+        assert decision_min.recommended_approach is None
+        assert decision_min.context == ""
+        assert decision_min.topics == []
+        assert decision_min.confidence == 0.8
         # New v1.1.0 defaults for hierarchical extraction
-        assert decision.context_level == ExtractionLevel.CHUNK
-        assert decision.context_id == ""
-        assert decision.chunk_ids == []
+        assert decision_min.context_level == ExtractionLevel.CHUNK
+        assert decision_min.context_id == ""
+        assert decision_min.chunk_ids == []
 
     def test_decision_with_all_fields(self):
         """Decision model accepts all optional fields."""
@@ -115,16 +162,9 @@ class TestPatternModel:
         assert pattern.problem == "LLM knowledge cutoff"
         assert pattern.solution == "Retrieve relevant documents"
 
-    def test_pattern_default_type(self):
+    def test_pattern_default_type(self, pattern_min):
         """Pattern model has correct default type."""
-        pattern = Pattern(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            name="Test",
-            problem="Problem",
-            solution="Solution",
-        )
-        assert pattern.type == ExtractionType.PATTERN
+        assert pattern_min.type == ExtractionType.PATTERN
 
     def test_pattern_with_code_example(self):
         """Pattern model accepts code example."""
@@ -153,15 +193,9 @@ class TestWarningModel:
         assert warning.title == "Context Overflow"
         assert warning.description == "Too many tokens in prompt"
 
-    def test_warning_default_type(self):
+    def test_warning_default_type(self, warning_min):
         """Warning model has correct default type."""
-        warning = Warning(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            title="Test",
-            description="Test description",
-        )
-        assert warning.type == ExtractionType.WARNING
+        assert warning_min.type == ExtractionType.WARNING
 
     def test_warning_with_all_fields(self):
         """Warning model accepts all optional fields."""
@@ -218,14 +252,9 @@ class TestMethodologyModel:
         assert len(methodology.steps) == 2
         assert methodology.steps[0].order == 1
 
-    def test_methodology_default_type(self):
+    def test_methodology_default_type(self, methodology_min):
         """Methodology model has correct default type."""
-        methodology = Methodology(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            name="Test",
-        )
-        assert methodology.type == ExtractionType.METHODOLOGY
+        assert methodology_min.type == ExtractionType.METHODOLOGY
 
 
 class TestChecklistModel:
@@ -292,14 +321,9 @@ class TestPersonaModel:
         assert len(persona.responsibilities) == 2
         assert len(persona.expertise) == 2
 
-    def test_persona_default_type(self):
+    def test_persona_default_type(self, persona_min):
         """Persona model has correct default type."""
-        persona = Persona(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            role="Test",
-        )
-        assert persona.type == ExtractionType.PERSONA
+        assert persona_min.type == ExtractionType.PERSONA
 
 
 class TestWorkflowModel:
@@ -340,150 +364,29 @@ class TestWorkflowModel:
         assert len(workflow.steps) == 2
         assert len(workflow.decision_points) == 2
 
-    def test_workflow_default_type(self):
+    def test_workflow_default_type(self, workflow_min):
         """Workflow model has correct default type."""
-        workflow = Workflow(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            name="Test",
-        )
-        assert workflow.type == ExtractionType.WORKFLOW
-
-
-class TestAllModelsCommonFields:
-    """Test that all extraction models have required common fields."""
-
-    @pytest.mark.parametrize(
-        "model_class,extra_fields",
-        [
-            (Decision, {"question": "Test?"}),
-            (Pattern, {"name": "Test", "problem": "P", "solution": "S"}),
-            (Warning, {"title": "Test", "description": "Desc"}),
-            (Methodology, {"name": "Test"}),
-            (Checklist, {"name": "Test"}),
-            (Persona, {"role": "Test"}),
-            (Workflow, {"name": "Test"}),
-        ],
-    )
-    def test_model_has_source_id(self, model_class, extra_fields):
-        """All extraction models include source_id field."""
-        instance = model_class(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            **extra_fields,
-        )
-        assert hasattr(instance, "source_id")
-        assert instance.source_id == "src-123"
-
-    @pytest.mark.parametrize(
-        "model_class,extra_fields",
-        [
-            (Decision, {"question": "Test?"}),
-            (Pattern, {"name": "Test", "problem": "P", "solution": "S"}),
-            (Warning, {"title": "Test", "description": "Desc"}),
-            (Methodology, {"name": "Test"}),
-            (Checklist, {"name": "Test"}),
-            (Persona, {"role": "Test"}),
-            (Workflow, {"name": "Test"}),
-        ],
-    )
-    def test_model_has_chunk_id(self, model_class, extra_fields):
-        """All extraction models include chunk_id field."""
-        instance = model_class(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            **extra_fields,
-        )
-        assert hasattr(instance, "chunk_id")
-        assert instance.chunk_id == "chunk-456"
-
-    @pytest.mark.parametrize(
-        "model_class,extra_fields",
-        [
-            (Decision, {"question": "Test?"}),
-            (Pattern, {"name": "Test", "problem": "P", "solution": "S"}),
-            (Warning, {"title": "Test", "description": "Desc"}),
-            (Methodology, {"name": "Test"}),
-            (Checklist, {"name": "Test"}),
-            (Persona, {"role": "Test"}),
-            (Workflow, {"name": "Test"}),
-        ],
-    )
-    def test_model_has_topics(self, model_class, extra_fields):
-        """All extraction models include topics field."""
-        instance = model_class(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            **extra_fields,
-        )
-        assert hasattr(instance, "topics")
-        assert isinstance(instance.topics, list)
-
-    @pytest.mark.parametrize(
-        "model_class,extra_fields",
-        [
-            (Decision, {"question": "Test?"}),
-            (Pattern, {"name": "Test", "problem": "P", "solution": "S"}),
-            (Warning, {"title": "Test", "description": "Desc"}),
-            (Methodology, {"name": "Test"}),
-            (Checklist, {"name": "Test"}),
-            (Persona, {"role": "Test"}),
-            (Workflow, {"name": "Test"}),
-        ],
-    )
-    def test_model_has_schema_version(self, model_class, extra_fields):
-        """All extraction models include schema_version field."""
-        instance = model_class(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            **extra_fields,
-        )
-        assert hasattr(instance, "schema_version")
-        assert instance.schema_version == "1.1.0"  # Updated for hierarchical extraction
-
-    @pytest.mark.parametrize(
-        "model_class,extra_fields",
-        [
-            (Decision, {"question": "Test?"}),
-            (Pattern, {"name": "Test", "problem": "P", "solution": "S"}),
-            (Warning, {"title": "Test", "description": "Desc"}),
-            (Methodology, {"name": "Test"}),
-            (Checklist, {"name": "Test"}),
-            (Persona, {"role": "Test"}),
-            (Workflow, {"name": "Test"}),
-        ],
-    )
-    def test_model_has_extracted_at(self, model_class, extra_fields):
-        """All extraction models include extracted_at field."""
-        instance = model_class(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            **extra_fields,
-        )
-        assert hasattr(instance, "extracted_at")
-        assert isinstance(instance.extracted_at, datetime)
-
-    @pytest.mark.parametrize(
-        "model_class,extra_fields",
-        [
-            (Decision, {"question": "Test?"}),
-            (Pattern, {"name": "Test", "problem": "P", "solution": "S"}),
-            (Warning, {"title": "Test", "description": "Desc"}),
-            (Methodology, {"name": "Test"}),
-            (Checklist, {"name": "Test"}),
-            (Persona, {"role": "Test"}),
-            (Workflow, {"name": "Test"}),
-        ],
-    )
-    def test_model_has_confidence(self, model_class, extra_fields):
-        """All extraction models include confidence field."""
-        instance = model_class(
+        assert workflow_min.type == ExtractionType.WORKFLOW
+
+
+class TestNestedModels:
+    """Test that nested step models are embedded without revalidation."""
+
+    def test_no_revalidate_on_nesting(self):
+        """Step instances are reused, not copied, when nested in a model."""
+        assert Methodology.model_config.get("revalidate_instances") == "never"
+        assert Workflow.model_config.get("revalidate_instances") == "never"
+        assert MethodologyStep.model_config.get("revalidate_instances") == "never"
+        assert WorkflowStep.model_config.get("revalidate_instances") == "never"
+
+        step = MethodologyStep(order=1, title="Prepare data", description="Clean data")
+        methodology = Methodology(
             source_id="src-123",
             chunk_id="chunk-456",
-            **extra_fields,
+            name="Fine-tuning",
+            steps=[step],
         )
-        assert hasattr(instance, "confidence")
-        assert 0.0 <= instance.confidence <= 1.0
+        assert methodology.steps[0] is step
 
 
 class TestExtractionBaseConfidence:
@@ -506,24 +409,15 @@ class TestExtractionBaseConfidence:
         assert low.confidence == 0.0
         assert high.confidence == 1.0
 
-    def test_confidence_above_one_raises(self):
-        """Confidence rejects values above 1.0."""
-        with pytest.raises(ValidationError):
-            Decision(
-                source_id="src-123",
-                chunk_id="chunk-456",
-                question="Test?",
-                confidence=1.5,
-            )
-
-    def test_confidence_below_zero_raises(self):
-        """Confidence rejects values below 0.0."""
+    @pytest.mark.parametrize("bad", [1.5, -0.1, float("inf"), float("nan")])
+    def test_confidence_out_of_bounds_raises(self, bad):
+        """Confidence rejects values outside [0.0, 1.0]."""
         with pytest.raises(ValidationError):
             Decision(
                 source_id="src-123",
                 chunk_id="chunk-456",
                 question="Test?",
-                confidence=-0.1,
+                confidence=bad,
             )
 
 
@@ -532,127 +426,34 @@ class TestExtractionLevel:
 
     def test_all_levels_defined(self):
         """All 3 extraction levels are defined."""
-        levels = list(ExtractionLevel)
-        assert len(levels) == 3
-        assert ExtractionLevel.CHAPTER in levels
-        assert ExtractionLevel.SECTION in levels
-        assert ExtractionLevel.CHUNK in levels
+        assert len(_LEVEL_SET) == 3
+        assert ExtractionLevel.CHAPTER in _LEVEL_SET
+        assert ExtractionLevel.SECTION in _LEVEL_SET
+        assert ExtractionLevel.CHUNK in _LEVEL_SET
 
     def test_level_values_are_lowercase(self):
         """Extraction level values are lowercase strings."""
-        for level in ExtractionLevel:
-            assert level.value == level.value.lower()
-
-
-class TestHierarchicalExtractionFields:
-    """Test v1.1.0 hierarchical extraction fields on ExtractionBase."""
-
-    @pytest.mark.parametrize(
-        "model_class,extra_fields",
-        [
-            (Decision, {"question": "Test?"}),
-            (Pattern, {"name": "Test", "problem": "P", "solution": "S"}),
-            (Warning, {"title": "Test", "description": "Desc"}),
-            (Methodology, {"name": "Test"}),
-            (Checklist, {"name": "Test"}),
-            (Persona, {"role": "Test"}),
-            (Workflow, {"name": "Test"}),
-        ],
-    )
-    def test_model_has_context_level(self, model_class, extra_fields):
-        """All extraction models include context_level field."""
-        instance = model_class(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            **extra_fields,
-        )
-        assert hasattr(instance, "context_level")
-        assert instance.context_level == ExtractionLevel.CHUNK
-
-    @pytest.mark.parametrize(
-        "model_class,extra_fields",
-        [
-            (Decision, {"question": "Test?"}),
-            (Pattern, {"name": "Test", "problem": "P", "solution": "S"}),
-            (Warning, {"title": "Test", "description": "Desc"}),
-            (Methodology, {"name": "Test"}),
-            (Checklist, {"name": "Test"}),
-            (Persona, {"role": "Test"}),
-            (Workflow, {"name": "Test"}),
-        ],
-    )
-    def test_model_has_context_id(self, model_class, extra_fields):
-        """All extraction models include context_id field."""
-        instance = model_class(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            **extra_fields,
-        )
-        assert hasattr(instance, "context_id")
-        assert instance.context_id == ""
-
-    @pytest.mark.parametrize(
-        "model_class,extra_fields",
-        [
-            (Decision, {"question": "Test?"}),
-            (Pattern, {"name": "Test", "problem": "P", "solution": "S"}),
-            (Warning, {"title": "Test", "description": "Desc"}),
-            (Methodology, {"name": "Test"}),
-            (Checklist, {"name": "Test"}),
-            (Persona, {"role": "Test"}),
-            (Workflow, {"name": "Test"}),
-        ],
-    )
-    def test_model_has_chunk_ids(self, model_class, extra_fields):
-        """All extraction models include chunk_ids field."""
-        instance = model_class(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            **extra_fields,
-        )
-        assert hasattr(instance, "chunk_ids")
-        assert isinstance(instance.chunk_ids, list)
-        assert instance.chunk_ids == []
+        assert all(v == v.lower() for v in _LEVEL_VALUES)
 
-    def test_hierarchical_fields_can_be_set(self):
-        """Hierarchical context fields can be explicitly set."""
-        decision = Decision(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            question="Test?",
-            context_level=ExtractionLevel.SECTION,
-            context_id="section-id-789",
-            chunk_ids=["chunk-456", "chunk-457", "chunk-458"],
-        )
-        assert decision.context_level == ExtractionLevel.SECTION
-        assert decision.context_id == "section-id-789"
-        assert len(decision.chunk_ids) == 3
-        assert "chunk-456" in decision.chunk_ids
 
-    def test_chapter_level_extraction(self):
-        """Methodology with chapter-level context."""
-        methodology = Methodology(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            name="RAG Implementation",
-            context_level=ExtractionLevel.CHAPTER,
-            context_id="chapter-id-123",
-            chunk_ids=["chunk-1", "chunk-2", "chunk-3", "chunk-4", "chunk-5"],
-        )
-        assert methodology.context_level == ExtractionLevel.CHAPTER
-        assert len(methodology.chunk_ids) == 5
+class TestSerialization:
+    """Test JSON validation paths for extraction models."""
 
-    def test_backward_compatibility_defaults(self):
-        """Old-style extractions (without context fields) use defaults."""
-        # Simulating loading an old 1.0.0 extraction
-        warning = Warning(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            title="Test Warning",
-            description="Test description",
-            schema_version="1.0.0",  # Old version
-        )
-        # Should still have defaults for new fields
-        assert warning.context_level == ExtractionLevel.CHUNK
-        assert warning.context_id == ""
-        assert warning.chunk_ids == []
+    def test_model_validate_json(self):
+        """model_validate_json parses raw JSON bytes straight into a model."""
+        raw = b'{"source_id":"src-123","chunk_id":"chunk-456","question":"Test?"}'
+
+        decision = Decision.model_validate_json(raw)
+
+        assert decision.question == "Test?"
+        assert decision.source_id == "src-123"
+        assert decision.type == ExtractionType.DECISION
+
+    def test_batch_construction(self):
+        """A module-level list adapter validates a batch in one call."""
+        payloads = [{"source_id": "s", "chunk_id": "c", "question": "q"}] * 1000
+
+        decisions = _DECISION_LIST_ADAPTER.validate_python(payloads)
+
+        assert len(decisions) == 1000
+        assert all(isinstance(d, Decision) for d in decisions)
@@ -0,0 +1,132 @@
+"""Tests for fields shared by all extraction Pydantic models."""
+
+from datetime import datetime
+
+import orjson
+import pytest
+
+from src.extractors import (
+    Checklist,
+    Decision,
+    Methodology,
+    Pattern,
+    Persona,
+    Warning,
+    Workflow,
+)
+from src.extractors.base import ExtractionBase, ExtractionLevel
+
+# Attribution fields shared by every extraction model under test
+_COMMON = {"source_id": "src-123", "chunk_id": "chunk-456"}
+
+# Each extraction model with the minimal extra fields it requires
+_MODEL_CASES = [
+    (Decision, {"question": "Test?"}),
+    (Pattern, {"name": "Test", "problem": "P", "solution": "S"}),
+    (Warning, {"title": "Test", "description": "Desc"}),
+    (Methodology, {"name": "Test"}),
+    (Checklist, {"name": "Test"}),
+    (Persona, {"role": "Test"}),
+    (Workflow, {"name": "Test"}),
+]
+_MODEL_IDS = [model_class.__name__ for model_class, _ in _MODEL_CASES]
+
+
+@pytest.fixture(scope="module")
+def common() -> dict[str, str]:
+    """Provide the shared source_id/chunk_id kwargs."""
+    return _COMMON
+
+
+@pytest.fixture(scope="module", params=_MODEL_CASES, ids=_MODEL_IDS)
+def case(request) -> tuple[type[ExtractionBase], dict[str, str]]:
+    """Parametrize a test over every (model_class, extra_fields) case."""
+    return request.param
+
+
+@pytest.fixture(scope="module")
+def built(case, common) -> ExtractionBase:
+    """Provide one instance per _MODEL_CASES entry, shared across the module.
+
+    Built with model_construct: the tests using it check field presence
+    and defaults only, and validation is covered elsewhere.
+    """
+    model_class, extra_fields = case
+    return model_class.model_construct(**common, **extra_fields)
+
+
+class TestAllModelsCommonFields:
+    """Test that all extraction models have required common fields."""
+
+    def test_model_has_common_fields(self, built):
+        """All extraction models include attribution and metadata fields."""
+        assert built.source_id == "src-123"
+        assert built.chunk_id == "chunk-456"
+        assert isinstance(built.topics, list)
+        assert built.schema_version == "1.1.0"  # Updated for hierarchical extraction
+        assert isinstance(built.extracted_at, datetime)
+        assert 0.0 <= built.confidence <= 1.0
+
+    def test_model_dump_round_trips_through_json(self, common, case):
+        """model_dump output survives a JSON round trip unchanged."""
+        model_class, extra_fields = case
+        dumped = model_class(**common, **extra_fields).model_dump(mode="json")
+
+        assert orjson.loads(orjson.dumps(dumped)) == dumped
+        assert {**common, **extra_fields}.items() <= dumped.items()
+
+
+class TestHierarchicalExtractionFields:
+    """Test v1.1.0 hierarchical extraction fields on ExtractionBase."""
+
+    def test_model_has_hierarchical_fields(self, built):
+        """All extraction models default to chunk-level context."""
+        assert built.context_level == ExtractionLevel.CHUNK
+        assert built.context_id == ""
+        assert isinstance(built.chunk_ids, list)
+        assert built.chunk_ids == []
+
+    def test_hierarchical_fields_can_be_set(self):
+        """Hierarchical context fields can be explicitly set."""
+        decision = Decision(
+            source_id="src-123",
+            chunk_id="chunk-456",
+            question="Test?",
+            context_level=ExtractionLevel.SECTION,
+            context_id="section-id-789",
+            chunk_ids=["chunk-456", "chunk-457", "chunk-458"],
+        )
+        assert decision.context_level == ExtractionLevel.SECTION
+        assert decision.context_id == "section-id-789"
+        assert len(decision.chunk_ids) == 3
+        assert "chunk-456" in decision.chunk_ids
+
+    def test_chapter_level_extraction(self):
+        """Methodology with chapter-level context."""
+        methodology = Methodology(
+            source_id="src-123",
+            chunk_id="chunk-456",
+            name="RAG Implementation",
+            context_level=ExtractionLevel.CHAPTER,
+            context_id="chapter-id-123",
+            chunk_ids=["chunk-1", "chunk-2", "chunk-3", "chunk-4", "chunk-5"],
+        )
+        assert methodology.context_level == ExtractionLevel.CHAPTER
+        assert len(methodology.chunk_ids) == 5
+
+    def test_backward_compatibility_defaults(self):
+        """Old-style extractions (without context fields) use defaults."""
+        # Simulating loading a stored 1.0.0 extraction document
+        warning = Warning.model_validate(
+            {
+                "source_id": "src-123",
+                "chunk_id": "chunk-456",
+                "title": "Test Warning",
+                "description": "Test description",
+                "schema_version": "1.0.0",  # Old version
+            }
+        )
+        # Should still have defaults for new fields
+        assert warning.context_level == ExtractionLevel.CHUNK
+        assert warning.context_id == ""
+        assert warning.chunk_ids == []
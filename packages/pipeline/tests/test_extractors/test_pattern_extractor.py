@@ -5,37 +5,77 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from src.extractors import (
+    ExtractionErrorKind,
+    ExtractionParseError,
     ExtractionResult,
     ExtractionType,
     ExtractorConfig,
+    ExtractorRegistry,
+    LLMClientError,
     Pattern,
     extractor_registry,
 )
 from src.extractors.base import ExtractionLevel
 from src.extractors.pattern_extractor import PatternExtractor
+from tests.test_extractors.conftest import PATTERN_RESPONSE
+
+
+# Minimal valid Pattern kwargs; tests add the fields they exercise.
+_PATTERN_BASE = {
+    "source_id": "src-123",
+    "chunk_id": "chunk-456",
+    "name": "Test",
+    "problem": "Test",
+    "solution": "Test",
+}
+
+
+@pytest.fixture(scope="module")
+def extractor() -> PatternExtractor:
+    """One PatternExtractor shared by the read-only tests in this module."""
+    return PatternExtractor()
+
+
+@pytest.fixture(scope="module")
+def global_pattern_extractor():
+    """The PATTERN extractor from the global registry, fetched once."""
+    return extractor_registry.get_extractor(ExtractionType.PATTERN)
+
+
+@pytest.fixture(scope="module")
+def prompt_lower(extractor) -> str:
+    """The pattern prompt, lowercased once for the module."""
+    return extractor.get_prompt().lower()
+
+
+@pytest.fixture
+def patched_extractor() -> PatternExtractor:
+    """A PatternExtractor whose LLM client is an AsyncMock.
+
+    Topic auto-tagging is off; tests that check topics enable it themselves.
+    """
+    return PatternExtractor(
+        llm_client=AsyncMock(), config=ExtractorConfig(auto_tag_topics=False)
+    )
 
 
 class TestPatternExtractorProperties:
     """Test PatternExtractor properties and configuration."""
 
-    def test_instantiation(self):
+    def test_instantiation(self, extractor):
         """PatternExtractor can be instantiated."""
-        extractor = PatternExtractor()
         assert extractor is not None
 
-    def test_extraction_type_is_pattern(self):
+    def test_extraction_type_is_pattern(self, extractor):
         """PatternExtractor has PATTERN extraction type."""
-        extractor = PatternExtractor()
         assert extractor.extraction_type == ExtractionType.PATTERN
 
-    def test_model_class_is_pattern(self):
+    def test_model_class_is_pattern(self, extractor):
         """PatternExtractor uses Pattern model class."""
-        extractor = PatternExtractor()
         assert extractor.model_class == Pattern
 
-    def test_uses_default_config(self):
+    def test_uses_default_config(self, extractor):
         """PatternExtractor uses default config when none provided."""
-        extractor = PatternExtractor()
         assert extractor.config.max_extractions_per_chunk == 5
         assert extractor.config.min_confidence == 0.5
         assert extractor.config.auto_tag_topics is True
@@ -55,36 +95,36 @@ class TestPatternExtractorProperties:
 class TestPatternExtractorGetPrompt:
     """Test PatternExtractor.get_prompt method."""
 
-    def test_get_prompt_returns_string(self):
+    def test_get_prompt_returns_string(self, extractor):
         """get_prompt returns prompt string."""
-        extractor = PatternExtractor()
         prompt = extractor.get_prompt()
         assert isinstance(prompt, str)
         assert len(prompt) > 100
 
-    def test_get_prompt_contains_pattern_instructions(self):
-        """get_prompt contains pattern-specific instructions."""
-        extractor = PatternExtractor()
-        prompt = extractor.get_prompt()
-        # Should contain base instructions
-        assert "knowledge extraction assistant" in prompt.lower()
-        # Should contain pattern-specific content
-        assert "pattern" in prompt.lower()
-        assert "problem" in prompt.lower()
-        assert "solution" in prompt.lower()
-
-    def test_get_prompt_includes_code_example_guidance(self):
-        """get_prompt includes guidance for code_example field."""
-        extractor = PatternExtractor()
-        prompt = extractor.get_prompt()
-        assert "code" in prompt.lower()
-        assert "example" in prompt.lower()
-
-    def test_get_prompt_includes_trade_offs_guidance(self):
-        """get_prompt includes guidance for trade_offs field."""
+    def test_get_prompt_is_cached(self):
+        """get_prompt loads the prompt files once and reuses the result."""
         extractor = PatternExtractor()
-        prompt = extractor.get_prompt()
-        assert "trade" in prompt.lower()
+        with patch.object(
+            extractor, "_load_full_prompt", wraps=extractor._load_full_prompt
+        ) as load:
+            first = extractor.get_prompt()
+            second = extractor.get_prompt()
+
+        assert first is second
+        load.assert_called_once_with("pattern")
+
+    def test_get_prompt_contains_pattern_instructions(self, prompt_lower):
+        """get_prompt contains base, pattern, code_example and trade_offs guidance."""
+        for token in (
+            "knowledge extraction assistant",  # base instructions
+            "pattern",
+            "problem",
+            "solution",
+            "code",
+            "example",
+            "trade",
+        ):
+            assert token in prompt_lower
 
 
 class TestPatternModel:
@@ -107,11 +147,7 @@ class TestPatternModel:
     def test_pattern_optional_fields(self):
         """Pattern allows optional code_example, context, trade_offs."""
         pattern = Pattern(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            name="Test Pattern",
-            problem="Test problem",
-            solution="Test solution",
+            **_PATTERN_BASE,
             code_example="def example(): pass",
             context="Test context",
             trade_offs=["Pro 1", "Con 1"],
@@ -129,27 +165,15 @@ class TestPatternModel:
         return cached.response
     return None"""
 
-        pattern = Pattern(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            name="Semantic Cache",
-            problem="Cost",
-            solution="Cache",
-            code_example=code,
-        )
+        pattern = Pattern(**_PATTERN_BASE, code_example=code)
         assert "\n" in pattern.code_example
         assert "def semantic_cache" in pattern.code_example
         assert "    embedding" in pattern.code_example  # Indentation preserved
 
     def test_pattern_has_source_attribution(self):
         """Pattern includes source attribution fields."""
-        pattern = Pattern(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            name="Test",
-            problem="Test",
-            solution="Test",
-        )
+        # Only field presence is checked, so skip validation
+        pattern = Pattern.model_construct(**_PATTERN_BASE)
         assert hasattr(pattern, "source_id")
         assert hasattr(pattern, "chunk_id")
         assert hasattr(pattern, "topics")
@@ -157,23 +181,15 @@ class TestPatternModel:
 
     def test_pattern_confidence_bounds(self):
         """Pattern confidence must be between 0.0 and 1.0."""
-        pattern = Pattern(
-            source_id="src-123",
-            chunk_id="chunk-456",
-            name="Test",
-            problem="Test",
-            solution="Test",
-            confidence=0.85,
-        )
+        pattern = Pattern(**_PATTERN_BASE, confidence=0.85)
         assert 0.0 <= pattern.confidence <= 1.0
 
 
 class TestTopicAutoTagging:
     """Test topic auto-tagging for patterns."""
 
-    def test_generates_topics_from_content(self):
+    def test_generates_topics_from_content(self, extractor):
         """Topics are generated from pattern content."""
-        extractor = PatternExtractor()
         topics = extractor._generate_topics(
             "This pattern uses embedding similarity for semantic caching in RAG systems"
         )
@@ -181,9 +197,8 @@ class TestTopicAutoTagging:
         # Should detect rag, embeddings, or caching
         assert len(topics) > 0
 
-    def test_auto_tag_topics_method(self):
+    def test_auto_tag_topics_method(self, extractor):
         """auto_tag_topics extracts topics from Pattern model."""
-        extractor = PatternExtractor()
         pattern = Pattern(
             source_id="src-123",
             chunk_id="chunk-456",
@@ -199,36 +214,73 @@ class TestTopicAutoTagging:
         # Should detect rag, embeddings, or llm from content
         assert any(t in topics for t in ["rag", "embeddings", "llm"])
 
-    def test_generates_topics_for_rag(self):
-        """Topics detect RAG-related content."""
-        extractor = PatternExtractor()
-        topics = extractor._generate_topics("Build a RAG pipeline with retrieval")
-        assert "rag" in topics
-
-    def test_generates_topics_for_embeddings(self):
-        """Topics detect embedding-related content."""
-        extractor = PatternExtractor()
-        topics = extractor._generate_topics("Use vector embeddings for search")
-        assert "embeddings" in topics
-
-    def test_generates_topics_for_llm(self):
-        """Topics detect LLM-related content."""
-        extractor = PatternExtractor()
-        topics = extractor._generate_topics("This LLM approach uses Claude")
-        assert "llm" in topics
-
-    def test_limits_topics_to_five(self):
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Build a RAG pipeline with retrieval", "rag"),
+            ("Use vector embeddings for search", "embeddings"),
+            ("This LLM approach uses Claude", "llm"),
+        ],
+        ids=["rag", "embeddings", "llm"],
+    )
+    def test_generates_topics(self, extractor, text, expected):
+        """Topics detect RAG, embedding and LLM content."""
+        assert expected in extractor._generate_topics(text)
+
+    def test_limits_topics_to_five(self, extractor):
         """Topic generation limits to 5 topics max."""
-        extractor = PatternExtractor()
         topics = extractor._generate_topics(
             "RAG embedding fine-tuning LLM prompting evaluation deployment training inference agents"
         )
         assert len(topics) <= 5
 
 
+def _check_results_list(results):
+    assert isinstance(results, list)
+    assert len(results) > 0
+    assert all(isinstance(r, ExtractionResult) for r in results)
+
+
+def _check_source_attribution(results):
+    assert results[0].success is True
+    pattern = results[0].extraction
+    assert pattern.source_id == "source-456"
+    assert pattern.chunk_id == "chunk-123"
+
+
+def _check_schema_version(results):
+    assert results[0].extraction.schema_version == "1.1.0"
+
+
+def _check_empty(results):
+    assert results == []
+
+
+def _check_parse_error(results):
+    assert len(results) == 1
+    assert results[0].success is False
+    assert results[0].error_kind is ExtractionErrorKind.PARSE_ERROR
+    assert "parse" in results[0].error.lower()
+
+
+def _check_validation_error(results):
+    assert len(results) == 1
+    assert results[0].success is False
+    assert results[0].error_kind is ExtractionErrorKind.VALIDATION_ERROR
+
+
+def _check_llm_error(results):
+    assert len(results) == 1
+    assert results[0].success is False
+    assert results[0].error_kind is ExtractionErrorKind.LLM_ERROR
+    assert "Extraction failed" in results[0].error
+
+
 class TestPatternExtractorExtract:
     """Test PatternExtractor.extract method."""
 
+    pytestmark = pytest.mark.asyncio(loop_scope="module")
+
     @pytest.fixture
     def sample_chunk_content(self) -> str:
         """Sample chunk containing a pattern."""
@@ -239,287 +291,123 @@ class TestPatternExtractorExtract:
         reduce costs by 40-60% but adds latency for cache lookups.
         """
 
-    @pytest.fixture
-    def mock_llm_response(self) -> str:
-        """Mock LLM response with valid pattern JSON."""
-        return """
+    @pytest.mark.parametrize(
+        ("response", "side_effect", "check"),
         [
-            {
-                "name": "Semantic Caching",
-                "problem": "High API costs from repeated similar queries to LLM endpoints",
-                "solution": "Cache responses using embedding similarity instead of exact match. Compare query embeddings to find cached responses.",
-                "code_example": null,
-                "context": "High-traffic LLM applications",
-                "trade_offs": [
-                    "Pro: 40-60% cost reduction",
-                    "Con: Added latency for cache lookups"
-                ],
-                "confidence": 0.9
-            }
-        ]
-        """
-
-    @pytest.mark.asyncio
-    async def test_extract_with_valid_chunk(
-        self, sample_chunk_content, mock_llm_response
+            pytest.param(PATTERN_RESPONSE, None, _check_results_list, id="valid_chunk"),
+            pytest.param(
+                PATTERN_RESPONSE, None, _check_source_attribution, id="source_attribution"
+            ),
+            pytest.param(PATTERN_RESPONSE, None, _check_schema_version, id="schema_version"),
+            pytest.param("[]", None, _check_empty, id="no_patterns"),
+            pytest.param("This is not valid JSON", None, _check_parse_error, id="parse_error"),
+            # Missing required 'name' field
+            pytest.param(
+                '[{"problem": "test", "solution": "test"}]',
+                None,
+                _check_validation_error,
+                id="validation_error",
+            ),
+            pytest.param(
+                None, LLMClientError("API_ERROR", "API error"), _check_llm_error, id="llm_error"
+            ),
+            pytest.param(
+                None,
+                ExtractionParseError("pattern", "bad JSON"),
+                _check_parse_error,
+                id="parse_error_during_llm_call",
+            ),
+        ],
+    )
+    async def test_extract(
+        self, patched_extractor, sample_chunk_content, response, side_effect, check
     ):
-        """extract returns ExtractionResult list for valid chunk."""
-        extractor = PatternExtractor()
+        """extract maps each LLM outcome to the expected results."""
+        patched_extractor.llm_client.extract.return_value = response
+        patched_extractor.llm_client.extract.side_effect = side_effect
 
-        with patch.object(
-            extractor, "_llm_client", new_callable=AsyncMock
-        ) as mock_client:
-            mock_client.extract.return_value = mock_llm_response
-
-            results = await extractor.extract(
-                content=sample_chunk_content,
-                source_id="source-456",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-123",
-                chunk_ids=["chunk-123"],
-            )
-
-            assert isinstance(results, list)
-            assert len(results) > 0
-            assert all(isinstance(r, ExtractionResult) for r in results)
-
-    @pytest.mark.asyncio
-    async def test_extract_preserves_source_attribution(
-        self, sample_chunk_content, mock_llm_response
-    ):
-        """extract preserves source_id and chunk_id."""
-        extractor = PatternExtractor()
+        results = await patched_extractor.extract(
+            content=sample_chunk_content,
+            source_id="source-456",
+            context_level=ExtractionLevel.CHUNK,
+            context_id="chunk-123",
+            chunk_ids=["chunk-123"],
+        )
 
-        with patch.object(
-            extractor, "_llm_client", new_callable=AsyncMock
-        ) as mock_client:
-            mock_client.extract.return_value = mock_llm_response
-
-            results = await extractor.extract(
-                content=sample_chunk_content,
-                source_id="source-456",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-123",
-                chunk_ids=["chunk-123"],
-            )
-
-            assert results[0].success is True
-            pattern = results[0].extraction
-            assert pattern.source_id == "source-456"
-            assert pattern.chunk_id == "chunk-123"
-
-    @pytest.mark.asyncio
-    async def test_extract_sets_schema_version(
-        self, sample_chunk_content, mock_llm_response
-    ):
-        """extract sets schema_version on extraction."""
-        extractor = PatternExtractor()
+        check(results)
 
-        with patch.object(
-            extractor, "_llm_client", new_callable=AsyncMock
-        ) as mock_client:
-            mock_client.extract.return_value = mock_llm_response
-
-            results = await extractor.extract(
-                content=sample_chunk_content,
-                source_id="source-456",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-123",
-                chunk_ids=["chunk-123"],
-            )
-
-            assert results[0].extraction.schema_version == "1.1.0"
-
-    @pytest.mark.asyncio
-    async def test_extract_auto_tags_topics(
-        self, sample_chunk_content, mock_llm_response
-    ):
+    async def test_extract_auto_tags_topics(self, sample_chunk_content):
         """extract auto-tags topics when enabled."""
-        config = ExtractorConfig(auto_tag_topics=True)
-        extractor = PatternExtractor(config=config)
-
-        with patch.object(
-            extractor, "_llm_client", new_callable=AsyncMock
-        ) as mock_client:
-            mock_client.extract.return_value = mock_llm_response
-
-            results = await extractor.extract(
-                content=sample_chunk_content,
-                source_id="source-456",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-123",
-                chunk_ids=["chunk-123"],
-            )
-
-            pattern = results[0].extraction
-            assert isinstance(pattern.topics, list)
-
-    @pytest.mark.asyncio
-    async def test_extract_returns_empty_list_for_no_patterns(self):
-        """extract returns empty list when no patterns found."""
-        extractor = PatternExtractor()
-        no_pattern_response = "[]"
-
-        with patch.object(
-            extractor, "_llm_client", new_callable=AsyncMock
-        ) as mock_client:
-            mock_client.extract.return_value = no_pattern_response
-
-            results = await extractor.extract(
-                content="The sky is blue.",
-                source_id="source-456",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-123",
-                chunk_ids=["chunk-123"],
-            )
-
-            assert results == []
-
-    @pytest.mark.asyncio
-    async def test_extract_handles_parse_error(self):
-        """extract returns error result for unparseable response."""
-        extractor = PatternExtractor()
-
-        with patch.object(
-            extractor, "_llm_client", new_callable=AsyncMock
-        ) as mock_client:
-            mock_client.extract.return_value = "This is not valid JSON"
-
-            results = await extractor.extract(
-                content="Some content",
-                source_id="source-456",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-123",
-                chunk_ids=["chunk-123"],
-            )
-
-            assert len(results) == 1
-            assert results[0].success is False
-            assert "parse" in results[0].error.lower()
-
-    @pytest.mark.asyncio
-    async def test_extract_handles_validation_error(self):
-        """extract returns error result for invalid schema."""
-        extractor = PatternExtractor()
-        # Missing required 'name' field
-        invalid_response = '[{"problem": "test", "solution": "test"}]'
-
-        with patch.object(
-            extractor, "_llm_client", new_callable=AsyncMock
-        ) as mock_client:
-            mock_client.extract.return_value = invalid_response
-
-            results = await extractor.extract(
-                content="Some content",
-                source_id="source-456",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-123",
-                chunk_ids=["chunk-123"],
-            )
-
-            assert len(results) == 1
-            assert results[0].success is False
-
-    @pytest.mark.asyncio
-    async def test_extract_handles_llm_error(self):
-        """extract returns error result when LLM call fails."""
-        extractor = PatternExtractor()
-
-        with patch.object(
-            extractor, "_llm_client", new_callable=AsyncMock
-        ) as mock_client:
-            mock_client.extract.side_effect = Exception("API error")
+        extractor = PatternExtractor(
+            llm_client=AsyncMock(), config=ExtractorConfig(auto_tag_topics=True)
+        )
+        extractor.llm_client.extract.return_value = PATTERN_RESPONSE
 
-            results = await extractor.extract(
-                content="Some content",
-                source_id="source-456",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-123",
-                chunk_ids=["chunk-123"],
-            )
+        results = await extractor.extract(
+            content=sample_chunk_content,
+            source_id="source-456",
+            context_level=ExtractionLevel.CHUNK,
+            context_id="chunk-123",
+            chunk_ids=["chunk-123"],
+        )
 
-            assert len(results) == 1
-            assert results[0].success is False
-            assert "Extraction failed" in results[0].error
+        topics = results[0].extraction.topics
+        assert isinstance(topics, list)
+        assert "llm" in topics
 
 
 class TestPatternExtractorWithCodeExample:
     """Test PatternExtractor with code examples."""
 
-    @pytest.fixture
-    def mock_response_with_code(self) -> str:
-        """Mock LLM response with code example."""
-        return """
-        [
-            {
-                "name": "Retry with Backoff",
-                "problem": "API calls fail intermittently due to rate limits or network issues",
-                "solution": "Implement exponential backoff retry logic to handle transient failures gracefully",
-                "code_example": "from tenacity import retry, stop_after_attempt, wait_exponential\\n\\n@retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))\\ndef call_api():\\n    return requests.get(url)",
-                "context": "External API integrations with unreliable networks",
-                "trade_offs": [
-                    "Pro: Handles transient failures automatically",
-                    "Con: Increases overall request latency"
-                ],
-                "confidence": 0.95
-            }
-        ]
-        """
+    pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-    @pytest.mark.asyncio
-    async def test_extract_with_code_example(self, mock_response_with_code):
+    async def test_extract_with_code_example(
+        self, patched_extractor, pattern_response_with_code
+    ):
         """extract captures code_example field."""
-        extractor = PatternExtractor()
+        patched_extractor.llm_client.extract.return_value = pattern_response_with_code
 
-        with patch.object(
-            extractor, "_llm_client", new_callable=AsyncMock
-        ) as mock_client:
-            mock_client.extract.return_value = mock_response_with_code
-
-            results = await extractor.extract(
-                content="Implement retry logic with backoff",
-                source_id="source-456",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-123",
-                chunk_ids=["chunk-123"],
-            )
-
-            pattern = results[0].extraction
-            assert pattern.code_example is not None
-            assert "@retry" in pattern.code_example
-            assert "tenacity" in pattern.code_example
-
-    @pytest.mark.asyncio
-    async def test_extract_preserves_code_formatting(self, mock_response_with_code):
-        """extract preserves code_example newlines and formatting."""
-        extractor = PatternExtractor()
+        results = await patched_extractor.extract(
+            content="Implement retry logic with backoff",
+            source_id="source-456",
+            context_level=ExtractionLevel.CHUNK,
+            context_id="chunk-123",
+            chunk_ids=["chunk-123"],
+        )
 
-        with patch.object(
-            extractor, "_llm_client", new_callable=AsyncMock
-        ) as mock_client:
-            mock_client.extract.return_value = mock_response_with_code
+        pattern = results[0].extraction
+        assert pattern.code_example is not None
+        assert "@retry" in pattern.code_example
+        assert "tenacity" in pattern.code_example
 
-            results = await extractor.extract(
-                content="Implement retry logic",
-                source_id="source-456",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-123",
-                chunk_ids=["chunk-123"],
-            )
+    async def test_extract_preserves_code_formatting(
+        self, patched_extractor, pattern_response_with_code
+    ):
+        """extract preserves code_example newlines and formatting."""
+        patched_extractor.llm_client.extract.return_value = pattern_response_with_code
 
-            pattern = results[0].extraction
-            # Newlines should be preserved (escaped in JSON, unescaped in string)
-            assert "\\n" in mock_response_with_code
-            assert pattern.code_example is not None
+        results = await patched_extractor.extract(
+            content="Implement retry logic",
+            source_id="source-456",
+            context_level=ExtractionLevel.CHUNK,
+            context_id="chunk-123",
+            chunk_ids=["chunk-123"],
+        )
+
+        pattern = results[0].extraction
+        # Newlines should be preserved (escaped in JSON, unescaped in string)
+        assert "\\n" in pattern_response_with_code
+        assert pattern.code_example is not None
+        assert "\n    return requests.get(url)" in pattern.code_example
 
 
 class TestPatternExtractorIntegration:
     """Integration tests for PatternExtractor (require LLM client mock)."""
 
-    @pytest.mark.asyncio
-    async def test_full_extraction_pipeline(self):
+    pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+    async def test_full_extraction_pipeline(self, patched_extractor, pattern_rag_response):
         """Test full extraction pipeline with mocked LLM."""
-        extractor = PatternExtractor()
         chunk_content = """
         When building RAG applications, implement semantic caching to reduce
         LLM API costs. Cache responses based on query embedding similarity
@@ -527,94 +415,47 @@ class TestPatternExtractorIntegration:
         by 40-60% for high-traffic applications, though it adds latency for
         computing embeddings and searching the cache.
         """
-        mock_response = """
-        [
-            {
-                "name": "Semantic Caching",
-                "problem": "High LLM API costs in production applications",
-                "solution": "Cache responses using embedding similarity. Compare query embeddings against cached entries to find semantically similar previous queries.",
-                "code_example": null,
-                "context": "RAG applications with high query volume",
-                "trade_offs": [
-                    "Pro: 40-60% cost reduction",
-                    "Con: Added latency for embedding computation"
-                ],
-                "confidence": 0.9
-            }
-        ]
-        """
 
-        with patch.object(
-            extractor, "_llm_client", new_callable=AsyncMock
-        ) as mock_client:
-            mock_client.extract.return_value = mock_response
-
-            results = await extractor.extract(
-                content=chunk_content,
-                source_id="book-ai-engineering",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-001",
-                chunk_ids=["chunk-001"],
-            )
-
-            # Verify successful extraction
-            assert len(results) == 1
-            assert results[0].success is True
-
-            pattern = results[0].extraction
-            assert pattern.name == "Semantic Caching"
-            assert "cost" in pattern.problem.lower()
-            assert "embedding" in pattern.solution.lower()
-            assert len(pattern.trade_offs) == 2
-            assert pattern.source_id == "book-ai-engineering"
-            assert pattern.chunk_id == "chunk-001"
-            assert pattern.type == ExtractionType.PATTERN
-
-    @pytest.mark.asyncio
-    async def test_multiple_patterns_extraction(self):
-        """Test extraction of multiple patterns from single chunk."""
-        extractor = PatternExtractor()
-        mock_response = """
-        [
-            {
-                "name": "Pattern One",
-                "problem": "Problem one",
-                "solution": "Solution one",
-                "code_example": null,
-                "context": "Context one",
-                "trade_offs": [],
-                "confidence": 0.8
-            },
-            {
-                "name": "Pattern Two",
-                "problem": "Problem two",
-                "solution": "Solution two",
-                "code_example": "print('hello')",
-                "context": "Context two",
-                "trade_offs": ["Pro: Fast"],
-                "confidence": 0.85
-            }
-        ]
-        """
+        patched_extractor.llm_client.extract.return_value = pattern_rag_response
 
-        with patch.object(
-            extractor, "_llm_client", new_callable=AsyncMock
-        ) as mock_client:
-            mock_client.extract.return_value = mock_response
+        results = await patched_extractor.extract(
+            content=chunk_content,
+            source_id="book-ai-engineering",
+            context_level=ExtractionLevel.CHUNK,
+            context_id="chunk-001",
+            chunk_ids=["chunk-001"],
+        )
+
+        # Verify successful extraction
+        assert len(results) == 1
+        assert results[0].success is True
 
-            results = await extractor.extract(
-                content="Multiple patterns in text",
-                source_id="source-001",
-                context_level=ExtractionLevel.CHUNK,
-                context_id="chunk-001",
-                chunk_ids=["chunk-001"],
-            )
+        pattern = results[0].extraction
+        assert pattern.name == "Semantic Caching"
+        assert "cost" in pattern.problem.lower()
+        assert "embedding" in pattern.solution.lower()
+        assert len(pattern.trade_offs) == 2
+        assert pattern.source_id == "book-ai-engineering"
+        assert pattern.chunk_id == "chunk-001"
+        assert pattern.type == ExtractionType.PATTERN
 
-            assert len(results) == 2
-            assert all(r.success for r in results)
-            assert results[0].extraction.name == "Pattern One"
-            assert results[1].extraction.name == "Pattern Two"
-            assert results[1].extraction.code_example == "print('hello')"
+    async def test_multiple_patterns_extraction(self, patched_extractor, pattern_pair_response):
+        """Test extraction of multiple patterns from single chunk."""
+        patched_extractor.llm_client.extract.return_value = pattern_pair_response
+
+        results = await patched_extractor.extract(
+            content="Multiple patterns in text",
+            source_id="source-001",
+            context_level=ExtractionLevel.CHUNK,
+            context_id="chunk-001",
+            chunk_ids=["chunk-001"],
+        )
+
+        assert len(results) == 2
+        assert all(r.success for r in results)
+        assert results[0].extraction.name == "Pattern One"
+        assert results[1].extraction.name == "Pattern Two"
+        assert results[1].extraction.code_example == "print('hello')"
 
 
 class TestPatternExtractorRegistration:
@@ -625,15 +466,12 @@ class TestPatternExtractorRegistration:
         # Registry should have PATTERN after importing pattern_extractor
         assert extractor_registry.is_supported(ExtractionType.PATTERN)
 
-    def test_extractor_retrieved_from_registry(self):
+    def test_extractor_retrieved_from_registry(self, global_pattern_extractor):
         """PatternExtractor can be retrieved from registry."""
-        extractor = extractor_registry.get_extractor(ExtractionType.PATTERN)
-        assert isinstance(extractor, PatternExtractor)
+        assert isinstance(global_pattern_extractor, PatternExtractor)
 
     def test_extractor_can_be_manually_registered(self):
         """PatternExtractor can be registered with fresh registry."""
-        from src.extractors import ExtractorRegistry
-
         registry = ExtractorRegistry()
         registry.register(ExtractionType.PATTERN, PatternExtractor)
 
@@ -665,7 +503,7 @@ class TestPatternExtractorDependencyInjection:
 
         assert isinstance(client, LLMClient)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_uses_injected_client_for_extraction(self):
         """PatternExtractor uses injected LLMClient for extraction."""
         mock_client = AsyncMock()
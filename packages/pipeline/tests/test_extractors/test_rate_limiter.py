@@ -0,0 +1,129 @@
+"""Tests for RateLimiter.
+
+Time is faked: monotonic() reads a counter that the patched asyncio.sleep
+advances, so no test actually waits.
+"""
+
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.extractors import RateLimiter
+from src.extractors.rate_limiter import RATE_WINDOW_SECONDS
+
+
+@pytest.fixture
+def clock():
+    """Fake monotonic clock advanced by asyncio.sleep."""
+    now = [1000.0]
+
+    async def sleep(seconds):
+        now[0] += seconds
+
+    with (
+        patch("src.extractors.rate_limiter.monotonic", side_effect=lambda: now[0]),
+        patch(
+            "src.extractors.rate_limiter.asyncio.sleep",
+            new_callable=AsyncMock,
+            side_effect=sleep,
+        ) as mock_sleep,
+    ):
+        yield SimpleNamespace(now=now, sleep=mock_sleep)
+
+
+class TestRateLimiterWindow:
+    """Test the sliding request/token window."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_within_limits_does_not_wait(self, clock):
+        """Requests under both budgets pass straight through."""
+        limiter = RateLimiter(requests_per_minute=3, tokens_per_minute=1000)
+
+        for _ in range(3):
+            await limiter.acquire(100)
+
+        clock.sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_when_requests_exhausted(self, clock):
+        """The next request waits for the oldest one to leave the window."""
+        limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=1000)
+
+        await limiter.acquire(1)
+        await limiter.acquire(1)
+        await limiter.acquire(1)
+
+        clock.sleep.assert_awaited_once_with(RATE_WINDOW_SECONDS)
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits_when_tokens_exhausted(self, clock):
+        """A request that would overflow the token budget waits."""
+        limiter = RateLimiter(requests_per_minute=50, tokens_per_minute=1000)
+
+        await limiter.acquire(800)
+        await limiter.acquire(300)
+
+        clock.sleep.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_passes_on_empty_window(self, clock):
+        """A request larger than the whole budget is not blocked forever."""
+        limiter = RateLimiter(tokens_per_minute=1000)
+
+        await limiter.acquire(5000)
+
+        clock.sleep.assert_not_called()
+
+
+class TestRateLimiterHeaders:
+    """Test cooldown and AIMD updates from response headers."""
+
+    @pytest.mark.asyncio
+    async def test_retry_after_holds_next_acquire(self, clock):
+        """retry-after delays the next acquire by that many seconds."""
+        limiter = RateLimiter()
+
+        limiter.update_from_headers({"retry-after": "30"})
+        await limiter.acquire(1)
+
+        clock.sleep.assert_awaited_once_with(30.0)
+
+    def test_exhausted_requests_wait_for_reset(self, clock):
+        """Zero remaining requests sets a cooldown until the reset time."""
+        limiter = RateLimiter()
+        reset = datetime.now(UTC) + timedelta(seconds=20)
+
+        limiter.update_from_headers(
+            {
+                "anthropic-ratelimit-requests-remaining": "0",
+                "anthropic-ratelimit-requests-reset": reset.isoformat(),
+            }
+        )
+
+        assert 0 < limiter._cooldown_until - clock.now[0] <= 20
+
+    def test_throttle_halves_then_success_regrows_budget(self, clock):
+        """Budget decreases multiplicatively and increases additively."""
+        limiter = RateLimiter(requests_per_minute=50)
+
+        limiter.update_from_headers({"retry-after": "1"})
+        assert limiter.current_requests_per_minute == 25
+
+        limiter.record_success()
+        assert limiter.current_requests_per_minute == 26
+
+    def test_remaining_quota_leaves_limits_unchanged(self, clock):
+        """Headers with quota left do not throttle."""
+        limiter = RateLimiter(requests_per_minute=50)
+
+        limiter.update_from_headers(
+            {
+                "anthropic-ratelimit-requests-remaining": "10",
+                "anthropic-ratelimit-tokens-remaining": "5000",
+            }
+        )
+
+        assert limiter.current_requests_per_minute == 50
+        assert limiter._cooldown_until == 0.0